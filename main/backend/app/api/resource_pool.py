@@ -367,6 +367,9 @@ class DiscoverSiteEntriesPayload(BaseModel):
     domain: str | None = Field(default=None)
     limit_domains: int = Field(default=50, ge=1, le=500)
     probe_timeout: float = Field(default=8.0, ge=1.0, le=60.0)
+    total_deadline_s: float | None = Field(
+        default=None, ge=1.0, le=3600.0, description="Optional wall-clock budget per discovery run (per batch when async_mode=true)"
+    )
     include_link_alternate: bool = Field(default=True)
     sitemap_paths: list[str] | None = Field(default=None, description="Optional override paths for sitemap probing")
     rss_paths: list[str] | None = Field(default=None, description="Optional override paths for rss probing")
@@ -400,6 +403,7 @@ def discover_site_entries_api(payload: DiscoverSiteEntriesPayload):
         target_scope = payload.target_scope or policy.get("target_scope") or "project"
         limit_domains = payload.limit_domains if payload.limit_domains is not None else int(policy.get("limit_domains") or 50)
         probe_timeout = payload.probe_timeout if payload.probe_timeout is not None else float(policy.get("probe_timeout") or 8.0)
+        total_deadline_s = payload.total_deadline_s if payload.total_deadline_s is not None else policy.get("total_deadline_s")
         include_link_alternate = (
             payload.include_link_alternate
             if payload.include_link_alternate is not None
@@ -420,6 +424,7 @@ def discover_site_entries_api(payload: DiscoverSiteEntriesPayload):
                 domain=payload.domain,
                 limit_domains=limit_domains,
                 probe_timeout=probe_timeout,
+                total_deadline_s=total_deadline_s,
                 include_link_alternate=include_link_alternate,
                 sitemap_paths=sitemap_paths,
                 rss_paths=rss_paths,
@@ -458,6 +463,7 @@ def discover_site_entries_api(payload: DiscoverSiteEntriesPayload):
             domain=payload.domain,
             limit_domains=limit_domains,
             probe_timeout=probe_timeout,
+            total_deadline_s=total_deadline_s,
             include_link_alternate=include_link_alternate,
             sitemap_paths=sitemap_paths,
             rss_paths=rss_paths,
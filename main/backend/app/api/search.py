@@ -46,4 +46,5 @@ def search(
 def init_search_indices():
     """Create ES indices if not present (idempotent)."""
     es = get_es_client()
-    return ok(ensure_indices(es))
+    # Explicit admin call: always check the cluster, bypassing the per-client memo.
+    return ok(ensure_indices(es, force=True))
@@ -15,6 +15,7 @@ from ..services.projects import bind_project, current_project_key
 from ..services.resource_pool import get_site_entry_by_url, list_site_entries
 from ..services.resource_pool.url_utils import normalize_url
 from ..services.source_library import (
+    bump_source_library_revision,
     list_channels_grouped_by_provider,
     list_effective_channels,
     list_effective_items,
@@ -368,6 +369,7 @@ def upsert_project_item(payload: SourceLibraryItemUpsertPayload, project_key: st
                 row.enabled = payload.enabled
                 row.extra = payload.extra
                 session.commit()
+        bump_source_library_revision()
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -399,6 +401,7 @@ def refresh_item(item_key: str, payload: RefreshItemPayload) -> dict:
                     project_key=project_key,
                 )
                 session.commit()
+                bump_source_library_revision()
                 return ok({"ok": True, "project_key": project_key, **result})
     except HTTPException:
         raise
@@ -496,6 +499,7 @@ def sync_handler_clusters(payload: SyncHandlerClustersPayload) -> dict:
                         }
                     )
                 session.commit()
+        bump_source_library_revision()
 
         return ok(
             {
@@ -13,6 +13,7 @@ from ..crawlers.scrapyd_runtime import ensure_scrapyd_ready
 from ...models.base import SessionLocal
 from ...models.entities import IngestChannel, SourceLibraryItem
 from ..projects import bind_project
+from ..source_library.resolver import bump_source_library_revision
 
 
 def _as_dict(value: Any) -> dict[str, Any]:
@@ -263,6 +264,7 @@ def register_or_update_source_library_scrapy_binding(
             }
 
             session.commit()
+    bump_source_library_revision()
 
     return {
         "project_key": project_value,
@@ -316,6 +318,7 @@ def apply_source_library_native_rollback(
                     session.add(item_row)
 
             session.commit()
+    bump_source_library_revision()
     return {
         "project_key": project_value,
         "channel_key": channel_value,
@@ -10,6 +10,9 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# One pooled client serves the concurrent per-keyword search fan-out; keep-alive spans consecutive searches.
+_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=30.0)
+
 
 class HttpClient:
     def __init__(
@@ -22,6 +25,7 @@ class HttpClient:
         self.max_retries = max_retries
         self._client = httpx.Client(
             timeout=timeout,
+            limits=_POOL_LIMITS,
             proxies=self._build_proxies(),
             headers={
                 "User-Agent": (
@@ -60,7 +64,8 @@ class HttpClient:
                 logger.warning(
                     "http.get_json failed url=%s attempt=%d err=%s", url, attempt, exc
                 )
-                time.sleep(min(2 ** attempt, 3))
+                if attempt < self.max_retries:
+                    time.sleep(min(2 ** attempt, 3))
         raise last_exc  # type: ignore[misc]
 
     def post_json(
@@ -82,7 +87,8 @@ class HttpClient:
                 logger.warning(
                     "http.post_json failed url=%s attempt=%d err=%s", url, attempt, exc
                 )
-                time.sleep(min(2 ** attempt, 3))
+                if attempt < self.max_retries:
+                    time.sleep(min(2 ** attempt, 3))
         raise last_exc  # type: ignore[misc]
 
     def get_text(
@@ -103,7 +109,8 @@ class HttpClient:
                 logger.warning(
                     "http.get_text failed url=%s attempt=%d err=%s", url, attempt, exc
                 )
-                time.sleep(min(2 ** attempt, 3))
+                if attempt < self.max_retries:
+                    time.sleep(min(2 ** attempt, 3))
         raise last_exc  # type: ignore[misc]
 
 
@@ -5,7 +5,7 @@ from typing import Iterable, List, Sequence
 from urllib.parse import urlparse
 
 from elasticsearch import Elasticsearch
-from elasticsearch.helpers import bulk
+from elasticsearch.helpers import parallel_bulk
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from ...models.base import SessionLocal
@@ -21,6 +21,8 @@ _CHUNK_SIZE = 800
 _CHUNK_OVERLAP = 120
 _EMBEDDING_OBJECT_TYPE = "policy_chunk"
 _ES_INDEX = "policy_docs_es"
+_BULK_CHUNK_SIZE = 500
+_BULK_THREAD_COUNT = 4
 _VECTOR_VERSION = "v1"
 _REQUIRED_VECTOR_FIELDS = (
     "project_key",
@@ -201,6 +203,7 @@ def index_policy_documents(document_ids: Sequence[int] | None = None, state: str
                         "title": chunk.document.title,
                         "summary": chunk.document.summary,
                         "text": chunk.text,
+                        "embedding": vector,
                     }
                 )
 
@@ -211,19 +214,38 @@ def index_policy_documents(document_ids: Sequence[int] | None = None, state: str
             raise
 
         if es_actions:
-            bulk(es, es_actions)
+            bulk_index_policy_docs(es, es_actions)
 
         result = {"indexed": len(es_actions), "documents": len({chunk.document.id for chunk in chunks})}
         complete_job(job_id, result=result)
         return result
 
 
-def _delete_existing_es_docs(es: Elasticsearch, document_ids: Iterable[int]) -> None:
-    for doc_id in document_ids:
-        es.delete_by_query(
-            index=_ES_INDEX,
-            body={"query": {"term": {"document_id": doc_id}}},
-            ignore=[404],
-            refresh=True,
-        )
+def bulk_index_policy_docs(es: Elasticsearch, actions: Iterable[dict]) -> int:
+    """Index actions with parallel bulk requests, refreshing the index once at the end."""
+    indexed = 0
+    for ok, _ in parallel_bulk(
+        es,
+        actions,
+        thread_count=_BULK_THREAD_COUNT,
+        chunk_size=_BULK_CHUNK_SIZE,
+        queue_size=_BULK_THREAD_COUNT,
+        refresh=False,
+    ):
+        if ok:
+            indexed += 1
+    es.indices.refresh(index=_ES_INDEX)
+    return indexed
 
+
+def _delete_existing_es_docs(es: Elasticsearch, document_ids: Iterable[int]) -> None:
+    ids = list(document_ids)
+    if not ids:
+        return
+    # One delete-by-query for the whole batch; the refresh after bulk indexing makes it visible.
+    es.delete_by_query(
+        index=_ES_INDEX,
+        body={"query": {"terms": {"document_id": ids}}},
+        ignore=[404],
+        refresh=False,
+    )
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import random
 import time
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any, Mapping
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
 from selectolax.parser import HTMLParser
 
 
@@ -20,14 +23,36 @@ DEFAULT_HEADERS: Mapping[str, str] = {
 }
 DEFAULT_TIMEOUT = 30.0
 
+
+class _NoStoreCookiePolicy(DefaultCookiePolicy):
+    """Never keep response cookies, so the shared session carries no state between callers."""
+
+    def set_ok(self, cookie, request) -> bool:  # noqa: ANN001
+        return False
+
+
+# Shared keep-alive pool for fetches without a caller-owned session; headers and cookies go per request.
 _SESSION = requests.Session()
-_SESSION.headers.update(DEFAULT_HEADERS)
+_SESSION.cookies = RequestsCookieJar(policy=_NoStoreCookiePolicy())
+_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=64))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64))
 
 
 class HttpFetchError(RuntimeError):
     """Raised when HTTP fetching fails after retries."""
 
 
+def make_pooled_session(pool_size: int = 10) -> requests.Session:
+    """Create a keep-alive session whose per-host connection pool fits `pool_size` concurrent requests."""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+
 def fetch_html(
     url: str,
     *,
@@ -37,10 +62,59 @@ def fetch_html(
     timeout: float = DEFAULT_TIMEOUT,
     retries: int = 3,
     backoff: float = 1.5,
+    session: requests.Session | None = None,
 ) -> tuple[str, Response]:
-    """Fetch HTML content with light retry/backoff handling."""
+    """Fetch HTML content with light retry/backoff handling.
+
+    Without a caller-owned `session` (see make_pooled_session) the request goes through the
+    module-wide keep-alive pool, which never stores cookies between calls.
+    """
+
+    response = _fetch_response(
+        url,
+        headers=headers,
+        params=params,
+        cookies=cookies,
+        timeout=timeout,
+        retries=retries,
+        backoff=backoff,
+        session=session,
+    )
+    return response.text, response
+
+
+def fetch_bytes(
+    url: str,
+    *,
+    headers: Mapping[str, str] | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = 3,
+    backoff: float = 1.5,
+    session: requests.Session | None = None,
+) -> bytes:
+    """Like fetch_html, but return the raw body without decoding it to text (sitemaps, feeds, archives)."""
+
+    return _fetch_response(
+        url,
+        headers=headers,
+        timeout=timeout,
+        retries=retries,
+        backoff=backoff,
+        session=session,
+    ).content
+
 
-    session = _SESSION
+def _fetch_response(
+    url: str,
+    *,
+    headers: Mapping[str, str] | None = None,
+    params: Mapping[str, Any] | None = None,
+    cookies: Mapping[str, str] | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = 3,
+    backoff: float = 1.5,
+    session: requests.Session | None = None,
+) -> Response:
     last_exc: Exception | None = None
     
     # 合并headers：用户提供的headers优先
@@ -48,20 +122,18 @@ def fetch_html(
     if headers:
         request_headers.update(headers)
     
-    # 对于Reddit API，清除可能存在的cookies，避免被识别为机器人
-    # 创建临时session用于请求，避免污染全局session
-    temp_session = requests.Session()
-    temp_session.headers.update(request_headers)
-    if cookies:
-        temp_session.cookies.update(cookies)
+    # 对于Reddit API，共享session不保存任何响应cookies，避免请求之间互相污染、被识别为机器人
+    request_session = session if session is not None else _SESSION
+    request_kwargs: dict[str, Any] = {"headers": request_headers, "cookies": cookies}
     
     for attempt in range(max(retries, 1)):
         try:
-            response = temp_session.get(
+            response = request_session.get(
                 url,
                 params=params,
                 timeout=timeout,
                 allow_redirects=True,
+                **request_kwargs,
             )
         except requests.RequestException as exc:  # pragma: no cover - network issues
             last_exc = exc
@@ -77,7 +149,7 @@ def fetch_html(
                     response.raise_for_status()
                 except requests.HTTPError as exc:  # pragma: no cover - unlikely
                     raise HttpFetchError(str(exc)) from exc
-                return response.text, response
+                return response
 
         # Exponential backoff with jitter
         sleep_for = backoff ** attempt + random.uniform(0, 0.3)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from email.utils import parsedate_to_datetime
@@ -15,6 +16,9 @@ from .http_utils import fetch_html, make_html_parser
 
 logger = logging.getLogger(__name__)
 
+# 多关键词并发抓取的线程数上限
+_KEYWORD_FETCH_WORKERS = 8
+
 
 @dataclass
 class GoogleNewsItem:
@@ -74,20 +78,32 @@ class GoogleNewsAdapter:
         limit_per_keyword: int = 20,
     ) -> Iterable[GoogleNewsItem]:
         """
-        搜索多个关键词
+        搜索多个关键词（并发抓取，哪个关键词先完成就先产出其结果）
         
         Args:
             keywords: 关键词列表
             limit_per_keyword: 每个关键词的结果数量限制
         """
-        for keyword in keywords:
+        def _search(keyword: str) -> List[GoogleNewsItem]:
             try:
-                for item in self.search(keyword, limit_per_keyword):
-                    yield item
+                return list(self.search(keyword, limit_per_keyword))
             except Exception as exc:
                 logger.warning("Failed to search keyword '%s': %s", keyword, exc)
-                continue
-        return
+                return []
+
+        if len(keywords) <= 1:
+            for keyword in keywords:
+                yield from _search(keyword)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(_KEYWORD_FETCH_WORKERS, len(keywords)), thread_name_prefix="gnews-kw")
+        try:
+            futures = [executor.submit(_search, keyword) for keyword in keywords]
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            # 调用方提前停止迭代时，取消尚未开始的关键词请求
+            executor.shutdown(wait=False, cancel_futures=True)
     
     def _parse_google_news_html(self, html: str, keyword: str) -> Iterable[GoogleNewsItem]:
         """解析Google News HTML页面"""
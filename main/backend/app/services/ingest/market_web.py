@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from ..job_logger import start_job, complete_job, fail_job
@@ -23,6 +25,8 @@ from .url_pool import _extract_text_from_html
 logger = logging.getLogger(__name__)
 BATCH_COMMIT_SIZE = 100
 _EXTRACTION_APP = ExtractionApplicationService()
+# Article bodies of new search results are fetched concurrently before the insert loop.
+_CONTENT_FETCH_WORKERS = 8
 
 
 def _get_or_create_source(session: Session, name: str, kind: str, base_url: str) -> Source:
@@ -39,6 +43,23 @@ def _get_or_create_source(session: Session, name: str, kind: str, base_url: str)
     return source
 
 
+def _fetch_content(link: str) -> Optional[str]:
+    try:
+        html, _ = fetch_html(link, timeout=8.0, retries=1)
+    except Exception:
+        return None
+    return (_extract_text_from_html(html) or "").strip() or None
+
+
+def _prefetch_contents(links: List[str]) -> Dict[str, Optional[str]]:
+    if not links:
+        return {}
+    with ThreadPoolExecutor(
+        max_workers=min(_CONTENT_FETCH_WORKERS, len(links)), thread_name_prefix="market-fetch"
+    ) as executor:
+        return dict(zip(links, executor.map(_fetch_content, links)))
+
+
 def collect_market_info(
     keywords: List[str],
     limit: int = 20,
@@ -75,28 +96,30 @@ def collect_market_info(
             source = _get_or_create_source(session, "Search API Market", "search", "search")
             source_id = source.id
 
+            candidate_links = list(dict.fromkeys(
+                link for link in ((item.get("link") or "").strip() for item in results) if link
+            ))
+            existing_links = (
+                set(session.scalars(select(Document.uri).where(Document.uri.in_(candidate_links))))
+                if candidate_links
+                else set()
+            )
+            contents = _prefetch_contents([link for link in candidate_links if link not in existing_links])
+
             for item in results:
                 link = (item.get("link") or "").strip()
                 if not link:
                     continue
                 links.append(link)
 
-                existed = session.query(Document).filter(Document.uri == link).first()
-                if existed:
+                if link in existing_links:
                     skipped += 1
                     continue
 
                 title = item.get("title") or ""
                 snippet = item.get("snippet") or ""
-                content = None
-                try:
-                    # Disable snippet-only quick-save: try fetching正文 before入库.
-                    html, _ = fetch_html(link, timeout=8.0, retries=1)
-                    text = (_extract_text_from_html(html) or "").strip()
-                    if text:
-                        content = text
-                except Exception:
-                    content = None
+                # Disable snippet-only quick-save: 正文已在入库前并发抓取.
+                content = contents.get(link)
 
                 extracted_data = {
                     "platform": item.get("source") or provider,
@@ -159,6 +182,7 @@ def collect_market_info(
                     extracted_data=extracted_data,
                 )
                 session.add(document)
+                existing_links.add(link)
                 inserted += 1
                 pending_inserts += 1
                 if pending_inserts >= BATCH_COMMIT_SIZE:
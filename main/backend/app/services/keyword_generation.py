@@ -14,7 +14,7 @@ from ..settings.config import settings
 
 logger = logging.getLogger(__name__)
 
-_BILINGUAL_LANG_MODES = {"bi", "bilingual", "zh-en", "zh_en", "both", "multi", "multilingual"}
+_BILINGUAL_LANG_MODES = frozenset({"bi", "bilingual", "zh-en", "zh_en", "both", "multi", "multilingual"})
 
 
 def _is_bilingual_mode(language: str | None) -> bool:
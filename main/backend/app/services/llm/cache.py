@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
 from pathlib import Path
+from typing import Optional
 
 from langchain.cache import SQLiteCache
 from langchain.globals import set_llm_cache
@@ -9,6 +15,16 @@ from ...settings.config import settings
 
 
 _CACHE_FILE = Path(__file__).resolve().parents[3] / "data" / "langchain-cache.db"
+# Small post-processed prompt outputs (e.g. search keywords) shared by all workers on this host.
+_PROMPT_CACHE_FILE = _CACHE_FILE.parent / "prompt-cache.db"
+
+logger = logging.getLogger(__name__)
+
+_prompt_cache_conn: Optional[sqlite3.Connection] = None
+_prompt_cache_lock = threading.Lock()
+# Rows older than this are deleted on write; the row cap bounds the file between expiries.
+_PROMPT_CACHE_RETENTION_S = 7 * 86400.0
+_PROMPT_CACHE_MAX_ROWS = 10000
 
 
 def setup_cache() -> None:
@@ -23,3 +39,55 @@ def setup_cache() -> None:
 setup_cache()
 
 
+def prompt_cache_key(*parts: object) -> str:
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _prompt_cache_connection() -> sqlite3.Connection:
+    global _prompt_cache_conn
+    if _prompt_cache_conn is None:
+        _PROMPT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(_PROMPT_CACHE_FILE), timeout=5.0, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS prompt_cache "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_prompt_cache_created_at ON prompt_cache (created_at)")
+        conn.commit()
+        _prompt_cache_conn = conn
+    return _prompt_cache_conn
+
+
+def get_cached_prompt_output(key: str, max_age_s: float) -> Optional[str]:
+    """Return a stored output younger than max_age_s, or None (also on any SQLite/filesystem error)."""
+    try:
+        with _prompt_cache_lock:
+            row = _prompt_cache_connection().execute(
+                "SELECT value FROM prompt_cache WHERE key = ? AND created_at > ?",
+                (key, time.time() - max_age_s),
+            ).fetchone()
+    except (sqlite3.Error, OSError):
+        logger.debug("prompt cache read failed", exc_info=True)
+        return None
+    return row[0] if row else None
+
+
+def store_prompt_output(key: str, value: str) -> None:
+    try:
+        with _prompt_cache_lock:
+            conn = _prompt_cache_connection()
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO prompt_cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, now),
+            )
+            conn.execute("DELETE FROM prompt_cache WHERE created_at <= ?", (now - _PROMPT_CACHE_RETENTION_S,))
+            conn.execute(
+                "DELETE FROM prompt_cache WHERE key IN "
+                "(SELECT key FROM prompt_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (_PROMPT_CACHE_MAX_ROWS,),
+            )
+            conn.commit()
+    except (sqlite3.Error, OSError):
+        logger.debug("prompt cache write failed", exc_info=True)
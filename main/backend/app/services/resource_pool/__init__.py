@@ -3,7 +3,7 @@
 from .append_adapter import DefaultResourcePoolAppendAdapter
 from .auto_classify import classify_site_entry, classify_site_entries_batch
 from .capture_config import get_capture_config, upsert_capture_config
-from .extract import append_url, extract_from_documents, extract_from_tasks
+from .extract import append_url, append_urls, extract_from_documents, extract_from_tasks
 from .resolver import list_urls
 from .site_entries import get_site_entry_by_url, list_site_entries, simplify_site_entries, upsert_site_entry
 from .site_entry_discovery import (
@@ -17,6 +17,7 @@ __all__ = [
     "classify_site_entry",
     "classify_site_entries_batch",
     "append_url",
+    "append_urls",
     "DefaultResourcePoolAppendAdapter",
     "discover_site_entries_from_urls",
     "list_discovery_domains",
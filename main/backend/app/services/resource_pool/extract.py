@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from ...models.base import SessionLocal
@@ -152,72 +153,97 @@ def append_url(
     Append a single URL to resource pool. Returns True if appended, False if duplicate/skipped.
     scope: "project" | "shared". For shared, project_key can be empty; for project it is required.
     """
-    if scope not in ("project", "shared"):
-        scope = "project"
-    url_refs = [(url, source_ref)]
-    if scope == "shared":
-        with bind_schema("public"):
-            with SessionLocal() as session:
-                new, dup = _append_urls_batch(session, url_refs, source, "shared", None)
-                session.commit()
-                return new > 0
-    with bind_project(project_key):
-        with SessionLocal() as session:
-            new, dup = _append_urls_batch(session, url_refs, source, "project", project_key)
-            session.commit()
-            return new > 0
+    flags = append_urls([(url, source_ref)], source, scope=scope, project_key=project_key)
+    return any(flags.values())
 
 
-def _append_urls_batch(
+_INSERT_CHUNK_SIZE = 500
+
+
+def _insert_new_urls(
     session: Session,
     url_refs: list[tuple[str, dict]],
     source: str,
     scope: str,
     project_key: str | None,
-) -> tuple[int, int]:
-    """Append URLs with per-url source_ref. Returns (new_count, duplicate_count)."""
-    new_count = 0
-    dup_count = 0
+) -> tuple[dict[str, bool], int]:
+    """
+    Insert the URLs not yet in the pool with INSERT .. ON CONFLICT DO NOTHING, one statement per chunk.
+    Returns ({normalized_url: inserted}, number of valid input URLs incl. repeats).
+    """
+    model = SharedResourcePoolUrl if scope == "shared" else ResourcePoolUrl
+    rows: dict[str, dict] = {}
+    valid = 0
     for raw, ref in url_refs:
         norm = normalize_url(raw)
         if not norm:
             continue
+        valid += 1
+        if norm in rows:
+            continue
         domain = domain_from_url(norm) or ""
+        row = {
+            "url": norm,
+            "domain": domain[:255] if domain else None,
+            "source": source[:32],
+            "source_ref": ref,
+        }
+        if scope != "shared":
+            row["project_key"] = project_key
+        rows[norm] = row
 
-        if scope == "shared":
-            existing = session.execute(
-                select(SharedResourcePoolUrl).where(SharedResourcePoolUrl.url == norm)
-            ).scalar_one_or_none()
-            if existing:
-                dup_count += 1
-                continue
-            session.add(
-                SharedResourcePoolUrl(
-                    url=norm,
-                    domain=domain[:255] if domain else None,
-                    source=source[:32],
-                    source_ref=ref,
-                )
-            )
-            new_count += 1
-        else:
-            existing = session.execute(
-                select(ResourcePoolUrl).where(ResourcePoolUrl.url == norm)
-            ).scalar_one_or_none()
-            if existing:
-                dup_count += 1
-                continue
-            session.add(
-                ResourcePoolUrl(
-                    url=norm,
-                    domain=domain[:255] if domain else None,
-                    source=source[:32],
-                    source_ref=ref,
-                    project_key=project_key,
-                )
-            )
-            new_count += 1
-    return new_count, dup_count
+    inserted: set[str] = set()
+    values = list(rows.values())
+    for i in range(0, len(values), _INSERT_CHUNK_SIZE):
+        stmt = (
+            pg_insert(model)
+            .values(values[i : i + _INSERT_CHUNK_SIZE])
+            .on_conflict_do_nothing(index_elements=["url"])
+            .returning(model.url)
+        )
+        inserted.update(session.execute(stmt).scalars().all())
+    return {u: u in inserted for u in rows}, valid
+
+
+def _append_urls_batch(
+    session: Session,
+    url_refs: list[tuple[str, dict]],
+    source: str,
+    scope: str,
+    project_key: str | None,
+) -> tuple[int, int]:
+    """Append URLs with per-url source_ref. Returns (new_count, duplicate_count)."""
+    flags, valid = _insert_new_urls(session, url_refs, source, scope, project_key)
+    new_count = sum(1 for ok in flags.values() if ok)
+    return new_count, valid - new_count
+
+
+def append_urls(
+    url_refs: list[tuple[str, dict]],
+    source: str,
+    *,
+    scope: str,
+    project_key: str,
+) -> dict[str, bool]:
+    """
+    Append many (url, source_ref) pairs to resource pool in one transaction.
+    Returns {normalized_url: appended}; False means the URL was already in the pool.
+    """
+    if scope not in ("project", "shared"):
+        scope = "project"
+    if not url_refs:
+        return {}
+    if scope == "shared":
+        with bind_schema("public"):
+            with SessionLocal() as session:
+                flags, _ = _insert_new_urls(session, url_refs, source, "shared", None)
+                session.commit()
+                return flags
+    with bind_project(project_key):
+        with SessionLocal() as session:
+            flags, _ = _insert_new_urls(session, url_refs, source, "project", project_key)
+            session.commit()
+            return flags
 
 
 def extract_from_tasks(
@@ -53,7 +53,7 @@ def validate_llm_recommendation(raw: dict[str, Any], site_url: str) -> dict[str,
             parsed = urlparse(template)
             if not parsed.netloc:
                 return None
-            tpl_domain = (parsed.netloc or "").lower().lstrip("www.")
+            tpl_domain = (parsed.netloc or "").lower().removeprefix("www.")
             site_domain = domain_from_url(site_url) or ""
             if tpl_domain and site_domain and tpl_domain != site_domain:
                 return None
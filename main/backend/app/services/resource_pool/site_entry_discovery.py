@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import logging
+import socket
+from collections import OrderedDict
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
 
-from sqlalchemy import select
+import requests
+from sqlalchemy import func, select
 
 from ...models.base import SessionLocal
 from ...models.entities import ResourcePoolUrl, SharedResourcePoolUrl
@@ -21,6 +28,16 @@ from .url_utils import domain_from_url, normalize_url
 
 _log = logging.getLogger(__name__)
 
+# Connect phase is capped separately so an unreachable host fails fast; probe_timeout bounds each read.
+_CONNECT_TIMEOUT_CAP = 2.0
+
+# Domains that fail DNS are skipped before any HTTP probe; answers are kept in a small TTL-LRU.
+_DNS_TIMEOUT = 2.0
+_DNS_CACHE_TTL = 300.0
+_DNS_CACHE_MAX = 4096
+_DNS_CACHE: OrderedDict[str, tuple[bool, float]] = OrderedDict()
+_dns_cache_lock = threading.Lock()
+_dns_executor: ThreadPoolExecutor | None = None
 
 _DEFAULT_SITEMAP_PATHS: tuple[str, ...] = (
     "/sitemap.xml",
@@ -72,6 +89,7 @@ def _discover_domain_candidates(
     candidates: list[dict[str, Any]] = []
     errors: list[dict[str, str]] = []
     stats = {"domain_root": 0, "sitemap": 0, "rss": 0, "link_alternate": 0, "search_path": 0, "search_form": 0}
+    seen_urls: set[str] = set()
 
     def _push_candidate(
         *,
@@ -81,15 +99,16 @@ def _discover_domain_candidates(
         source_ref: dict[str, Any] | None = None,
     ) -> None:
         norm = normalize_url(site_url)
-        if not norm:
+        if not norm or norm in seen_urls:
             return
+        seen_urls.add(norm)
         item = {
             "site_url": norm,
             "domain": d,
             "entry_type": entry_type,
             "template": template,
             "name": None,
-            "capabilities": infer_keyword_capabilities(entry_type),
+            "capabilities": dict(_entry_capabilities(entry_type)),
             "source": "discovery",
             "source_ref": source_ref or {},
             "tags": [],
@@ -97,66 +116,78 @@ def _discover_domain_candidates(
             "extra": {},
             "_target_scope": target_scope,
         }
-        if all(x.get("site_url") != norm for x in candidates):
-            candidates.append(item)
+        candidates.append(item)
 
     try:
         base_urls = _best_effort_base_urls(d)
         if not base_urls:
             return candidates, stats, errors
+        if not _host_resolves(_norm_host(d)):
+            errors.append({"domain": d, "error": "dns resolution failed"})
+            return candidates, stats, errors
         _push_candidate(site_url=base_urls[0], entry_type="domain_root", source_ref={"probe": "domain_root"})
         stats["domain_root"] += 1
-        sitemap_ok = False
-        rss_ok = False
-        search_ok = False
-        sitemap_probe_paths = [p for p in (sitemap_paths or list(_DEFAULT_SITEMAP_PATHS)) if str(p).strip().startswith("/")]
-        rss_probe_paths = [p for p in (rss_paths or list(_DEFAULT_RSS_PATHS)) if str(p).strip().startswith("/")]
-        search_probe_paths = list(_DEFAULT_SEARCH_PROBE_PATHS)
-        for base in base_urls:
-            if not sitemap_ok:
-                for p in sitemap_probe_paths:
-                    u = urljoin(base, p)
-                    ok, ctype = _probe_url_candidate(u, timeout=probe_timeout)
-                    if ok:
-                        _push_candidate(site_url=u, entry_type="sitemap", source_ref={"probe": "sitemap", "content_type": ctype or ""})
-                        stats["sitemap"] += 1
-                        sitemap_ok = True
-                        break
-            if not rss_ok:
-                for p in rss_probe_paths:
-                    u = urljoin(base, p)
-                    ok, ctype = _probe_url_candidate(u, timeout=probe_timeout)
-                    if ok:
-                        _push_candidate(site_url=u, entry_type="rss", source_ref={"probe": "rss", "content_type": ctype or ""})
-                        stats["rss"] += 1
-                        rss_ok = True
-                        break
-            if not search_ok:
-                for p in search_probe_paths:
-                    u = urljoin(base, p)
-                    ok, _ = _probe_url_candidate(u, timeout=probe_timeout)
-                    if not ok:
-                        continue
+        # (probe, entry_type, paths): the first path that answers wins for each entry type.
+        probe_plan: tuple[tuple[str, str, list[str]], ...] = (
+            ("sitemap", "sitemap", _absolute_probe_paths(sitemap_paths or _DEFAULT_SITEMAP_PATHS)),
+            ("rss", "rss", _absolute_probe_paths(rss_paths or _DEFAULT_RSS_PATHS)),
+            ("search_path", "search_template", list(_DEFAULT_SEARCH_PROBE_PATHS)),
+        )
+        found_types: set[str] = set()
+
+        def _probe_first_path(*, base: str, origin: str, probe: str, entry_type: str, paths: list[str]) -> bool:
+            for p in paths:
+                u = origin + p
+                ok, ctype = _probe_url_candidate(u, timeout=probe_timeout)
+                if not ok:
+                    continue
+                if entry_type == "search_template":
                     parsed = urlparse(u)
                     tpl = urlunparse((parsed.scheme, parsed.netloc, parsed.path or "/", parsed.params, "q={{q}}", ""))
-                    _push_candidate(site_url=tpl, entry_type="search_template", template=tpl, source_ref={"probe": "search_path", "base": base, "path": p})
-                    stats["search_path"] += 1
-                    search_ok = True
-                    break
-            if include_link_alternate and base.startswith("https://"):
-                try:
-                    html, _ = fetch_html(base, timeout=probe_timeout, retries=1)
-                    if not search_ok:
-                        for tpl in _extract_search_templates_from_html(html, base_url=base):
-                            _push_candidate(site_url=tpl, entry_type="search_template", template=tpl, source_ref={"probe": "search_form", "base": base})
-                            stats["search_form"] += 1
-                            search_ok = True
-                            break
-                    for feed_url in _extract_link_alternate_feeds(html, base_url=base):
-                        _push_candidate(site_url=feed_url, entry_type="rss", source_ref={"probe": "link_alternate", "base": base})
-                        stats["link_alternate"] += 1
-                except Exception:
-                    pass
+                    _push_candidate(site_url=tpl, entry_type=entry_type, template=tpl, source_ref={"probe": probe, "base": base, "path": p})
+                else:
+                    _push_candidate(site_url=u, entry_type=entry_type, source_ref={"probe": probe, "content_type": ctype or ""})
+                stats[probe] += 1
+                return True
+            return False
+
+        def _scan_root_html(base: str) -> bool:
+            """
+            GET the base page once: seeds search-form / alternate-feed entries from its HTML and
+            doubles as a liveness check. Returns False only when the base is unreachable.
+            """
+            try:
+                html, _ = fetch_html(base, timeout=_split_timeout(probe_timeout), retries=1)
+            except HttpFetchError as exc:
+                return not isinstance(exc.__cause__, (requests.ConnectionError, requests.Timeout))
+            except Exception:
+                return True
+            try:
+                want_templates = "search_template" not in found_types
+                templates, feeds = _extract_html_entry_points(html, base_url=base, want_templates=want_templates)
+            except Exception:
+                return True
+            for tpl in templates[:1]:
+                _push_candidate(site_url=tpl, entry_type="search_template", template=tpl, source_ref={"probe": "search_form", "base": base})
+                stats["search_form"] += 1
+                found_types.add("search_template")
+            for feed_url in feeds:
+                _push_candidate(site_url=feed_url, entry_type="rss", source_ref={"probe": "link_alternate", "base": base})
+                stats["link_alternate"] += 1
+                found_types.add("rss")
+            return True
+
+        for base in base_urls:
+            # Entry points advertised by the page itself make the matching blind path probes redundant.
+            if include_link_alternate and base.startswith("https://") and not _scan_root_html(base):
+                continue
+            # Probe paths are absolute, so joining against the origin is plain concatenation.
+            origin = base.rstrip("/")
+            for probe, entry_type, paths in probe_plan:
+                if entry_type in found_types:
+                    continue
+                if _probe_first_path(base=base, origin=origin, probe=probe, entry_type=entry_type, paths=paths):
+                    found_types.add(entry_type)
     except Exception as exc:  # noqa: BLE001
         errors.append({"domain": d, "error": str(exc)})
     return candidates, stats, errors
@@ -176,51 +207,38 @@ def list_discovery_domains(
         url_scope = "effective"
     limit_domains = min(max(1, int(limit_domains)), 500)
 
-    allow_set = {str(x).strip().lower().lstrip("www.") for x in (allow_domains or []) if str(x).strip()}
-    deny_set = {str(x).strip().lower().lstrip("www.") for x in (deny_domains or []) if str(x).strip()}
-
-    def _domain_allowed(d: str) -> bool:
-        if deny_set and d in deny_set:
-            return False
-        if allow_set and d not in allow_set:
-            return False
-        return True
+    allow_set = {h for h in map(_norm_host, allow_domains or []) if h}
+    deny_set = {h for h in map(_norm_host, deny_domains or []) if h}
+    domain_norm = _norm_host(domain)
 
     domains: list[str] = []
     seen_domains: set[str] = set()
 
-    def _add_domain(d: str | None) -> None:
-        dd = (d or "").strip().lower().lstrip("www.")
-        if not dd:
-            return
-        if domain and dd != domain.strip().lower().lstrip("www."):
-            return
-        if not _domain_allowed(dd):
-            return
-        if dd in seen_domains:
-            return
-        seen_domains.add(dd)
-        domains.append(dd)
+    def _collect_domains(model: Any) -> None:
+        # Normalize (trim/lower/drop "www.") and dedup in SQL so only distinct, most recent
+        # domains come back instead of limit_domains * 20 raw rows.
+        norm = func.regexp_replace(func.lower(func.trim(model.domain)), r"^www\.", "")
+        q = select(norm).where(model.domain.is_not(None)).where(norm != "")
+        if domain_norm:
+            q = q.where(norm == domain_norm)
+        if allow_set:
+            q = q.where(norm.in_(sorted(allow_set)))
+        if deny_set:
+            q = q.where(norm.not_in(sorted(deny_set)))
+        q = q.group_by(norm).order_by(func.max(model.created_at).desc()).limit(limit_domains)
+        with SessionLocal() as session:
+            for (d,) in session.execute(q).all():
+                if d and d not in seen_domains:
+                    seen_domains.add(d)
+                    domains.append(d)
 
     def _collect_project_domains() -> None:
         with bind_project(project_key):
-            with SessionLocal() as session:
-                q = select(ResourcePoolUrl.domain).where(ResourcePoolUrl.domain.is_not(None))
-                if domain:
-                    q = q.where(ResourcePoolUrl.domain == domain.strip().lower().lstrip("www."))
-                q = q.order_by(ResourcePoolUrl.created_at.desc()).limit(limit_domains * 20)
-                for (d,) in session.execute(q).all():
-                    _add_domain(d)
+            _collect_domains(ResourcePoolUrl)
 
     def _collect_shared_domains() -> None:
         with bind_schema("public"):
-            with SessionLocal() as session:
-                q = select(SharedResourcePoolUrl.domain).where(SharedResourcePoolUrl.domain.is_not(None))
-                if domain:
-                    q = q.where(SharedResourcePoolUrl.domain == domain.strip().lower().lstrip("www."))
-                q = q.order_by(SharedResourcePoolUrl.created_at.desc()).limit(limit_domains * 20)
-                for (d,) in session.execute(q).all():
-                    _add_domain(d)
+            _collect_domains(SharedResourcePoolUrl)
 
     if url_scope == "project":
         _collect_project_domains()
@@ -233,18 +251,77 @@ def list_discovery_domains(
     return domains[:limit_domains]
 
 
+@lru_cache(maxsize=16)
+def _entry_capabilities(entry_type: str, channel_key: str | None = None) -> dict[str, Any]:
+    """Capabilities only depend on the small set of entry types; callers copy before storing."""
+    return infer_keyword_capabilities(entry_type, channel_key)
+
+
+def _norm_host(host: object) -> str:
+    """Trim, lowercase and drop a literal leading 'www.' (not lstrip's character set)."""
+    return str(host or "").strip().lower().removeprefix("www.")
+
+
+def _host_resolves(host: str) -> bool:
+    """
+    Cheap liveness prefilter: False only when the resolver definitively has no address.
+    A slow resolver (timeout) is treated as alive so probing still decides.
+    """
+    global _dns_executor
+    now = time.monotonic()
+    with _dns_cache_lock:
+        hit = _DNS_CACHE.get(host)
+        if hit is not None and hit[1] > now:
+            _DNS_CACHE.move_to_end(host)
+            return hit[0]
+        if _dns_executor is None:
+            _dns_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="site-entry-dns")
+        executor = _dns_executor
+    fut = executor.submit(socket.getaddrinfo, host, 443, type=socket.SOCK_STREAM)
+    try:
+        fut.result(timeout=_DNS_TIMEOUT)
+        ok = True
+    except socket.gaierror:
+        ok = False
+    except Exception:  # noqa: BLE001
+        # Timeout or other resolver trouble: let probing decide, and ask again next time.
+        return True
+    with _dns_cache_lock:
+        _DNS_CACHE[host] = (ok, now + _DNS_CACHE_TTL)
+        _DNS_CACHE.move_to_end(host)
+        while len(_DNS_CACHE) > _DNS_CACHE_MAX:
+            _DNS_CACHE.popitem(last=False)
+    return ok
+
+
 def _best_effort_base_urls(domain: str) -> list[str]:
-    d = (domain or "").strip().lower()
-    d = d.lstrip("www.")
+    d = _norm_host(domain)
     if not d:
         return []
     return [f"https://{d}/", f"http://{d}/"]
 
 
+def _absolute_probe_paths(paths: list[str] | tuple[str, ...]) -> list[str]:
+    """Keep only absolute probe paths (leading '/'), stripped of surrounding whitespace."""
+    out: list[str] = []
+    for p in paths:
+        sp = str(p).strip()
+        if sp.startswith("/"):
+            out.append(sp)
+    return out
+
+
 def _extract_link_alternate_feeds(html: str, *, base_url: str) -> list[str]:
+    try:
+        return _feeds_from_parser(make_html_parser(html), base_url=base_url)
+    except Exception:
+        return []
+
+
+def _feeds_from_parser(parser: Any, *, base_url: str) -> list[str]:
     urls: list[str] = []
+    seen: set[str] = set()
     try:
-        parser = make_html_parser(html)
         for node in parser.css("link"):
             rel = (node.attributes.get("rel") or "").lower()
             if "alternate" not in rel:
@@ -257,20 +334,37 @@ def _extract_link_alternate_feeds(html: str, *, base_url: str) -> list[str]:
                 continue
             abs_url = urljoin(base_url, href)
             norm = normalize_url(abs_url)
-            if norm and norm not in urls:
+            if norm and norm not in seen:
+                seen.add(norm)
                 urls.append(norm)
     except Exception:
         return urls
     return urls
 
 
+def _extract_html_entry_points(html: str, *, base_url: str, want_templates: bool = True) -> tuple[list[str], list[str]]:
+    """Parse the probed page once and extract (search form templates, alternate feed urls)."""
+    try:
+        parser = make_html_parser(html)
+    except Exception:
+        return [], []
+    templates = _templates_from_parser(parser, base_url=base_url) if want_templates else []
+    return templates, _feeds_from_parser(parser, base_url=base_url)
+
+
+def _split_timeout(timeout: float) -> tuple[float, float]:
+    """Return a requests-style (connect, read) timeout for a single probe budget."""
+    read_timeout = max(0.1, float(timeout))
+    return min(_CONNECT_TIMEOUT_CAP, read_timeout), read_timeout
+
+
 def _probe_url_candidate(url: str, *, timeout: float) -> tuple[bool, str | None]:
     """
     Best-effort probe. Returns (ok, content_type).
     Uses fetch_html because it returns Response with headers/status.
     """
     try:
-        _, resp = fetch_html(url, timeout=timeout, retries=1)
+        _, resp = fetch_html(url, timeout=_split_timeout(timeout), retries=1)
         ctype = (resp.headers.get("content-type") or "").lower()
         return True, ctype
     except HttpFetchError:
@@ -309,9 +403,16 @@ def _build_search_template_from_form(base_url: str, form_action: str, query_para
 
 
 def _extract_search_templates_from_html(html: str, *, base_url: str) -> list[str]:
+    try:
+        return _templates_from_parser(make_html_parser(html), base_url=base_url)
+    except Exception:
+        return []
+
+
+def _templates_from_parser(parser: Any, *, base_url: str) -> list[str]:
     templates: list[str] = []
+    seen: set[str] = set()
     try:
-        parser = make_html_parser(html)
         for form in parser.css("form"):
             method = (form.attributes.get("method") or "get").strip().lower()
             if method not in {"", "get"}:
@@ -332,7 +433,8 @@ def _extract_search_templates_from_html(html: str, *, base_url: str) -> list[str
             if not query_input_name:
                 continue
             tpl = _build_search_template_from_form(base_url, action, query_input_name)
-            if tpl and tpl not in templates:
+            if tpl and tpl not in seen:
+                seen.add(tpl)
                 templates.append(tpl)
     except Exception:
         return templates
@@ -355,10 +457,13 @@ def discover_site_entries_from_urls(
     run_auto_classify: bool = False,
     use_llm: bool = False,
     domain_probe_concurrency: int = 6,
+    total_deadline_s: float | None = None,
 ) -> DiscoveryResult:
     """
     Scan resource_pool_urls, group by domain, probe common entry points.
     Returns candidates ready for upsert_site_entry.
+    total_deadline_s bounds the wall-clock time spent probing; domains not finished by then
+    are reported in errors and their probes abandoned.
     """
     if url_scope not in {"shared", "project", "effective"}:
         url_scope = "effective"
@@ -382,108 +487,121 @@ def discover_site_entries_from_urls(
     stats = {"domain_root": 0, "sitemap": 0, "rss": 0, "link_alternate": 0, "search_path": 0, "search_form": 0}
     seen_site_urls: set[str] = set()
     max_workers = max(1, min(16, int(domain_probe_concurrency or 6)))
-    if max_workers == 1 or len(domains) <= 1:
-        iter_results = [
-            _discover_domain_candidates(
-                d=d,
-                target_scope=target_scope,
-                probe_timeout=probe_timeout,
-                include_link_alternate=include_link_alternate,
-                sitemap_paths=sitemap_paths,
-                rss_paths=rss_paths,
-            )
-            for d in domains
+    classify_batch_size = 20
+    deadline = time.monotonic() + float(total_deadline_s) if total_deadline_s else None
+    # domain_root candidates waiting for auto_classify, and search_template clones it produced.
+    pending_classify: list[dict[str, Any]] = []
+    generated: list[dict[str, Any]] = []
+
+    def _iter_domain_results():
+        kwargs = {
+            "target_scope": target_scope,
+            "probe_timeout": probe_timeout,
+            "include_link_alternate": include_link_alternate,
+            "sitemap_paths": sitemap_paths,
+            "rss_paths": rss_paths,
+        }
+        if max_workers == 1 or len(domains) <= 1:
+            for i, d in enumerate(domains):
+                if deadline is not None and time.monotonic() >= deadline:
+                    yield [], {}, [{"domain": x, "error": "discovery deadline exceeded"} for x in domains[i:]]
+                    return
+                yield _discover_domain_candidates(d=d, **kwargs)
+            return
+        ex = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="site-entry-probe")
+        futs = {ex.submit(_discover_domain_candidates, d=d, **kwargs): d for d in domains}
+        yielded: set[Any] = set()
+        timed_out = False
+        try:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            for fut in as_completed(futs, timeout=remaining):
+                yielded.add(fut)
+                yield fut.result()
+        except FutureTimeoutError:
+            timed_out = True
+            late_errors: list[dict[str, str]] = []
+            for fut, d in futs.items():
+                if fut in yielded:
+                    continue
+                if fut.done() and not fut.cancelled():
+                    yield fut.result()
+                else:
+                    late_errors.append({"domain": d, "error": "discovery deadline exceeded"})
+            yield [], {}, late_errors
+        finally:
+            # On deadline, do not wait for in-flight probes; their results are discarded.
+            ex.shutdown(wait=not timed_out, cancel_futures=timed_out)
+
+    def _flush_classify() -> None:
+        if not pending_classify:
+            return
+        batch = pending_classify[:]
+        pending_classify.clear()
+        batch_rows = [
+            {"site_url": c.get("site_url", ""), "entry_type": "domain_root", "template": c.get("template")}
+            for c in batch
         ]
-    else:
-        iter_results = []
-        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="site-entry-probe") as ex:
-            futs = [
-                ex.submit(
-                    _discover_domain_candidates,
-                    d=d,
-                    target_scope=target_scope,
-                    probe_timeout=probe_timeout,
-                    include_link_alternate=include_link_alternate,
-                    sitemap_paths=sitemap_paths,
-                    rss_paths=rss_paths,
-                )
-                for d in domains
-            ]
-            for fut in as_completed(futs):
-                iter_results.append(fut.result())
-    for dcands, dstats, derrs in iter_results:
+        try:
+            recs = classify_site_entries_batch(batch_rows, use_llm=use_llm, llm_batch_size=classify_batch_size)
+        except Exception as exc:
+            _log.warning("site_entry_discovery auto_classify batch fallback to probes only: %s", exc, exc_info=False)
+            return
+        for rec_row, c in zip(recs, batch):
+            extra = c.get("extra") or {}
+            extra["recommended_channel_key"] = rec_row.get("channel_key")
+            extra["recommend_source"] = rec_row.get("source")
+            if rec_row.get("template"):
+                extra["recommended_template"] = rec_row.get("template")
+            c["extra"] = extra
+            c["capabilities"] = {**(c.get("capabilities") or {}), **(rec_row.get("capabilities") or {})}
+            # Optionally materialize a search_template candidate when recommendation says so.
+            if str(rec_row.get("entry_type") or "") != "search_template":
+                continue
+            tpl = str(rec_row.get("template") or "").strip()
+            if not tpl or tpl in seen_site_urls:
+                continue
+            generated.append(
+                {
+                    **c,
+                    "site_url": tpl,
+                    "entry_type": "search_template",
+                    "template": tpl,
+                    "capabilities": rec_row.get("capabilities") or dict(_entry_capabilities("search_template", "generic_web.search_template")),
+                    "extra": {
+                        **extra,
+                        "generated_from_domain_root": c.get("site_url"),
+                        "recommended_channel_key": "generic_web.search_template",
+                        "recommend_source": rec_row.get("source") or "batch",
+                    },
+                }
+            )
+            seen_site_urls.add(tpl)
+
+    for dcands, dstats, derrs in _iter_domain_results():
+        roots: list[dict[str, Any]] = []
+        has_sitemap_or_rss = False
         for item in dcands:
             u = str(item.get("site_url") or "")
             if u and u not in seen_site_urls:
                 seen_site_urls.add(u)
                 candidates.append(item)
+                et = item.get("entry_type")
+                if et == "domain_root":
+                    roots.append(item)
+                elif et in ("sitemap", "rss"):
+                    has_sitemap_or_rss = True
         for k, v in (dstats or {}).items():
             stats[k] = int(stats.get(k, 0)) + int(v or 0)
         errors.extend(derrs or [])
-
-    # Optional: run auto_classify on domain_root candidates that have no sitemap/rss for that domain
+        # Optional: auto_classify domain_root candidates of domains that expose no sitemap/rss,
+        # flushed in batches while the remaining domains are still being probed.
+        if run_auto_classify and not has_sitemap_or_rss:
+            pending_classify.extend(roots)
+            if len(pending_classify) >= classify_batch_size:
+                _flush_classify()
     if run_auto_classify:
-        domains_with_sitemap_or_rss = {
-            c.get("domain") for c in candidates
-            if c.get("entry_type") in ("sitemap", "rss") and c.get("domain")
-        }
-        batch_rows: list[dict[str, Any]] = []
-        candidate_indexes: list[int] = []
-        for i, c in enumerate(candidates):
-            if c.get("entry_type") != "domain_root":
-                continue
-            d = c.get("domain")
-            if d and d in domains_with_sitemap_or_rss:
-                continue
-            batch_rows.append(
-                {
-                    "site_url": c.get("site_url", ""),
-                    "entry_type": "domain_root",
-                    "template": c.get("template"),
-                }
-            )
-            candidate_indexes.append(i)
-        if batch_rows:
-            try:
-                recs = classify_site_entries_batch(batch_rows, use_llm=use_llm, llm_batch_size=20)
-                for rec_row, idx in zip(recs, candidate_indexes):
-                    c = candidates[idx]
-                    extra = c.get("extra") or {}
-                    extra["recommended_channel_key"] = rec_row.get("channel_key")
-                    extra["recommend_source"] = rec_row.get("source")
-                    if rec_row.get("template"):
-                        extra["recommended_template"] = rec_row.get("template")
-                    c["extra"] = extra
-                    c["capabilities"] = {**(c.get("capabilities") or {}), **(rec_row.get("capabilities") or {})}
-                # Optionally materialize a search_template candidate when recommendation says so.
-                existing_urls = {str(x.get("site_url") or "") for x in candidates}
-                new_candidates: list[dict[str, Any]] = []
-                for rec_row, idx in zip(recs, candidate_indexes):
-                    if str(rec_row.get("entry_type") or "") != "search_template":
-                        continue
-                    tpl = str(rec_row.get("template") or "").strip()
-                    if not tpl or tpl in existing_urls:
-                        continue
-                    src = candidates[idx]
-                    clone = {
-                        **src,
-                        "site_url": tpl,
-                        "entry_type": "search_template",
-                        "template": tpl,
-                        "capabilities": rec_row.get("capabilities") or infer_keyword_capabilities("search_template", "generic_web.search_template"),
-                        "extra": {
-                            **(src.get("extra") or {}),
-                            "generated_from_domain_root": src.get("site_url"),
-                            "recommended_channel_key": "generic_web.search_template",
-                            "recommend_source": rec_row.get("source") or "batch",
-                        },
-                    }
-                    new_candidates.append(clone)
-                    existing_urls.add(tpl)
-                if new_candidates:
-                    candidates.extend(new_candidates)
-            except Exception as exc:
-                _log.warning("site_entry_discovery auto_classify batch fallback to probes only: %s", exc, exc_info=False)
+        _flush_classify()
+    candidates.extend(generated)
 
     return DiscoveryResult(domains_scanned=len(domains), candidates=candidates, probe_stats=stats, errors=errors)
 
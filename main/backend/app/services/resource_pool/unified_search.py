@@ -2,19 +2,44 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import io
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any
-from urllib.parse import parse_qsl, quote_plus, urlencode, urljoin, urlsplit, urlunsplit
+from functools import lru_cache
+from typing import IO, Any, Callable, Iterable, Iterator
+from urllib.parse import quote_plus, urljoin, urlsplit
 import xml.etree.ElementTree as ET
 import gzip
 
-from ..ingest.adapters.http_utils import HttpFetchError, fetch_html, make_html_parser
-from ..source_library.resolver import list_effective_items
-from .extract import append_url
+import requests
+
+try:  # C-backed streaming parser; stdlib ElementTree is the fallback
+    from lxml import etree as LET  # type: ignore
+except ImportError:  # pragma: no cover
+    LET = None
+
+from ..ingest.adapters.http_utils import (
+    DEFAULT_HEADERS,
+    HttpFetchError,
+    fetch_html,
+    make_html_parser,
+    make_pooled_session,
+)
+from ..source_library.resolver import get_effective_item
+from .extract import append_urls
 from .site_entries import get_site_entry_by_url
 from .url_utils import domain_from_url, normalize_url
 
+# Child sitemaps of one sitemapindex level are fetched concurrently by this many threads.
+_SITEMAP_FETCH_WORKERS = 8
+# Site entries of one item are processed concurrently by this many threads; all of them share one
+# keep-alive connection pool of _FETCH_POOL_SIZE connections per host.
+_SITE_ENTRY_WORKERS = 16
+_FETCH_POOL_SIZE = 32
+
 
 @dataclass
 class UnifiedSearchResult:
@@ -45,47 +70,17 @@ def _as_terms(raw: Any) -> list[str]:
     return [str(raw).strip()] if str(raw).strip() else []
 
 
-_TRACKING_QUERY_KEYS = {
-    "utm_source",
-    "utm_medium",
-    "utm_campaign",
-    "utm_term",
-    "utm_content",
-    "utm_id",
-    "utm_name",
-    "utm_reader",
-    "utm_referrer",
-    "utm_social",
-    "utm_social-type",
-    "gclid",
-    "fbclid",
-    "igshid",
-    "mc_cid",
-    "mc_eid",
-    "mkt_tok",
-    "ref",
-    "ref_src",
-    "spm",
-}
+def _normalize_candidate_url(url: str) -> str | None:
+    """
+    Normalize candidate URL for storage/display. normalize_url already drops fragment and
+    query (tracking params included), so a second split/rebuild pass is not needed.
+    """
+    return normalize_url(url)
 
 
-def _normalize_candidate_url(url: str) -> str | None:
-    """Normalize candidate URL for storage/display (strip fragment + tracking params)."""
-    norm = normalize_url(url)
-    if not norm:
-        return None
-    try:
-        parts = urlsplit(norm)
-        q = [
-            (k, v)
-            for (k, v) in parse_qsl(parts.query, keep_blank_values=True)
-            if k.lower() not in _TRACKING_QUERY_KEYS
-        ]
-        query = urlencode(q, doseq=True) if q else ""
-        cleaned = urlunsplit((parts.scheme, parts.netloc, parts.path or "/", query, ""))
-        return normalize_url(cleaned) or norm
-    except Exception:
-        return norm
+def _normalized_unique(raw_urls: Iterable[str]) -> list[str]:
+    """Normalize candidates and drop duplicates, keeping first-seen order."""
+    return list(dict.fromkeys(n for n in map(_normalize_candidate_url, raw_urls) if n))
 
 
 def _local_name(tag: str) -> str:
@@ -94,72 +89,171 @@ def _local_name(tag: str) -> str:
     return tag
 
 
-def _extract_urls_from_rss_xml(xml_text: str) -> list[str]:
-    urls: list[str] = []
+def _iterparse_xml(source: str | bytes | IO[bytes], *, events: tuple[str, ...] = ("end",)) -> Iterator[tuple[str, Any]]:
+    """
+    Stream (event, element) pairs with lxml. Text input is re-encoded as UTF-8 and the document's
+    own encoding declaration is overridden; entities and network access are disabled.
+    """
+    encoding: str | None = None
+    if isinstance(source, str):
+        source = io.BytesIO(source.encode("utf-8"))
+        encoding = "utf-8"
+    elif isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(bytes(source))
+    return LET.iterparse(
+        source,
+        events=events,
+        encoding=encoding,
+        recover=True,
+        resolve_entities=False,
+        no_network=True,
+    )
+
+
+def _release_element(el: Any) -> None:
+    """Free a processed element and the already-processed siblings before it."""
+    el.clear()
+    parent = el.getparent()
+    if parent is not None:
+        while el.getprevious() is not None:
+            del parent[0]
+
+
+def _rss_item_urls(item: Any) -> list[str]:
+    out: list[str] = []
+    link = item.find("{*}link")
+    if link is not None and link.text:
+        out.append(link.text.strip())
+    guid = item.find("{*}guid")
+    if guid is not None and guid.text:
+        is_permalink = str(guid.attrib.get("isPermaLink") or "").lower() == "true"
+        if is_permalink:
+            out.append(guid.text.strip())
+    return out
+
+
+def _atom_entry_urls(entry: Any) -> list[str]:
+    out: list[str] = []
+    for link in entry.findall("{*}link"):
+        href = (link.attrib.get("href") or "").strip()
+        if not href:
+            continue
+        rel = (link.attrib.get("rel") or "").strip().lower()
+        typ = (link.attrib.get("type") or "").strip().lower()
+        if rel and rel != "alternate":
+            continue
+        if typ and "html" not in typ and "xml" in typ:
+            continue
+        out.append(href)
+    return out
+
+
+def _extract_urls_from_rss_xml(xml_text: str | bytes | IO[bytes]) -> list[str]:
+    if LET is None:
+        return _extract_urls_from_rss_xml_etree(xml_text)
+    # RSS item links come before Atom entry links, as in the tree-walking version.
+    item_raw: list[str] = []
+    entry_raw: list[str] = []
+    try:
+        for _, el in _iterparse_xml(xml_text):
+            if not isinstance(el.tag, str):
+                continue
+            name = _local_name(el.tag)
+            if name == "item":
+                item_raw.extend(_rss_item_urls(el))
+                _release_element(el)
+            elif name == "entry":
+                entry_raw.extend(_atom_entry_urls(el))
+                _release_element(el)
+    except Exception:
+        pass
+    return _normalized_unique(item_raw + entry_raw)
+
+
+def _extract_urls_from_rss_xml_etree(xml_text: str | bytes) -> list[str]:
     try:
         root = ET.fromstring(xml_text)
     except Exception:
-        return urls
+        return []
 
-    # RSS: item/link, and guid permalink
-    for item in root.findall(".//{*}item"):
-        link = item.find("{*}link")
-        if link is not None and link.text:
-            norm = _normalize_candidate_url(link.text.strip())
-            if norm and norm not in urls:
-                urls.append(norm)
-        guid = item.find("{*}guid")
-        if guid is not None and guid.text:
-            is_permalink = str(guid.attrib.get("isPermaLink") or "").lower() == "true"
-            if is_permalink:
-                norm = _normalize_candidate_url(guid.text.strip())
-                if norm and norm not in urls:
-                    urls.append(norm)
-
-    # Atom: entry/link[@href], prefer rel=alternate
-    for entry in root.findall(".//{*}entry"):
-        for link in entry.findall("{*}link"):
-            href = (link.attrib.get("href") or "").strip()
-            if not href:
-                continue
-            rel = (link.attrib.get("rel") or "").strip().lower()
-            typ = (link.attrib.get("type") or "").strip().lower()
-            if rel and rel != "alternate":
+    # RSS: item/link, and guid permalink; Atom: entry/link[@href], prefer rel=alternate
+    raw = [u for item in root.findall(".//{*}item") for u in _rss_item_urls(item)]
+    raw += [u for entry in root.findall(".//{*}entry") for u in _atom_entry_urls(entry)]
+    return _normalized_unique(raw)
+
+
+def _parse_sitemap_xml(xml_text: str | bytes | IO[bytes]) -> tuple[str, list[str]]:
+    """Return (kind, locs). kind: urlset|sitemapindex|unknown."""
+    if LET is None:
+        return _parse_sitemap_xml_etree(xml_text)
+    kind = "unknown"
+    locs: list[str] = []
+    seen: set[str] = set()
+    try:
+        for event, el in _iterparse_xml(xml_text, events=("start", "end")):
+            if not isinstance(el.tag, str):
                 continue
-            if typ and "html" not in typ and "xml" in typ:
+            if event == "start":
+                if kind == "unknown":
+                    kind = _local_name(el.tag).lower()
                 continue
-            norm = _normalize_candidate_url(href)
-            if norm and norm not in urls:
-                urls.append(norm)
-    return urls
+            name = _local_name(el.tag)
+            if name == "loc":
+                if el.text:
+                    norm = _normalize_candidate_url(el.text.strip())
+                    if norm and norm not in seen:
+                        seen.add(norm)
+                        locs.append(norm)
+            elif name in {"url", "sitemap"}:
+                _release_element(el)
+    except Exception:
+        if not locs:
+            return "unknown", []
+    return kind, locs
 
 
-def _parse_sitemap_xml(xml_text: str) -> tuple[str, list[str]]:
-    """Return (kind, locs). kind: urlset|sitemapindex|unknown."""
+def _parse_sitemap_xml_etree(xml_text: str | bytes) -> tuple[str, list[str]]:
     try:
         root = ET.fromstring(xml_text)
     except Exception:
         return "unknown", []
 
     kind = _local_name(root.tag).lower()
-    locs: list[str] = []
-    for loc in root.findall(".//{*}loc"):
-        if loc.text:
-            norm = _normalize_candidate_url(loc.text.strip())
-            if norm and norm not in locs:
-                locs.append(norm)
-    return kind, locs
+    return kind, _normalized_unique(loc.text.strip() for loc in root.findall(".//{*}loc") if loc.text)
 
 
-def _fetch_text_maybe_gzip(url: str, *, timeout: float) -> str:
-    text, resp = fetch_html(url, timeout=timeout, retries=1)
-    if url.lower().endswith(".gz"):
-        try:
-            raw = resp.content
-            return gzip.decompress(raw).decode("utf-8", errors="ignore")
-        except Exception:
-            return text
-    return text
+@contextmanager
+def _open_gzip_sitemap(url: str, *, timeout: float, session: requests.Session | None = None) -> Iterator[IO[bytes]]:
+    """
+    Stream a .gz sitemap and yield a decompressing file object over the response body, so the
+    compressed and inflated documents are never held in memory. Bodies that are not actually
+    gzip (e.g. already undone by Content-Encoding) are yielded as-is.
+    """
+    try:
+        resp = (session or requests).get(
+            url, headers=dict(DEFAULT_HEADERS), timeout=timeout, stream=True, allow_redirects=True
+        )
+    except requests.RequestException as exc:
+        raise HttpFetchError(f"Failed to fetch {url}") from exc
+    with resp:
+        if resp.status_code >= 400:
+            raise HttpFetchError(f"{resp.status_code} received from {url}")
+        resp.raw.decode_content = True
+        body = io.BufferedReader(resp.raw)
+        if body.peek(2)[:2] == b"\x1f\x8b":
+            with gzip.GzipFile(fileobj=body) as gz:
+                yield gz
+        else:
+            yield body
+
+
+def _fetch_sitemap(url: str, *, timeout: float, session: requests.Session | None = None) -> tuple[str, list[str]]:
+    if url[-3:].lower() == ".gz":  # suffix only; no lowercased copy of the whole URL
+        with _open_gzip_sitemap(url, timeout=timeout, session=session) as stream:
+            # lxml parses straight from the stream; the ElementTree fallback needs the bytes.
+            return _parse_sitemap_xml(stream if LET is not None else stream.read())
+    xml_text, _ = fetch_html(url, timeout=timeout, retries=1, session=session)
+    return _parse_sitemap_xml(xml_text)
 
 
 def _collect_sitemap_urls(
@@ -168,62 +262,114 @@ def _collect_sitemap_urls(
     timeout: float,
     max_depth: int = 2,
     max_sitemaps: int = 50,
+    session: requests.Session | None = None,
 ) -> list[str]:
-    """Fetch sitemap urlset, or recursively expand sitemapindex, with limits."""
+    """
+    Fetch sitemap urlset, or recursively expand sitemapindex, with limits.
+    Expansion is breadth-first one depth level at a time; the sitemaps of a level are fetched
+    concurrently and merged in document order.
+    """
     seen: set[str] = set()
     urls: list[str] = []
-    to_fetch: list[tuple[str, int]] = [(sitemap_url, 0)]
+    urls_seen: set[str] = set()
+    level: list[str] = [sitemap_url]
+    depth = 0
     fetched = 0
-
-    while to_fetch and fetched < max_sitemaps:
-        u, depth = to_fetch.pop(0)
-        if u in seen:
-            continue
-        seen.add(u)
-        fetched += 1
-
-        xml_text = _fetch_text_maybe_gzip(u, timeout=timeout)
-        kind, locs = _parse_sitemap_xml(xml_text)
-        if kind.endswith("sitemapindex") and depth < max_depth:
-            for loc in locs:
-                if loc not in seen:
-                    to_fetch.append((loc, depth + 1))
-            continue
-
-        for loc in locs:
-            if loc not in urls:
-                urls.append(loc)
+    ex: ThreadPoolExecutor | None = None
+    try:
+        while level and fetched < max_sitemaps:
+            batch: list[str] = []
+            for u in level:
+                if fetched + len(batch) >= max_sitemaps:
+                    break
+                if u in seen:
+                    continue
+                seen.add(u)
+                batch.append(u)
+            fetched += len(batch)
+            if len(batch) == 1:
+                results = [_fetch_sitemap(batch[0], timeout=timeout, session=session)]
+            else:
+                if ex is None:
+                    ex = ThreadPoolExecutor(max_workers=_SITEMAP_FETCH_WORKERS, thread_name_prefix="sitemap-fetch")
+                results = list(ex.map(lambda u: _fetch_sitemap(u, timeout=timeout, session=session), batch))
+
+            next_level: list[str] = []
+            for kind, locs in results:
+                if kind.endswith("sitemapindex") and depth < max_depth:
+                    next_level.extend(loc for loc in locs if loc not in seen)
+                    continue
+                for loc in locs:
+                    if loc not in urls_seen:
+                        urls_seen.add(loc)
+                        urls.append(loc)
+            level = next_level
+            depth += 1
+    finally:
+        if ex is not None:
+            ex.shutdown(wait=False, cancel_futures=True)
 
     return urls
 
 
 def _extract_urls_from_html(html: str, *, base_url: str) -> list[str]:
     urls: list[str] = []
+    seen: set[str] = set()
+    base_parts = urlsplit(base_url)
+    origin = f"{base_parts.scheme}://{base_parts.netloc}"
     try:
         parser = make_html_parser(html)
-        for node in parser.css("a"):
-            href = (node.attributes.get("href") or "").strip()
+        # Plain tag lookup skips the CSS selector engine; attrs.get reads one attribute without
+        # materializing the whole attribute dict. str.strip() returns the same object when there
+        # is nothing to trim, so it costs no allocation for well-formed hrefs.
+        for node in parser.tags("a"):
+            href = (node.attrs.get("href") or "").strip()
             if not href:
                 continue
-            abs_url = urljoin(base_url, href)
+            # Most hrefs are absolute or root-relative; only other forms need urljoin's resolution.
+            if href.startswith(("http://", "https://")):
+                abs_url = href
+            elif href.startswith("/") and not href.startswith("//") and "/." not in href:
+                abs_url = origin + href
+            else:
+                abs_url = urljoin(base_url, href)
             norm = _normalize_candidate_url(abs_url)
-            if norm and norm not in urls:
+            if norm and norm not in seen:
+                seen.add(norm)
                 urls.append(norm)
     except Exception:
         return urls
     return urls
 
 
+@lru_cache(maxsize=256)
+def _compile_term_matcher(terms: tuple[str, ...]) -> tuple[re.Pattern[str], bool] | None:
+    """
+    One alternation over the lowercased terms, so each URL is scanned once by the C regex engine.
+    Returns (pattern, needs_lower): ASCII-only terms match case-insensitively in the regex itself,
+    so ASCII URLs are not copied just to lowercase them; other terms keep str.lower() semantics.
+    """
+    t = sorted({x.lower() for x in terms if x}, key=len, reverse=True)
+    if not t:
+        return None
+    alternation = "|".join(map(re.escape, t))
+    if all(x.isascii() for x in t):
+        return re.compile(alternation, re.IGNORECASE | re.ASCII), False
+    return re.compile(alternation), True
+
+
 def _filter_urls_by_terms(urls: list[str], terms: list[str]) -> list[str]:
     if not terms:
         return urls
-    t = [x.lower() for x in terms if x]
-    out: list[str] = []
-    for u in urls:
-        lu = u.lower()
-        if any(term in lu for term in t):
-            out.append(u)
-    return out
+    matcher = _compile_term_matcher(tuple(terms))
+    if matcher is None:
+        return []
+    pat, needs_lower = matcher
+    search = pat.search
+    if needs_lower:
+        return [u for u in urls if search(u.lower())]
+    # Non-ASCII URLs can lowercase into ASCII letters (e.g. U+0130), so they still take lower().
+    return [u for u in urls if search(u if u.isascii() else u.lower())]
 
 
 def _filter_urls_by_terms_with_fallback(
@@ -274,22 +420,13 @@ def _resolve_item_site_entries(item: dict[str, Any]) -> list[str]:
     if not isinstance(params, dict):
         return []
     raw = params.get("site_entries") or params.get("site_entry_urls") or []
-    urls: list[str] = []
-    if isinstance(raw, list):
-        for x in raw:
-            if isinstance(x, str):
-                u = normalize_url(x)
-            elif isinstance(x, dict):
-                u = normalize_url(str(x.get("site_url") or x.get("url") or "").strip())
-            else:
-                u = normalize_url(str(x).strip())
-            if u and u not in urls:
-                urls.append(u)
-    elif isinstance(raw, str):
-        u = normalize_url(raw)
-        if u:
-            urls.append(u)
-    return urls
+    if isinstance(raw, str):
+        raw = [raw]
+    if not isinstance(raw, list):
+        return []
+    entries = ((x.get("site_url") or x.get("url")) if isinstance(x, dict) else x for x in raw)
+    # normalize_url strips whitespace itself; only non-str values need converting.
+    return _normalized_unique(u if isinstance(u, str) else str(u or "") for u in entries)
 
 
 def unified_search_by_item(
@@ -320,9 +457,7 @@ def unified_search_by_item(
     if pool_scope not in {"project", "shared"}:
         pool_scope = "project"
 
-    items = list_effective_items(scope="effective", project_key=project_key)
-    item_map = {x.get("item_key"): x for x in items if isinstance(x, dict)}
-    item = item_map.get(item_key)
+    item = get_effective_item(item_key, project_key=project_key)
     if not item:
         raise ValueError(f"source item not found: {item_key}")
 
@@ -401,11 +536,34 @@ def unified_search_by_item_payload(
     }
 
     def _push(u: str, *, ref: dict[str, Any]) -> None:
-        if u and u not in candidates:
+        # candidate_refs doubles as the seen-set for candidates.
+        if u and u not in candidate_refs:
             candidates.append(u)
             candidate_refs[u] = ref
 
     joined_q = quote_plus(" ".join(terms)) if terms else ""
+    # Entries of one item can point at the same feed/sitemap/search URL; fetch+parse each once.
+    # The cache is per call, so (entry_type, fetch_url) is enough: terms are fixed here.
+    fetch_cache: dict[tuple[str, str], Future] = {}
+    fetch_cache_lock = threading.Lock()
+    # One keep-alive pool for every fetch of this call: entries of an item usually share hosts,
+    # so later requests skip the TCP/TLS handshake.
+    http_session = make_pooled_session(_FETCH_POOL_SIZE)
+
+    def _fetch_urls_once(etype: str, fetch_url: str, load: Callable[[], list[str]]) -> list[str]:
+        key = (etype, fetch_url)
+        with fetch_cache_lock:
+            fut = fetch_cache.get(key)
+            owner = fut is None
+            if owner:
+                fut = Future()
+                fetch_cache[key] = fut
+        if owner:
+            try:
+                fut.set_result(load())
+            except BaseException as exc:  # noqa: BLE001
+                fut.set_exception(exc)
+        return fut.result()
 
     def _process_site_entry(su: str) -> dict[str, Any]:
         local_errors: list[dict[str, str]] = []
@@ -447,8 +605,13 @@ def unified_search_by_item_payload(
                     local_candidates.append((u, ref))
 
             if etype == "rss":
-                xml_text, _ = fetch_html(base_url, timeout=probe_timeout, retries=1)
-                urls = _extract_urls_from_rss_xml(xml_text)
+                urls = _fetch_urls_once(
+                    etype,
+                    base_url,
+                    lambda: _extract_urls_from_rss_xml(
+                        fetch_html(base_url, timeout=probe_timeout, retries=1, session=http_session)[0]
+                    ),
+                )
                 picked, used_fallback = _filter_urls_by_terms_with_fallback(
                     urls,
                     terms,
@@ -472,11 +635,16 @@ def unified_search_by_item_payload(
                 for u in picked:
                     _push_local(u, ref={"site_entry_url": base_url, "entry_type": etype, "entry_domain": entry_domain, "tool": "rss"})
             elif etype == "sitemap":
-                urls = _collect_sitemap_urls(
-                    sitemap_url=base_url,
-                    timeout=probe_timeout,
-                    max_depth=max(0, int(sitemap_max_depth)),
-                    max_sitemaps=max(1, int(sitemap_max_sitemaps)),
+                urls = _fetch_urls_once(
+                    etype,
+                    base_url,
+                    lambda: _collect_sitemap_urls(
+                        sitemap_url=base_url,
+                        timeout=probe_timeout,
+                        max_depth=max(0, int(sitemap_max_depth)),
+                        max_sitemaps=max(1, int(sitemap_max_sitemaps)),
+                        session=http_session,
+                    ),
                 )
                 picked, used_fallback = _filter_urls_by_terms_with_fallback(
                     urls,
@@ -508,8 +676,13 @@ def unified_search_by_item_payload(
                 if "{{q}}" not in tpl:
                     raise ValueError("search_template requires template containing {{q}}")
                 url = tpl.replace("{{q}}", joined_q).replace("{{page}}", "1")
-                html, _ = fetch_html(url, timeout=probe_timeout, retries=1)
-                urls = _extract_urls_from_html(html, base_url=url)
+                urls = _fetch_urls_once(
+                    etype,
+                    url,
+                    lambda: _extract_urls_from_html(
+                        fetch_html(url, timeout=probe_timeout, retries=1, session=http_session)[0], base_url=url
+                    ),
+                )
                 picked, used_fallback = _filter_urls_by_terms_with_fallback(
                     urls,
                     terms,
@@ -542,8 +715,8 @@ def unified_search_by_item_payload(
             local_errors.append({"site_url": su, "error": str(exc)})
         return {"entry": None, "candidates": local_candidates, "errors": local_errors, "stats": local_stats}
 
-    max_workers = max(1, min(8, len(site_entry_urls)))
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+    max_workers = max(1, min(_SITE_ENTRY_WORKERS, len(site_entry_urls)))
+    with http_session, ThreadPoolExecutor(max_workers=max_workers) as ex:
         futures = [ex.submit(_process_site_entry, su) for su in site_entry_urls]
         for fut in as_completed(futures):
             res = fut.result()
@@ -582,21 +755,14 @@ def unified_search_by_item_payload(
 
     written: dict[str, int] | None = None
     if write_to_pool and candidates:
-        new_count = 0
-        skipped = 0
-        for u in candidates:
-            ref = candidate_refs.get(u) or {}
-            ok = append_url(
-                url=u,
-                source=pool_source,
-                source_ref={"item_key": item_key, "query_terms": terms, **ref},
-                scope=pool_scope,
-                project_key=project_key,
-            )
-            if ok:
-                new_count += 1
-            else:
-                skipped += 1
+        flags = append_urls(
+            [(u, {"item_key": item_key, "query_terms": terms, **(candidate_refs.get(u) or {})}) for u in candidates],
+            pool_source,
+            scope=pool_scope,
+            project_key=project_key,
+        )
+        new_count = sum(1 for ok in flags.values() if ok)
+        skipped = len(candidates) - new_count
         written = {"urls_new": new_count, "urls_skipped": skipped}
 
     ingest_result: dict[str, Any] | None = None
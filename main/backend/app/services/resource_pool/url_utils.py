@@ -3,47 +3,47 @@
 from __future__ import annotations
 
 import re
-from urllib.parse import urlparse, urlunparse
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit
+
+
+_TEXT_URL_RE = re.compile(r"https?://[^\s<>\"')\]]+", re.IGNORECASE)
 
 
 def extract_urls_from_text(text: str | None) -> list[str]:
-    """Extract http/https URLs from text. Filters out data:, mailto:, etc."""
+    """Extract http/https URLs from text, trimming trailing sentence punctuation."""
     if not text or not isinstance(text, str):
         return []
-    pattern = re.compile(
-        r"https?://[^\s<>\"')\]]+",
-        re.IGNORECASE,
-    )
-    found = pattern.findall(text)
-    result = []
-    for url in found:
-        url = url.rstrip(".,;:!?")
-        if url.lower().startswith(("data:", "mailto:", "javascript:")):
-            continue
-        result.append(url)
-    return result
+    # Every match starts with http(s)://, so data:/mailto:/javascript: links can never appear here.
+    return [url.rstrip(".,;:!?") for url in _TEXT_URL_RE.findall(text)]
 
 
 def extract_urls_from_json(obj: object) -> list[str]:
     """Recursively extract URL-like strings from JSON/dict structure."""
     seen: set[str] = set()
     result: list[str] = []
-
-    def _walk(o: object) -> None:
+    add_seen = seen.add
+    append = result.append
+    # Explicit stack instead of recursion; children are pushed reversed to keep document order.
+    stack: list[object] = [obj]
+    pop = stack.pop
+    while stack:
+        o = pop()
         if isinstance(o, str):
-            if re.match(r"^https?://", o, re.I) and o.strip() not in seen:
-                norm = normalize_url(o.strip())
-                if norm and norm not in seen:
-                    seen.add(norm)
-                    result.append(norm)
+            head = o[:8].lower()
+            if not (head.startswith("http://") or head == "https://"):
+                continue
+            s = o.strip()
+            if s in seen:
+                continue
+            norm = normalize_url(s)
+            if norm and norm not in seen:
+                add_seen(norm)
+                append(norm)
         elif isinstance(o, dict):
-            for v in o.values():
-                _walk(v)
+            stack.extend(reversed(list(o.values())))
         elif isinstance(o, (list, tuple)):
-            for item in o:
-                _walk(item)
-
-    _walk(obj)
+            stack.extend(reversed(o))
     return result
 
 
@@ -51,28 +51,43 @@ def normalize_url(url: str) -> str | None:
     """Normalize URL: remove fragment, strip. Return None if invalid."""
     if not url or not isinstance(url, str):
         return None
+    return _normalize_url_cached(url)
+
+
+@lru_cache(maxsize=65536)
+def _normalize_url_cached(url: str) -> str | None:
+    # URLs recur heavily across sitemap/RSS/HTML pages, so results are memoized by raw string.
     url = url.strip()
     if not url.lower().startswith(("http://", "https://")):
         return None
     try:
-        parsed = urlparse(url)
-        normalized = urlunparse(
-            (parsed.scheme.lower(), parsed.netloc.lower(), parsed.path or "/", "", "", "")
-        )
+        parts = urlsplit(url)
+        # Drop ;params on the last path segment (what urlparse split off), query and fragment.
+        path = parts.path
+        cut = path.find(";", path.rfind("/"))
+        if cut >= 0:
+            path = path[:cut]
+        normalized = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path or "/", "", ""))
         return normalized.strip("/") or normalized
     except Exception:
         return None
 
 
 def domain_from_url(url: str) -> str | None:
-    """Extract domain from URL. Returns None if invalid."""
-    if not url:
+    """Extract domain from URL (lowercased, leading "www." removed). Returns None if invalid."""
+    if not url or not isinstance(url, str):
         return None
+    return _domain_from_url_cached(url)
+
+
+@lru_cache(maxsize=32768)
+def _domain_from_url_cached(url: str) -> str | None:
+    # Called for every candidate in the per-entry domain filters; hosts repeat across a whole crawl.
     try:
-        parsed = urlparse(url)
-        netloc = parsed.netloc or ""
-        if not netloc:
-            return None
-        return netloc.lower().lstrip("www.")
+        netloc = urlsplit(url).netloc
     except Exception:
         return None
+    if not netloc:
+        return None
+    # removeprefix, not lstrip("www."): lstrip drops any run of 'w'/'.' chars ("wwwidget.io" -> "idget.io").
+    return netloc.lower().removeprefix("www.")
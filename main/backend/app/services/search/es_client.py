@@ -1,10 +1,40 @@
+import threading
+
 from elasticsearch import Elasticsearch
 
 from ...settings.config import settings
 
 
-def get_es_client() -> Elasticsearch:
-    """Create an Elasticsearch client using configured URL."""
-    return Elasticsearch(settings.es_url)
+# Pool size of the shared client (per node); sized for the API workers plus Celery indexing threads.
+_CONNECTIONS_PER_NODE = 25
+_REQUEST_TIMEOUT_S = 10
+
+# (es_url, client) swapped as one tuple so readers never see a client paired with another URL.
+_client: tuple[str, Elasticsearch] | None = None
+_client_lock = threading.Lock()
 
 
+def get_es_client() -> Elasticsearch:
+    """Return the process-wide Elasticsearch client for the configured URL.
+
+    The client is shared so its connection pool (and the ensure_indices memo) is reused
+    across requests; it is rebuilt only when settings.es_url changes.
+    """
+    global _client
+    url = settings.es_url
+    current = _client
+    if current is not None and current[0] == url:
+        return current[1]
+    with _client_lock:
+        if _client is None or _client[0] != url:
+            _client = (
+                url,
+                Elasticsearch(
+                    url,
+                    http_compress=True,
+                    request_timeout=_REQUEST_TIMEOUT_S,
+                    retry_on_timeout=True,
+                    connections_per_node=_CONNECTIONS_PER_NODE,
+                ),
+            )
+        return _client[1]
@@ -6,6 +6,7 @@ from typing import Optional
 import logging
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from ...models.base import SessionLocal
 from ...models.entities import SearchHistory
 
@@ -16,25 +17,20 @@ logger = logging.getLogger(__name__)
 def get_last_search_time(topic: str) -> Optional[datetime]:
     """获取指定主题的上次搜索时间"""
     with SessionLocal() as session:
-        history = session.execute(
-            select(SearchHistory).where(SearchHistory.topic == topic)
-        ).scalar_one_or_none()
-        return history.last_search_time if history else None
+        return session.scalar(
+            select(SearchHistory.last_search_time).where(SearchHistory.topic == topic)
+        )
 
 
 def update_search_time(topic: str) -> None:
-    """更新或创建搜索历史记录"""
+    """更新或创建搜索历史记录（依赖 topic 唯一约束，单条 upsert 语句完成）"""
+    now = datetime.now()
     with SessionLocal() as session:
-        history = session.execute(
-            select(SearchHistory).where(SearchHistory.topic == topic)
-        ).scalar_one_or_none()
-        
-        if history:
-            history.last_search_time = datetime.now()
-        else:
-            history = SearchHistory(topic=topic, last_search_time=datetime.now())
-            session.add(history)
-        
+        stmt = (
+            pg_insert(SearchHistory)
+            .values(topic=topic, last_search_time=now)
+            .on_conflict_do_update(index_elements=["topic"], set_={"last_search_time": now})
+        )
+        session.execute(stmt)
         session.commit()
-        logger.info("search_history: updated topic=%s time=%s", topic, history.last_search_time)
-
+    logger.info("search_history: updated topic=%s time=%s", topic, now)
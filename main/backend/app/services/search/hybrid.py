@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 import logging
+import threading
+import time
+import weakref
 
 import numpy as np
 from elasticsearch import Elasticsearch
@@ -19,51 +23,161 @@ logger = logging.getLogger(__name__)
 
 _ES_INDEX = "policy_docs_es"
 
+# 服务端RRF只有在索引内全部分块都带向量时才可用：旧文档缺 embedding 时 kNN 一路静默无命中，
+# pgvector 的结果也不会参与融合。按客户端缓存检查结果（含 rrf 调用失败），TTL 后重新检查
+_RRF_CHECK_TTL_S = 300.0
+_rrf_ready_cache: "weakref.WeakKeyDictionary[Elasticsearch, tuple[float, bool]]" = weakref.WeakKeyDictionary()
+_rrf_ready_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1024)
+def _embed_query_cached(provider: str, model: str, query: str) -> tuple[float, ...]:
+    return tuple(get_embeddings().embed_query(query))
+
+
+def _embed_query(query: str) -> List[float]:
+    """查询向量按 (provider, model, query) 缓存，重复查询不再调用嵌入接口"""
+    return list(_embed_query_cached(settings.llm_provider, settings.embedding_model, query))
+
+
+def _bm25_query(query: str, state: str | None) -> dict:
+    query_body: dict = {"must": [{"multi_match": {"query": query, "fields": ["title^3", "summary^2", "text"]}}]}
+    if state:
+        # filter 上下文不参与打分，且可被 ES 缓存
+        query_body["filter"] = [{"term": {"state": state}}]
+    return {"bool": query_body}
+
+
+def _hit_from_es(hit: dict, mode: str) -> dict:
+    source = hit.get("_source", {})
+    return {
+        "document_id": source.get("document_id"),
+        "score": hit.get("_score", 0.0),
+        "chunk_index": source.get("chunk_index"),
+        "title": source.get("title"),
+        "summary": source.get("summary"),
+        "text": source.get("text"),
+        "highlight": hit.get("highlight", {}).get("text", []),
+        "state": source.get("state"),
+        "publish_date": source.get("publish_date"),
+        "mode": mode,
+    }
+
+
+def _bm25_body(query: str, state: str | None, top_k: int) -> dict:
+    return {
+        "size": top_k,
+        "query": _bm25_query(query, state),
+        "highlight": {"fields": {"text": {"number_of_fragments": 1}}},
+    }
+
 
 def bm25_search(es: Elasticsearch, query: str, state: str | None, top_k: int) -> List[dict]:
-    must = [{"multi_match": {"query": query, "fields": ["title^3", "summary^2", "text"]}}]
+    response = es.search(index=_ES_INDEX, body=_bm25_body(query, state, top_k))
+    return [_hit_from_es(hit, "bm25") for hit in response.get("hits", {}).get("hits", [])]
+
+
+def _set_rrf_ready(es: Elasticsearch, ready: bool) -> None:
+    with _rrf_ready_lock:
+        _rrf_ready_cache[es] = (time.monotonic(), ready)
+
+
+def _rrf_ready(es: Elasticsearch) -> bool:
+    """索引非空且每个分块都已回填 embedding 时才走服务端RRF；一次 size=0 查询同时拿到总数与带向量数"""
+    with _rrf_ready_lock:
+        hit = _rrf_ready_cache.get(es)
+    if hit is not None and time.monotonic() - hit[0] < _RRF_CHECK_TTL_S:
+        return hit[1]
+    try:
+        response = es.search(
+            index=_ES_INDEX,
+            body={
+                "size": 0,
+                "track_total_hits": True,
+                "aggs": {"with_embedding": {"filter": {"exists": {"field": "embedding"}}}},
+            },
+        )
+        total = int(response["hits"]["total"]["value"])
+        with_embedding = int(response["aggregations"]["with_embedding"]["doc_count"])
+        ready = total > 0 and with_embedding == total
+    except Exception as e:
+        logger.info(f"服务端RRF可用性检查失败，按不可用处理: {e}")
+        ready = False
+    _set_rrf_ready(es, ready)
+    return ready
+
+
+def rrf_search(
+    es: Elasticsearch,
+    query: str,
+    state: str | None,
+    top_k: int,
+    k: int = 60,
+    *,
+    embedding: Optional[List[float]] = None,
+) -> List[dict]:
+    """在 ES 内一次完成 BM25 + kNN 检索并用 RRF 融合（需要 8.14+ 且索引含 embedding 字段）"""
+    if embedding is None:
+        embedding = _embed_query(query)
+
+    knn = {
+        "field": "embedding",
+        "query_vector": embedding,
+        "k": top_k,
+        "num_candidates": top_k * 4,
+    }
     if state:
-        must.append({"term": {"state": state}})
+        knn["filter"] = {"term": {"state": state}}
 
     response = es.search(
         index=_ES_INDEX,
         body={
             "size": top_k,
-            "query": {"bool": {"must": must}},
+            "retriever": {
+                "rrf": {
+                    "retrievers": [
+                        {"standard": {"query": _bm25_query(query, state)}},
+                        {"knn": knn},
+                    ],
+                    "rank_window_size": top_k,
+                    "rank_constant": k,
+                }
+            },
+            "_source": {"excludes": ["embedding"]},
             "highlight": {"fields": {"text": {"number_of_fragments": 1}}},
         },
     )
 
-    hits = []
+    # 命中的是分块，同一文档只保留排名最高的一块，与客户端融合的结果口径一致
+    hits: List[dict] = []
+    seen_documents: set = set()
     for hit in response.get("hits", {}).get("hits", []):
-        source = hit.get("_source", {})
-        hits.append(
-            {
-                "document_id": source.get("document_id"),
-                "score": hit.get("_score", 0.0),
-                "chunk_index": source.get("chunk_index"),
-                "title": source.get("title"),
-                "summary": source.get("summary"),
-                "text": source.get("text"),
-                "highlight": hit.get("highlight", {}).get("text", []),
-                "state": source.get("state"),
-                "publish_date": source.get("publish_date"),
-                "mode": "bm25",
-            }
-        )
+        item = _hit_from_es(hit, "hybrid")
+        if item["document_id"] in seen_documents:
+            continue
+        seen_documents.add(item["document_id"])
+        item["fusion_score"] = item["score"]
+        hits.append(item)
     return hits
 
 
-def vector_search(query: str, state: str | None, top_k: int) -> List[dict]:
-    try:
-        embedding = get_embeddings().embed_query(query)
-    except Exception as e:
-        # 如果无法生成嵌入（API key无效等），返回空结果
-        logger.warning(f"无法生成向量嵌入，跳过向量搜索: {e}")
-        return []
+def vector_search(
+    query: str,
+    state: str | None,
+    top_k: int,
+    *,
+    embedding: Optional[List[float]] = None,
+) -> List[dict]:
+    if embedding is None:
+        try:
+            embedding = _embed_query(query)
+        except Exception as e:
+            # 如果无法生成嵌入（API key无效等），返回空结果
+            logger.warning(f"无法生成向量嵌入，跳过向量搜索: {e}")
+            return []
     
     with SessionLocal() as session:
-        vector = np.array(embedding)
+        vector = np.asarray(embedding, dtype=np.float32)
 
         stmt = (
             select(Embedding, Document)
@@ -75,13 +189,19 @@ def vector_search(query: str, state: str | None, top_k: int) -> List[dict]:
             stmt = stmt.filter(Document.state == state)
 
         results = session.execute(stmt.limit(top_k)).all()
+        if not results:
+            return []
+
+        # 一次矩阵乘法算出全部得分，避免逐行分配数组
+        matrix = np.asarray([row.vector for row, _ in results], dtype=np.float32)
+        scores = matrix @ vector
 
         hits = []
-        for embedding_row, document in results:
+        for (_, document), score in zip(results, scores):
             hits.append(
                 {
                     "document_id": document.id,
-                    "score": float(np.dot(vector, np.array(embedding_row.vector))),
+                    "score": float(score),
                     "chunk_index": None,
                     "title": document.title,
                     "summary": document.summary,
@@ -129,10 +249,28 @@ def hybrid_search(query: str, state: str | None, top_k: int, mode: str) -> List[
         # 如果向量搜索失败（无API key等），返回空结果而不是报错
         return results
 
-    # hybrid模式：尝试融合BM25和向量搜索
+    # 查询向量只算一次，供服务端RRF与 pgvector 两条路径共用
+    try:
+        embedding: Optional[List[float]] = _embed_query(query)
+    except Exception as e:
+        logger.warning(f"无法生成向量嵌入，仅返回BM25搜索结果: {e}")
+        return bm25_search(es, query, state, top_k)
+
+    # hybrid模式：向量已回填时优先由ES服务端融合；不支持（旧版本/无许可）或无命中时回退到客户端融合
+    if _rrf_ready(es):
+        try:
+            hits = rrf_search(es, query, state, top_k, embedding=embedding)
+            if hits:
+                return hits
+            logger.info("服务端RRF无命中，回退到客户端融合")
+        except Exception as e:
+            # 记住失败，TTL 内不再为每次查询白跑一次请求
+            _set_rrf_ready(es, False)
+            logger.info(f"服务端RRF检索不可用，回退到客户端融合: {e}")
+
     bm25_hits = bm25_search(es, query, state, top_k)
     try:
-        vector_hits = vector_search(query, state, top_k)
+        vector_hits = vector_search(query, state, top_k, embedding=embedding)
         # 如果向量搜索有结果，进行融合
         if vector_hits:
             return reciprocal_rank_fusion(bm25_hits, vector_hits)
@@ -1,98 +1,251 @@
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable
+
 from elasticsearch import Elasticsearch
 
+from ...settings.config import settings
 
-def ensure_indices(es: Elasticsearch) -> dict:
-    """Create indices with minimal mappings if they do not exist."""
-    results: dict[str, str] = {}
 
-    policy_index = "policy_docs_es"
-    market_index = "market_stats_es"
-    metric_index = "market_metric_points_es"
-    ecom_index = "price_observations_es"
-
-    if not es.indices.exists(index=policy_index):
-        es.indices.create(
-            index=policy_index,
-            mappings={
-                "properties": {
-                    "project_key": {"type": "keyword"},
-                    "topic": {"type": "keyword"},
-                    "domain": {"type": "keyword"},
-                    "state": {"type": "keyword"},
-                    "title": {"type": "text"},
-                    "status": {"type": "keyword"},
-                    "publish_date": {"type": "date"},
-                    "summary": {"type": "text"},
-                    "content": {"type": "text"},
-                    "keywords": {"type": "keyword"},
-                }
-            },
-        )
-        results[policy_index] = "created"
-    else:
-        results[policy_index] = "exists"
-
-    if not es.indices.exists(index=market_index):
-        es.indices.create(
-            index=market_index,
-            mappings={
-                "properties": {
-                    "project_key": {"type": "keyword"},
-                    "topic": {"type": "keyword"},
-                    "domain": {"type": "keyword"},
-                    "state": {"type": "keyword"},
-                    "date": {"type": "date"},
-                    "sales_volume": {"type": "double"},
-                    "revenue": {"type": "double"},
-                    "jackpot": {"type": "double"},
-                    "ticket_price": {"type": "double"},
-                    "yoy": {"type": "double"},
-                    "mom": {"type": "double"},
-                }
-            },
-        )
-        results[market_index] = "created"
-    else:
-        results[market_index] = "exists"
-
-    if not es.indices.exists(index=metric_index):
-        es.indices.create(
-            index=metric_index,
-            mappings={
-                "properties": {
-                    "project_key": {"type": "keyword"},
-                    "metric_key": {"type": "keyword"},
-                    "date": {"type": "date"},
-                    "value": {"type": "double"},
-                    "unit": {"type": "keyword"},
-                    "currency": {"type": "keyword"},
-                    "source_uri": {"type": "keyword"},
-                }
-            },
-        )
-        results[metric_index] = "created"
-    else:
-        results[metric_index] = "exists"
-
-    if not es.indices.exists(index=ecom_index):
-        es.indices.create(
-            index=ecom_index,
-            mappings={
-                "properties": {
-                    "project_key": {"type": "keyword"},
-                    "product_id": {"type": "long"},
-                    "captured_at": {"type": "date"},
-                    "price": {"type": "double"},
-                    "currency": {"type": "keyword"},
-                    "availability": {"type": "keyword"},
-                    "source_uri": {"type": "keyword"},
-                }
-            },
+_POLICY_INDEX = "policy_docs_es"
+_MARKET_INDEX = "market_stats_es"
+_METRIC_INDEX = "market_metric_points_es"
+_ECOM_INDEX = "price_observations_es"
+
+_POLICY_MAPPINGS: dict = {
+    "properties": {
+        "project_key": {"type": "keyword"},
+        "topic": {"type": "keyword"},
+        "domain": {"type": "keyword"},
+        "state": {"type": "keyword"},
+        "title": {"type": "text"},
+        "status": {"type": "keyword"},
+        "publish_date": {"type": "date"},
+        # No phrase queries run on the long text fields; keep term freqs for BM25, drop positions.
+        "summary": {"type": "text", "index_options": "freqs"},
+        "content": {"type": "text", "index_options": "freqs"},
+        "keywords": {"type": "keyword"},
+    }
+}
+
+_MARKET_MAPPINGS: dict = {
+    "properties": {
+        "project_key": {"type": "keyword"},
+        "topic": {"type": "keyword"},
+        "domain": {"type": "keyword"},
+        "state": {"type": "keyword"},
+        "date": {"type": "date"},
+        "sales_volume": {"type": "double"},
+        "revenue": {"type": "double"},
+        "jackpot": {"type": "double"},
+        "ticket_price": {"type": "double"},
+        "yoy": {"type": "double"},
+        "mom": {"type": "double"},
+    }
+}
+
+_METRIC_MAPPINGS: dict = {
+    "properties": {
+        "project_key": {"type": "keyword"},
+        "metric_key": {"type": "keyword"},
+        "date": {"type": "date"},
+        "value": {"type": "double"},
+        "unit": {"type": "keyword"},
+        "currency": {"type": "keyword"},
+        "source_uri": {"type": "keyword"},
+    }
+}
+
+_ECOM_MAPPINGS: dict = {
+    "properties": {
+        "project_key": {"type": "keyword"},
+        "product_id": {"type": "long"},
+        "captured_at": {"type": "date"},
+        "price": {"type": "double"},
+        "currency": {"type": "keyword"},
+        "availability": {"type": "keyword"},
+        "source_uri": {"type": "keyword"},
+    }
+}
+
+# Built once at import; treat as read-only (the ES client cannot serialize MappingProxyType).
+_INDEX_MAPPINGS: dict[str, dict] = {
+    _POLICY_INDEX: _POLICY_MAPPINGS,
+    _MARKET_INDEX: _MARKET_MAPPINGS,
+    _METRIC_INDEX: _METRIC_MAPPINGS,
+    _ECOM_INDEX: _ECOM_MAPPINGS,
+}
+
+# Index-time sort on the recency field so time-bounded queries can skip whole segments.
+# index.sort.* is fixed at creation; existing indices keep their layout until reindexed.
+_INDEX_SORT_FIELDS: dict[str, str] = {
+    _POLICY_INDEX: "publish_date",
+    _MARKET_INDEX: "date",
+    _METRIC_INDEX: "date",
+    _ECOM_INDEX: "captured_at",
+}
+
+# Stored-field codec; only the policy index carries large summary/content text worth compressing harder.
+_INDEX_CODECS: dict[str, str] = {
+    _POLICY_INDEX: "best_compression",
+}
+
+# Append-mostly time-series indices do not need 1s visibility; fewer refreshes mean fewer tiny segments.
+_INDEX_REFRESH_INTERVALS: dict[str, str] = {
+    _METRIC_INDEX: "30s",
+    _ECOM_INDEX: "30s",
+}
+
+
+# Composable templates (one per index, exact-name pattern) so an index auto-created by a
+# bulk write before ensure_indices ran still gets these mappings instead of dynamic ones.
+_TEMPLATE_PREFIX = "market_research_"
+_TEMPLATE_VERSION = 5
+_TEMPLATE_PRIORITY = 200
+
+# Cold-start template PUTs / index creates are independent; the client's HTTP pool is thread-safe.
+_ENSURE_WORKERS = 4
+
+# Clients that already went through ensure_indices; weak keys so dropped clients are not pinned.
+_ENSURED_CLIENTS: "weakref.WeakKeyDictionary[Elasticsearch, dict[str, str]]" = weakref.WeakKeyDictionary()
+_ENSURE_LOCK = threading.Lock()
+
+
+def _policy_embedding_mapping(dims: int) -> dict:
+    return {
+        "type": "dense_vector",
+        "dims": dims,
+        "index": True,
+        "similarity": "cosine",
+    }
+
+
+@lru_cache(maxsize=4)
+def _policy_mappings_with_embedding(dims: int) -> dict:
+    return {"properties": {**_POLICY_MAPPINGS["properties"], "embedding": _policy_embedding_mapping(dims)}}
+
+
+def _mappings_for(index: str) -> dict:
+    if index == _POLICY_INDEX:
+        # dims follow the configured embedding model, so the policy body is built once per dims value.
+        return _policy_mappings_with_embedding(settings.embedding_dim)
+    return _INDEX_MAPPINGS[index]
+
+
+def _settings_for(index: str) -> dict:
+    index_settings = {"sort.field": _INDEX_SORT_FIELDS[index], "sort.order": "desc"}
+    codec = _INDEX_CODECS.get(index)
+    if codec:
+        index_settings["codec"] = codec
+    refresh_interval = _INDEX_REFRESH_INTERVALS.get(index)
+    if refresh_interval:
+        index_settings["refresh_interval"] = refresh_interval
+    return {"index": index_settings}
+
+
+def _run_concurrently(calls: list[Callable[[], object]]) -> None:
+    if len(calls) <= 1:
+        for call in calls:
+            call()
+        return
+    with ThreadPoolExecutor(max_workers=min(_ENSURE_WORKERS, len(calls))) as pool:
+        # result() re-raises the first failure, as the sequential loop did.
+        for future in [pool.submit(call) for call in calls]:
+            future.result()
+
+
+def _template_name(index: str) -> str:
+    return f"{_TEMPLATE_PREFIX}{index}"
+
+
+def _template_meta(index: str) -> dict:
+    meta = {"managed_by": "ensure_indices"}
+    if index == _POLICY_INDEX:
+        meta["embedding_dim"] = settings.embedding_dim
+    return meta
+
+
+def _ensure_templates(es: Elasticsearch) -> None:
+    """PUT the per-index templates that are missing or stale (version / _meta mismatch)."""
+    response = es.options(ignore_status=404).indices.get_index_template(name=f"{_TEMPLATE_PREFIX}*")
+    current = {
+        item.get("name"): item.get("index_template") or {}
+        for item in (response.get("index_templates") or [])
+    }
+    puts: list[Callable[[], object]] = []
+    for index in _INDEX_MAPPINGS:
+        name = _template_name(index)
+        meta = _template_meta(index)
+        existing = current.get(name)
+        if existing and existing.get("version") == _TEMPLATE_VERSION and existing.get("_meta") == meta:
+            continue
+        puts.append(
+            partial(
+                es.indices.put_index_template,
+                name=name,
+                index_patterns=[index],
+                template={"mappings": _mappings_for(index), "settings": _settings_for(index)},
+                priority=_TEMPLATE_PRIORITY,
+                version=_TEMPLATE_VERSION,
+                meta=meta,
+            )
         )
-        results[ecom_index] = "created"
-    else:
-        results[ecom_index] = "exists"
+    _run_concurrently(puts)
+
+
+def ensure_indices(es: Elasticsearch, *, force: bool = False) -> dict:
+    """Create indices with minimal mappings if they do not exist.
+
+    Memoized per client: once a client has ensured the indices, later calls report them as
+    existing without touching the cluster. Pass the shared client from es_client.get_es_client()
+    so the memo (and its connection pool) is reused across requests. force=True always checks
+    the cluster (recreating indices deleted at runtime) and refreshes the memo.
+    """
+    cached = None if force else _ENSURED_CLIENTS.get(es)
+    if cached is not None:
+        return dict(cached)
+    with _ENSURE_LOCK:
+        cached = None if force else _ENSURED_CLIENTS.get(es)
+        if cached is not None:
+            return dict(cached)
+        results = _ensure_indices_uncached(es)
+        _ENSURED_CLIENTS[es] = {index: "exists" for index in results}
+        return results
 
-    return results
 
+def _ensure_indices_uncached(es: Elasticsearch) -> dict:
+    results: dict[str, str] = {}
+
+    _ensure_templates(es)
+
+    # One GET for all indices (existence + current mappings) instead of a HEAD per index.
+    existing = es.indices.get(
+        index=",".join(_INDEX_MAPPINGS),
+        ignore_unavailable=True,
+        allow_no_indices=True,
+    )
 
+    writes: list[Callable[[], object]] = []
+    for index in _INDEX_MAPPINGS:
+        if index not in existing:
+            writes.append(partial(es.indices.create, index=index, mappings=_mappings_for(index), settings=_settings_for(index)))
+            results[index] = "created"
+            continue
+        if index == _POLICY_INDEX:
+            properties = existing[index].get("mappings", {}).get("properties", {})
+            if "embedding" not in properties:
+                writes.append(
+                    partial(
+                        es.indices.put_mapping,
+                        index=index,
+                        properties={"embedding": _policy_embedding_mapping(settings.embedding_dim)},
+                    )
+                )
+                results[index] = "updated"
+                continue
+        results[index] = "exists"
+
+    _run_concurrently(writes)
+    return results
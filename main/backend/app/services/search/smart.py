@@ -1,9 +1,12 @@
 """智能搜索模块：自动增量搜索"""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import threading
+import time
 
 from .web import search_sources
 from .history import get_last_search_time, update_search_time
@@ -11,6 +14,56 @@ from .history import get_last_search_time, update_search_time
 
 logger = logging.getLogger(__name__)
 
+# 进程内缓存各主题的上次搜索时间，热点主题在 TTL 内不再查库
+_LAST_TIME_TTL_S = 3600.0
+_LAST_TIME_CACHE_MAX = 4096
+_last_time_cache: dict[str, tuple[float, Optional[datetime]]] = {}
+_last_time_lock = threading.Lock()
+
+# 当天 UTC 日期缓存 (日期, 失效的 monotonic 时间)，最多 60 秒且不跨过 UTC 零点
+_TODAY_TTL_S = 60.0
+_today_cache: Optional[tuple[date, float]] = None
+
+# 搜索历史写库放到后台，不占用 smart_search 的返回路径（进程内缓存已即时更新）
+_history_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="smart-hist")
+
+
+def _cached_last_search_time(topic: str) -> Optional[datetime]:
+    now_ts = time.monotonic()
+    with _last_time_lock:
+        hit = _last_time_cache.get(topic)
+    if hit is not None and now_ts - hit[0] < _LAST_TIME_TTL_S:
+        return hit[1]
+    last_time = get_last_search_time(topic)
+    _remember_search_time(topic, last_time, now_ts)
+    return last_time
+
+
+def _remember_search_time(topic: str, last_time: Optional[datetime], now_ts: float | None = None) -> None:
+    with _last_time_lock:
+        if len(_last_time_cache) >= _LAST_TIME_CACHE_MAX and topic not in _last_time_cache:
+            _last_time_cache.clear()
+        _last_time_cache[topic] = (time.monotonic() if now_ts is None else now_ts, last_time)
+
+
+def _update_search_time_quietly(topic_key: str) -> None:
+    try:
+        update_search_time(topic_key)
+    except Exception:  # noqa: BLE001
+        logger.warning("smart_search: update_search_time failed topic=%s", topic_key, exc_info=True)
+
+
+def _today_utc() -> date:
+    global _today_cache
+    now_ts = time.monotonic()
+    cached = _today_cache
+    if cached is not None and now_ts < cached[1]:
+        return cached[0]
+    now = datetime.now(timezone.utc)
+    tomorrow = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc)
+    _today_cache = (now.date(), now_ts + min(_TODAY_TTL_S, (tomorrow - now).total_seconds()))
+    return now.date()
+
 
 def smart_search(topic: str, days_back: int = 30, max_results: int = 10, language: str = "en", provider: str = "auto") -> List[dict]:
     """智能搜索：自动判断是否增量，只返回新信息
@@ -25,19 +78,18 @@ def smart_search(topic: str, days_back: int = 30, max_results: int = 10, languag
     Returns:
         搜索结果列表
     """
+    # 历史记录与缓存统一使用规范化主题键；对外搜索仍使用原始 topic
+    topic_key = topic.strip().casefold()
+
     # 1. 检查上次搜索时间
-    last_time = get_last_search_time(topic)
+    last_time = _cached_last_search_time(topic_key)
     
     # 2. 确定搜索范围
     if last_time:
         # 增量搜索：计算距离上次搜索的天数
-        now = datetime.now()
-        # 处理时区：如果last_time有时区信息，转换为naive datetime
-        if last_time.tzinfo:
-            last_time_naive = last_time.replace(tzinfo=None)
-        else:
-            last_time_naive = last_time
-        days_since = (now - last_time_naive).days
+        # 统一按 UTC 日历日比较：aware 时间换算到 UTC，naive 时间视为 UTC
+        last_utc = last_time.astimezone(timezone.utc) if last_time.tzinfo else last_time.replace(tzinfo=timezone.utc)
+        days_since = (_today_utc() - last_utc.date()).days
         if days_since > 0:
             logger.info("smart_search: incremental search topic=%s days_since=%d", topic, days_since)
             # 只搜索上次搜索后的新内容
@@ -48,6 +100,7 @@ def smart_search(topic: str, days_back: int = 30, max_results: int = 10, languag
                 provider=provider,
                 days_back=min(days_since, days_back),
                 exclude_existing=True,
+                use_filter_context=True,
             )
         else:
             # 同一天内搜索，返回空结果避免重复
@@ -63,11 +116,13 @@ def smart_search(topic: str, days_back: int = 30, max_results: int = 10, languag
             provider=provider,
             days_back=days_back,
             exclude_existing=True,
+            use_filter_context=True,
         )
     
     # 3. 更新搜索历史
     if results:
-        update_search_time(topic)
+        _remember_search_time(topic_key, datetime.now(timezone.utc))
+        _history_executor.submit(_update_search_time_quietly, topic_key)
     
     return results
 
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
-from typing import Any, List, Dict, Set, Optional
-from datetime import datetime, timedelta
+from typing import Any, Callable, List, Dict, Set, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import copy
+import functools
 import os
 import logging
+import threading
 import time
 import re
 
+import numpy as np
 from duckduckgo_search import DDGS
 from duckduckgo_search.exceptions import RatelimitException
 from ..http.client import default_http_client
-from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
+from urllib.parse import urlparse, urlsplit, parse_qsl, urlencode, urlunparse
 from sqlalchemy import select
 
-from ..llm.provider import get_chat_model
+from ..llm.cache import get_cached_prompt_output, prompt_cache_key, store_prompt_output
+from ..llm.provider import get_chat_model, get_embeddings
 from ..llm.config_loader import get_llm_config, format_prompt_template
 from ...settings.config import settings
 from ...models.base import SessionLocal
@@ -40,6 +46,8 @@ _TRACKING_QUERY_PARAMS = {
     "fromsource",
     "sc_source",
 }
+# 按前缀剔除的跟踪参数（utm_* 变体众多；mc_cid/mc_eid 为 Mailchimp）
+_TRACKING_QUERY_PREFIXES = ("utm_", "mc_")
 
 _NUMERIC_INTENT_KEYWORDS = {
     "sales",
@@ -72,46 +80,109 @@ _TRUSTED_DOMAINS = {
 }
 
 
-_BILINGUAL_LANG_MODES = {"bi", "bilingual", "zh-en", "zh_en", "both", "multi", "multilingual"}
+# 关键词生成的 LLM 输出进程内缓存：键包含完整提示词（主题/语言/模板变化即失效）与模型参数
+_LLM_KEYWORD_CACHE_TTL_S = 1800.0
+_LLM_KEYWORD_CACHE_MAX = 512
+# 二级磁盘缓存（SQLite，本机各 worker 共享、重启后保留）
+_LLM_KEYWORD_DISK_TTL_S = 7 * 86400.0
+_llm_keyword_cache: Dict[tuple, tuple[float, str]] = {}
+_llm_keyword_cache_lock = threading.Lock()
+
+# 专题关键词语义缓存：同一 (provider, 专题, 语言, 区分词) 下主题向量余弦相似度达到阈值即复用上次 LLM 结果
+# 仅在精确提示词缓存未命中时查询（嵌入是付费调用）；年份/数字与大写缩写（US、EU 等）必须完全一致
+_TOPIC_SEMANTIC_CACHE_THRESHOLD = 0.97
+_TOPIC_SEMANTIC_CACHE_TTL_S = 86400.0
+_TOPIC_SEMANTIC_CACHE_MAX = 256
+_TOPIC_DISTINCT_TOKEN_RE = re.compile(r"(?<![A-Za-z0-9])(?:\d+|[A-Z]{2,})(?![A-Za-z0-9])")
+# 嵌入调用失败（如未配置嵌入服务）后暂停语义缓存一段时间，避免每次请求都失败一次
+_TOPIC_EMBEDDING_RETRY_S = 300.0
+_topic_embedding_disabled_until = 0.0
+_topic_semantic_cache: List[tuple[float, tuple, np.ndarray, Dict[str, Any]]] = []
+_topic_semantic_cache_lock = threading.Lock()
+
+_FILTER_EXISTING_CHUNK_SIZE = 500
+
+# DDG 兜底检索的财经媒体站点
+_FALLBACK_SITES = ("reuters.com", "bloomberg.com", "wsj.com")
+_FALLBACK_SITE_FILTER = " OR ".join(f"site:{site}" for site in _FALLBACK_SITES)
+
+# 各关键词的搜索 API 请求相互独立，并发发出（Google/DDG 有限流，仍保持串行）
+# 进程内共享一个线程池：并发的多次搜索复用线程，总并发与 HTTP 连接池上限（32）一致
+_KEYWORD_SEARCH_WORKERS = 32
+_keyword_search_executor = ThreadPoolExecutor(max_workers=_KEYWORD_SEARCH_WORKERS, thread_name_prefix="search-kw")
+
+# Google CSE 分页请求并发数（单个关键词最多 10 页）
+_GOOGLE_PAGE_WORKERS = 5
+_google_page_executor = ThreadPoolExecutor(max_workers=_GOOGLE_PAGE_WORKERS, thread_name_prefix="search-gpage")
+
+# GOOGLE_SEARCH_API_KEY 可配置多个（逗号分隔）；触发配额/限流（403/429）的 key 冷却一段时间，期间优先用其他 key
+_GOOGLE_KEY_COOLDOWN_S = 300.0
+_google_key_cooldown: Dict[str, float] = {}
+_google_key_lock = threading.Lock()
+
+# 时间关键词用的当前年份缓存 (年份, 失效的 monotonic 时间)
+_CURRENT_YEAR_TTL_S = 3600.0
+_current_year_cache: Optional[tuple[int, float]] = None
+
+# LLM 逐行输出的关键词：去掉行首的列表符号（- • *）与首尾空白，跳过空行
+_KEYWORD_LINE_RE = re.compile(r"^[ \t\-•*]*([^\s\-•*].*?)\s*$", re.M)
+
+# 已足够具体的主题（≥4 个词且带年份/站点限定/报告类词）直接作为唯一关键词，不再扩展
+_SPECIFIC_TOPIC_MIN_TOKENS = 4
+_SPECIFIC_TOPIC_RE = re.compile(r"(?<!\d)(?:19|20)\d{2}(?!\d)|site:|report|财报|政策", re.I)
+
+# LLM 不可用时的静态关键词后缀
+_FALLBACK_KEYWORD_SUFFIXES: Dict[str, tuple[str, ...]] = {
+    "en": ("regulation", "market", "sales report", "supply chain"),
+    "zh": ("政策", "市场", "销售 报告", "产业链"),
+}
 
+_TOPIC_FOCUS_SUFFIXES: Dict[str, Dict[str, tuple[str, ...]]] = {
+    "zh": {
+        "company": ("公司", "企业", "品牌", "合作", "供应链", "渠道"),
+        "product": ("产品", "型号", "品类", "参数", "发布", "应用场景"),
+        "operation": ("经营", "商业模式", "运营模式", "电商", "平台", "渠道策略"),
+    },
+    "en": {
+        "company": ("company", "brand", "partnership", "supply chain", "channel"),
+        "product": ("product", "model", "category", "specs", "launch", "use case"),
+        "operation": ("operation", "business model", "ecommerce", "platform", "channel strategy"),
+    },
+}
 
-def _base_language(language: str) -> str:
-    lang = (language or "").strip().lower()
-    if lang.startswith("zh"):
-        return "zh"
-    if lang.startswith("en"):
-        return "en"
-    return "en"
+_BILINGUAL_LANG_MODES = frozenset({"bi", "bilingual", "zh-en", "zh_en", "both", "multi", "multilingual"})
 
 
-def _is_bilingual_mode(language: str) -> bool:
-    return (language or "").strip().lower() in _BILINGUAL_LANG_MODES
+@functools.lru_cache(maxsize=32)
+def _normalize_lang(language: Optional[str]) -> tuple[str, bool]:
+    """一次规范化语言参数：返回 (基础语言 zh/en，非 zh 一律按 en, 是否双语模式)"""
+    lang = (language or "").strip().lower()
+    return ("zh" if lang.startswith("zh") else "en"), lang in _BILINGUAL_LANG_MODES
 
 
 def _dedup_keywords(items: List[str]) -> List[str]:
-    out: List[str] = []
-    seen: set[str] = set()
-    for raw in items:
-        kw = str(raw or "").strip()
-        if not kw or kw in seen:
-            continue
-        seen.add(kw)
-        out.append(kw)
-    return out
+    # dict.fromkeys 保序去重
+    return list(dict.fromkeys(kw for kw in (str(raw or "").strip() for raw in items) if kw))
+
+
+def _is_tracking_param(key: str) -> bool:
+    key = key.lower()
+    return key in _TRACKING_QUERY_PARAMS or key.startswith(_TRACKING_QUERY_PREFIXES)
 
 
+@functools.lru_cache(maxsize=4096)
 def _canonicalize_url(url: str) -> str:
     try:
         parsed = urlparse(url)
         query = [
             (key, value)
             for key, value in parse_qsl(parsed.query, keep_blank_values=True)
-            if key.lower() not in _TRACKING_QUERY_PARAMS
+            if not _is_tracking_param(key)
         ]
         canonical_query = urlencode(query)
         return urlunparse((
             parsed.scheme or "https",
-            parsed.netloc,
+            parsed.netloc.lower(),
             parsed.path,
             parsed.params,
             canonical_query,
@@ -121,6 +192,19 @@ def _canonicalize_url(url: str) -> str:
         return url
 
 
+@functools.lru_cache(maxsize=4096)
+def _dedup_key(canonical_link: str) -> str:
+    """去重键：忽略协议、主机大小写、www. 前缀、路径末尾斜杠与查询参数顺序（http://WWW.X/a?b=1&a=2 与 https://x/a/?a=2&b=1 视为同一结果）"""
+    try:
+        parts = urlsplit(canonical_link)
+    except Exception:
+        return canonical_link
+    key = parts.netloc.lower().removeprefix("www.") + parts.path.rstrip("/")
+    if not parts.query:
+        return key
+    return f"{key}?{urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))}"
+
+
 def _contains_numeric_intent(text: str) -> bool:
     if not text:
         return False
@@ -166,45 +250,133 @@ def _extract_domain(url: str) -> str:
         return ""
 
 
+def _keyword_llm_key(prompt: str, model_kwargs: Dict[str, Any]) -> tuple:
+    return (settings.llm_provider, tuple(sorted(model_kwargs.items())), prompt)
+
+
+def _remember_keyword_output(key: tuple, text: str) -> None:
+    with _llm_keyword_cache_lock:
+        if len(_llm_keyword_cache) >= _LLM_KEYWORD_CACHE_MAX and key not in _llm_keyword_cache:
+            _llm_keyword_cache.clear()
+        _llm_keyword_cache[key] = (time.monotonic(), text)
+
+
+def _cached_keyword_output(prompt: str, **model_kwargs: Any) -> Optional[str]:
+    """只查精确提示词缓存（进程内 TTL + 磁盘），未命中返回 None，不调用 LLM"""
+    key = _keyword_llm_key(prompt, model_kwargs)
+    with _llm_keyword_cache_lock:
+        hit = _llm_keyword_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < _LLM_KEYWORD_CACHE_TTL_S:
+        return hit[1]
+    text = get_cached_prompt_output(prompt_cache_key("keyword_generation", *key), _LLM_KEYWORD_DISK_TTL_S)
+    if text and text.strip():
+        _remember_keyword_output(key, text)
+        return text
+    return None
+
+
+def _invoke_keyword_llm(prompt: str, **model_kwargs: Any) -> str:
+    """调用 LLM 生成关键词，相同 (provider, 模型参数, 提示词) 在 TTL 内直接复用上次输出"""
+    text = _cached_keyword_output(prompt, **model_kwargs)
+    if text is not None:
+        return text
+    response = get_chat_model(**model_kwargs).invoke(prompt)
+    text = response.content if hasattr(response, "content") else str(response)
+    if text and text.strip():
+        key = _keyword_llm_key(prompt, model_kwargs)
+        store_prompt_output(prompt_cache_key("keyword_generation", *key), text)
+        _remember_keyword_output(key, text)
+    return text
+
+
+def _unit_embedding(text: str) -> Optional[np.ndarray]:
+    global _topic_embedding_disabled_until
+    if time.monotonic() < _topic_embedding_disabled_until:
+        return None
+    try:
+        vec = np.asarray(get_embeddings().embed_query(text), dtype=np.float32)
+    except Exception:
+        _topic_embedding_disabled_until = time.monotonic() + _TOPIC_EMBEDDING_RETRY_S
+        logger.info("generate_topic_keywords: embedding failed, semantic cache paused", exc_info=True)
+        return None
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm > 0 else None
+
+
+def _topic_semantic_lookup(partition: tuple, vec: np.ndarray) -> Optional[Dict[str, Any]]:
+    now_ts = time.monotonic()
+    with _topic_semantic_cache_lock:
+        _topic_semantic_cache[:] = [e for e in _topic_semantic_cache if now_ts - e[0] < _TOPIC_SEMANTIC_CACHE_TTL_S]
+        candidates = [e for e in _topic_semantic_cache if e[1] == partition]
+    if not candidates:
+        return None
+    scores = np.stack([e[2] for e in candidates]) @ vec
+    best = int(np.argmax(scores))
+    if float(scores[best]) < _TOPIC_SEMANTIC_CACHE_THRESHOLD:
+        return None
+    return copy.deepcopy(candidates[best][3])
+
+
+def _topic_semantic_store(partition: tuple, vec: np.ndarray, result: Dict[str, Any]) -> None:
+    with _topic_semantic_cache_lock:
+        if len(_topic_semantic_cache) >= _TOPIC_SEMANTIC_CACHE_MAX:
+            del _topic_semantic_cache[0]
+        _topic_semantic_cache.append((time.monotonic(), partition, vec, copy.deepcopy(result)))
+
+
+def _fallback_keywords(topic: str, language: str) -> List[str]:
+    suffixes = _FALLBACK_KEYWORD_SUFFIXES["en" if language.lower().startswith("en") else "zh"]
+    return [topic, *(f"{topic} {suffix}" for suffix in suffixes)]
+
+
+def _looks_specific(topic: str) -> bool:
+    return len(topic.split()) >= _SPECIFIC_TOPIC_MIN_TOKENS and bool(_SPECIFIC_TOPIC_RE.search(topic))
+
+
 def generate_keywords(topic: str, language: str = "zh") -> List[str]:
-    if _is_bilingual_mode(language):
+    if _looks_specific(topic):
+        logger.info("generate_keywords: topic already specific, skip expansion topic=%s", topic)
+        return [topic.strip()]
+    return _expand_keywords(topic, language)
+
+
+def _expand_keywords(topic: str, language: str) -> List[str]:
+    """LLM/静态关键词扩展，不做“主题已足够具体”判断（由调用方基于原始主题判断）"""
+    _, bilingual = _normalize_lang(language)
+    if bilingual:
         # Keep bilingual support in prompt-generation layer only (no search execution routing).
+        static_fallback = _dedup_keywords(_fallback_keywords(topic, "zh") + _fallback_keywords(topic, "en"))
         if settings.llm_provider == "openai" and not settings.openai_api_key:
-            return _dedup_keywords(generate_keywords(topic, "zh") + generate_keywords(topic, "en"))
+            return static_fallback
         try:
+            # 固定指令在前、主题在末尾，便于服务端前缀缓存；一次调用同时拿到中英文关键词
             prompt = (
                 "你是一名搜索关键词生成助手。请基于用户主题输出 6~10 个中英文混合的搜索关键词。"
-                "要求同时包含中文和英文关键词，每行一个关键词，不要解释，尽量覆盖政策、市场、产业链、技术与销售/财报相关角度。\n"
+                "要求同时包含中文和英文关键词，尽量覆盖政策、市场、产业链、技术与销售/财报相关角度。"
+                "只返回 JSON，格式为 {\"zh\":[],\"en\":[]}，不要解释。\n"
                 "主题：" + topic
             )
-            model = get_chat_model()
-            response = model.invoke(prompt)
-            text = response.content if hasattr(response, "content") else str(response)
-            keywords = _dedup_keywords([line.strip("- ") for line in text.splitlines() if line.strip("- ").strip()])
+            text = _invoke_keyword_llm(prompt)
+            from ..extraction.json_utils import extract_json_payload as _extract_json
+            data = _extract_json(text)
+            groups = [data.get("zh") or [], data.get("en") or []] if isinstance(data, dict) else None
+            if groups and all(isinstance(g, list) and all(isinstance(x, str) for x in g) for g in groups):
+                raw = [*groups[0], *groups[1]]
+            else:
+                # 模型未按 {"zh":[...],"en":[...]} 返回（非 JSON，或值不是字符串列表）时按行解析同一份输出，不再追加调用
+                raw = _KEYWORD_LINE_RE.findall(text)
+            keywords = _dedup_keywords(raw)
             if keywords:
                 logger.info("generate_keywords: llm bilingual keywords=%s", keywords)
                 return keywords
         except Exception:
             logger.warning("generate_keywords: llm bilingual failed, fallback to zh+en", exc_info=True)
-        return _dedup_keywords(generate_keywords(topic, "zh") + generate_keywords(topic, "en"))
+        return static_fallback
 
     # If no valid provider/key configured, skip LLM and use fallback keywords
     if settings.llm_provider == "openai" and not settings.openai_api_key:
         logger.info("generate_keywords: using fallback (no OPENAI key), topic=%s lang=%s", topic, language)
-        return [
-            topic,
-            *( [
-                f"{topic} regulation",
-                f"{topic} market",
-                f"{topic} sales report",
-                f"{topic} supply chain",
-            ] if language.lower().startswith("en") else [
-                f"{topic} 政策",
-                f"{topic} 市场",
-                f"{topic} 销售 报告",
-                f"{topic} 产业链",
-            ])
-        ]
+        return _fallback_keywords(topic, language)
     try:
         # 尝试从数据库读取配置
         config = get_llm_config("keyword_generation")
@@ -217,14 +389,14 @@ def generate_keywords(topic: str, language: str = "zh") -> List[str]:
                 language=language_str,
                 topic=topic
             )
-            model = get_chat_model(
-                model=config.get("model"),
-                temperature=config.get("temperature"),
-                max_tokens=config.get("max_tokens"),
-                top_p=config.get("top_p"),
-                presence_penalty=config.get("presence_penalty"),
-                frequency_penalty=config.get("frequency_penalty"),
-            )
+            model_kwargs = {
+                "model": config.get("model"),
+                "temperature": config.get("temperature"),
+                "max_tokens": config.get("max_tokens"),
+                "top_p": config.get("top_p"),
+                "presence_penalty": config.get("presence_penalty"),
+                "frequency_penalty": config.get("frequency_penalty"),
+            }
         else:
             # 使用默认提示词（向后兼容）
             prompt = (
@@ -232,15 +404,10 @@ def generate_keywords(topic: str, language: str = "zh") -> List[str]:
                 ("英文" if language.lower().startswith("en") else "中文") +
                 "搜索关键词。每行一个关键词，尽量包含与政策、市场或行情相关的词。\n主题：" + topic
             )
-            model = get_chat_model()
+            model_kwargs = {}
         
-        response = model.invoke(prompt)
-        text = response.content if hasattr(response, "content") else str(response)
-        keywords: List[str] = []
-        for line in text.splitlines():
-            line = line.strip("- ")
-            if line:
-                keywords.append(line)
+        text = _invoke_keyword_llm(prompt, **model_kwargs)
+        keywords = _dedup_keywords(_KEYWORD_LINE_RE.findall(text))
         if keywords:
             logger.info("generate_keywords: llm keywords=%s", keywords)
             return keywords
@@ -248,22 +415,7 @@ def generate_keywords(topic: str, language: str = "zh") -> List[str]:
         # Fallback without LLM (no key / provider error)
         logger.warning("generate_keywords: llm failed, fallback to static keywords", exc_info=True)
 
-    if language.lower().startswith("en"):
-        return [
-            topic,
-            f"{topic} regulation",
-            f"{topic} market",
-            f"{topic} sales report",
-            f"{topic} supply chain",
-        ]
-    else:
-        return [
-            topic,
-            f"{topic} 政策",
-            f"{topic} 市场",
-            f"{topic} 销售 报告",
-            f"{topic} 产业链",
-        ]
+    return _fallback_keywords(topic, language)
 
 
 def generate_topic_keywords(
@@ -286,18 +438,9 @@ def generate_topic_keywords(
         base = [topic]
 
     # Cheap deterministic fallback extensions
-    zh_suffix = {
-        "company": ["公司", "企业", "品牌", "合作", "供应链", "渠道"],
-        "product": ["产品", "型号", "品类", "参数", "发布", "应用场景"],
-        "operation": ["经营", "商业模式", "运营模式", "电商", "平台", "渠道策略"],
-    }
-    en_suffix = {
-        "company": ["company", "brand", "partnership", "supply chain", "channel"],
-        "product": ["product", "model", "category", "specs", "launch", "use case"],
-        "operation": ["operation", "business model", "ecommerce", "platform", "channel strategy"],
-    }
-    hints = (zh_suffix if _base_language(language) == "zh" else en_suffix).get(focus, [])
-    fallback = _dedup_keywords([f"{kw} {s}" for kw in base[:4] for s in hints[:4]])
+    base_lang, _ = _normalize_lang(language)
+    hints = list(_TOPIC_FOCUS_SUFFIXES[base_lang].get(focus, ()))
+    fallback = list(dict.fromkeys(f"{kw} {s}" for kw in base[:4] for s in hints[:4]))
 
     try:
         if settings.llm_provider == "openai" and not settings.openai_api_key:
@@ -308,9 +451,19 @@ def generate_topic_keywords(
             f"主题: {topic}\n专题: {focus}\n语言: {language}\n已有基础关键词: {base[:10]}\n"
             "要求：关键词偏检索用途，不要输出结构化字段；topic_hints 是主题提示词，可更抽象。"
         )
-        model = get_chat_model()
-        response = model.invoke(prompt)
-        content = response.content if hasattr(response, "content") else str(response)
+        topic_vec = None
+        content = _cached_keyword_output(prompt)
+        if content is None:
+            # 精确提示词未命中时，措辞相近的主题（如 "EV battery supply" / "EV batteries supply chain"）复用已生成的关键词
+            topic_text = f"{topic} | {' '.join(base[:10])}"
+            partition = (settings.llm_provider, focus, language, frozenset(_TOPIC_DISTINCT_TOKEN_RE.findall(topic_text)))
+            topic_vec = _unit_embedding(topic_text)
+            if topic_vec is not None:
+                cached = _topic_semantic_lookup(partition, topic_vec)
+                if cached is not None:
+                    logger.info("generate_topic_keywords: semantic cache hit topic=%s focus=%s", topic, focus)
+                    return cached
+            content = _invoke_keyword_llm(prompt)
         data = None
         try:
             from ..extraction.json_utils import extract_json_payload as _extract_json
@@ -321,37 +474,131 @@ def generate_topic_keywords(
             search_kw = _dedup_keywords([str(x).strip() for x in (data.get("search_keywords") or []) if str(x).strip()])
             topic_hints = _dedup_keywords([str(x).strip() for x in (data.get("topic_hints") or []) if str(x).strip()])
             if search_kw:
-                return {"search_keywords": search_kw[:12], "topic_hints": topic_hints[:12]}
+                result = {"search_keywords": search_kw[:12], "topic_hints": topic_hints[:12]}
+                if topic_vec is not None:
+                    _topic_semantic_store(partition, topic_vec, result)
+                return result
     except Exception:
         logger.warning("generate_topic_keywords: llm failed, fallback", exc_info=True)
     return {"search_keywords": fallback[:12], "topic_hints": hints[:8]}
 
 
+def _result_uri(item: dict) -> Optional[str]:
+    return item.get("canonical_link") or item.get("link")
+
+
+def _existing_uris(results: List[dict]) -> Set[str]:
+    """查询结果中已入库的 URI（去重后按批查询，IN 列表长度受控；documents.uri 有 hash 索引）"""
+    urls = list(dict.fromkeys(uri for uri in map(_result_uri, results) if uri))
+    existing_urls: Set[str] = set()
+    if not urls:
+        return existing_urls
+    with SessionLocal() as session:
+        for start in range(0, len(urls), _FILTER_EXISTING_CHUNK_SIZE):
+            chunk = urls[start:start + _FILTER_EXISTING_CHUNK_SIZE]
+            existing_urls.update(session.scalars(select(Document.uri).where(Document.uri.in_(chunk))))
+    return existing_urls
+
+
 def filter_existing(results: List[dict]) -> List[dict]:
     """过滤已入库的文档"""
-    urls = [
-        r.get("canonical_link") or r.get("link")
-        for r in results
-        if r.get("canonical_link") or r.get("link")
-    ]
-    if not urls:
+    existing_urls = _existing_uris(results)
+    if not existing_urls:
         return results
-    
-    with SessionLocal() as session:
-        existing_urls = {
-            row[0] for row in session.execute(
-                select(Document.uri).where(Document.uri.in_(urls))
-            ).all()
-        }
-    
-    filtered = [
-        r for r in results
-        if (r.get("canonical_link") or r.get("link")) not in existing_urls
-    ]
+    filtered = [r for r in results if _result_uri(r) not in existing_urls]
     logger.info("filter_existing: input=%d existing=%d filtered=%d", len(results), len(existing_urls), len(filtered))
     return filtered
 
 
+def _search_keywords_concurrently(
+    keywords: List[str],
+    fetch: Callable[[str, int], List[dict]],
+    results: List[dict],
+    seen_links: Set[str],
+    *,
+    per_kw: int,
+    label: str,
+    max_results: Optional[int] = None,
+) -> None:
+    """并发执行每个关键词的搜索，按关键词原顺序合并去重（结果与串行一致）
+
+    给定 max_results 时先按配额裁剪：每个关键词请求 min(per_kw, 剩余配额) 条，配额用完的关键词不再发请求
+    （按次计费的服务，关键词多于 max_results 时避免多余调用）。
+    """
+    limits: Dict[str, int] = {}
+    remaining = max_results
+    for keyword in keywords:
+        if remaining is not None:
+            if remaining <= 0:
+                break
+            limits[keyword] = min(per_kw, remaining)
+            remaining -= limits[keyword]
+        else:
+            limits[keyword] = per_kw
+    keywords = list(limits)
+    if not keywords:
+        return
+
+    def _run(keyword: str) -> List[dict]:
+        try:
+            return fetch(keyword, limits[keyword])
+        except Exception as e:
+            logger.warning("search_sources: %s keyword=%s failed: %s", label, keyword, e, exc_info=True)
+            return []
+
+    batches = list(_keyword_search_executor.map(_run, keywords))
+    fetched = 0
+    for keyword, items in zip(keywords, batches):
+        for it in items:
+            it["keyword"] = keyword
+            _add_result_dedup(results, seen_links, it)
+        fetched += len(items)
+        logger.debug("search_sources: %s keyword=%s got %d", label, keyword, len(items))
+    logger.info("search_sources: %s got %d across %d keywords (total=%d)", label, fetched, len(keywords), len(results))
+
+
+def _current_year() -> int:
+    """本地当前年份，缓存至多 1 小时且不跨过元旦"""
+    global _current_year_cache
+    now_ts = time.monotonic()
+    cached = _current_year_cache
+    if cached is not None and now_ts < cached[1]:
+        return cached[0]
+    now = datetime.now()
+    new_year = datetime(now.year + 1, 1, 1)
+    _current_year_cache = (now.year, now_ts + min(_CURRENT_YEAR_TTL_S, (new_year - now).total_seconds()))
+    return now.year
+
+
+def _google_tbs(days_back: Optional[int]) -> Optional[str]:
+    """Google/Serper/SerpAPI 的时间过滤参数（最近 N 天）"""
+    return f"qdr:d{days_back}" if days_back and days_back > 0 else None
+
+
+def _ddg_timelimit(days_back: Optional[int]) -> Optional[str]:
+    """DDG 只支持 d/w/m/y，取能覆盖 N 天的最小档位"""
+    if not days_back or days_back <= 0:
+        return None
+    if days_back <= 1:
+        return "d"
+    if days_back <= 7:
+        return "w"
+    if days_back <= 31:
+        return "m"
+    return "y"
+
+
+def _provider_keys() -> Dict[str, Optional[str]]:
+    """各搜索服务的密钥（环境变量优先于配置），每次搜索只读取一次"""
+    return {
+        "serper": os.getenv("SERPER_API_KEY") or getattr(settings, "serper_api_key", None),
+        "serpstack": os.getenv("SERPSTACK_KEY") or settings.serpstack_key,
+        "serpapi": os.getenv("SERPAPI_KEY") or os.getenv("SERPAPI_API_KEY") or settings.serpapi_key,
+        "google_api": os.getenv("GOOGLE_SEARCH_API_KEY") or settings.google_search_api_key,
+        "google_cse_id": os.getenv("GOOGLE_SEARCH_CSE_ID") or settings.google_search_cse_id,
+    }
+
+
 def search_sources(
     topic: str, 
     language: str = "en", 
@@ -360,6 +607,7 @@ def search_sources(
     days_back: Optional[int] = None,
     exclude_existing: bool = True,
     start_offset: Optional[int] = None,
+    use_filter_context: bool = False,
 ) -> List[dict]:
     """搜索外部资源
     
@@ -376,17 +624,26 @@ def search_sources(
             - "serpapi": 仅使用 SerpAPI
         days_back: 可选，只搜索最近N天的内容（添加到关键词中）
         exclude_existing: 是否排除已入库的文档（默认True）
+        use_filter_context: 为True时 days_back 作为搜索服务的时间过滤参数传递
+            （dateRestrict/tbs/timelimit），不再把时间词拼进关键词影响相关性
     """
-    # 时间过滤：添加时间关键词
-    if days_back:
-        year = datetime.now().year
+    recency_days = days_back if use_filter_context and days_back else None
+    # 具体度判断基于调用方的原始主题：下面拼接的年份/时间词不能让普通主题被当成“已足够具体”
+    specific_topic = _looks_specific(topic)
+    # 时间过滤：添加时间关键词（filter 模式下改由搜索服务按日期过滤）
+    if days_back and not recency_days:
+        year = _current_year()
         if language.lower().startswith("en"):
             topic = f"{topic} {year} recent latest"
         else:
             topic = f"{topic} {year} 最新 最近"
         logger.info("search_sources: added time keywords days_back=%d topic=%s", days_back, topic)
     
-    keywords = generate_keywords(topic, language)
+    if specific_topic:
+        logger.info("search_sources: topic already specific, skip expansion topic=%s", topic)
+        keywords = [topic.strip()]
+    else:
+        keywords = _expand_keywords(topic, language)
     # 如果关键词生成失败，使用topic本身作为关键词
     if not keywords:
         keywords = [topic]
@@ -394,19 +651,19 @@ def search_sources(
     logger.info("search_sources: start topic=%s lang=%s keywords=%s max=%d provider=%s", topic, language, keywords, max_results, provider)
     results: List[dict] = []
     seen_links: Set[str] = set()
+    per_kw = max(1, max_results // max(1, len(keywords)))
+    keys = _provider_keys()
     
     # 如果指定了特定提供商，直接使用
     if provider != "auto":
-        from ...settings.config import settings as _settings
-        
         if provider == "ddg":
             try:
+                fetched = 0
                 with DDGS() as ddgs:
-                    per_kw = max(1, max_results // max(1, len(keywords)))
                     for keyword in keywords:
                         try:
                             count = 0
-                            for result in ddgs.text(keyword, safesearch="off", max_results=per_kw):
+                            for result in ddgs.text(keyword, safesearch="off", timelimit=_ddg_timelimit(recency_days), max_results=per_kw):
                                 item = {
                                     "keyword": keyword,
                                     "title": result.get("title"),
@@ -417,7 +674,8 @@ def search_sources(
                                 if _add_result_dedup(results, seen_links, item):
                                     pass
                                 count += 1
-                            logger.info("search_sources: ddg keyword=%s got %d", keyword, count)
+                            fetched += count
+                            logger.debug("search_sources: ddg keyword=%s got %d", keyword, count)
                         except RatelimitException as e:
                             logger.warning("search_sources: ddg rate limited (202 Ratelimit) - DuckDuckGo 已限流，建议使用其他搜索服务: %s", e)
                             # DDG 被限流，返回已获取的结果（如果有）
@@ -425,6 +683,7 @@ def search_sources(
                         except Exception as e:
                             logger.warning("search_sources: ddg keyword=%s failed: %s", keyword, e, exc_info=True)
                             continue
+                logger.info("search_sources: ddg got %d across %d keywords (total=%d)", fetched, len(keywords), len(results))
             except RatelimitException as e:
                 logger.error("search_sources: ddg provider rate limited (202 Ratelimit) - DuckDuckGo 已限流，建议使用 Google/Serpstack/SerpAPI: %s", e)
                 return results
@@ -433,43 +692,37 @@ def search_sources(
                 return results
 
         elif provider == "serper":
-            serper_key = os.getenv("SERPER_API_KEY") or getattr(_settings, "serper_api_key", None)
+            serper_key = keys["serper"]
             if not serper_key:
                 logger.error("search_sources: serper key not configured")
                 return results
-            per_kw = max(1, max_results // max(1, len(keywords)))
-            for keyword in keywords:
-                try:
-                    items = _serper_search(keyword, serper_key, per_kw, language=language)
-                    for it in items:
-                        it["keyword"] = keyword
-                        _add_result_dedup(results, seen_links, it)
-                    logger.info("search_sources: serper keyword=%s got %d", keyword, len(items))
-                except Exception as e:
-                    logger.warning("search_sources: serper keyword=%s failed: %s", keyword, e, exc_info=True)
-                    continue
+            _search_keywords_concurrently(
+                keywords,
+                lambda kw, limit: _serper_search(kw, serper_key, limit, language=language, days_back=recency_days),
+                results,
+                seen_links,
+                per_kw=per_kw,
+                label="serper",
+                max_results=max_results,
+            )
         
         elif provider == "serpstack":
-            serpstack_key = os.getenv("SERPSTACK_KEY") or _settings.serpstack_key
+            serpstack_key = keys["serpstack"]
             if not serpstack_key:
                 logger.error("search_sources: serpstack key not configured")
                 return results
-            per_kw = max(1, max_results // max(1, len(keywords)))
-            for keyword in keywords:
-                try:
-                    items = _serpstack_search(keyword, serpstack_key, per_kw)
-                    for it in items:
-                        it["keyword"] = keyword
-                        _add_result_dedup(results, seen_links, it)
-                    logger.info("search_sources: serpstack keyword=%s got %d", keyword, len(items))
-                except Exception as e:
-                    logger.warning("search_sources: serpstack keyword=%s failed: %s", keyword, e, exc_info=True)
-                    continue
+            _search_keywords_concurrently(
+                keywords,
+                lambda kw, limit: _serpstack_search(kw, serpstack_key, limit),
+                results,
+                seen_links,
+                per_kw=per_kw,
+                label="serpstack",
+            )
         
         elif provider == "google":
-            from ...settings.config import settings as _settings
-            google_api_key = os.getenv("GOOGLE_SEARCH_API_KEY") or _settings.google_search_api_key
-            google_cse_id = os.getenv("GOOGLE_SEARCH_CSE_ID") or _settings.google_search_cse_id
+            google_api_key = keys["google_api"]
+            google_cse_id = keys["google_cse_id"]
             google_oauth_token = _get_google_oauth_token()
             google_configured = google_cse_id and (google_api_key or google_oauth_token)
             if not google_configured:
@@ -477,10 +730,9 @@ def search_sources(
                 # Fallback to DDG when Google CSE not configured
                 try:
                     with DDGS() as ddgs:
-                        per_kw = max(1, max_results // max(1, len(keywords)))
                         for keyword in keywords:
                             try:
-                                for result in ddgs.text(keyword, safesearch="off", max_results=per_kw):
+                                for result in ddgs.text(keyword, safesearch="off", timelimit=_ddg_timelimit(recency_days), max_results=per_kw):
                                     item = {
                                         "keyword": keyword,
                                         "title": result.get("title"),
@@ -489,12 +741,13 @@ def search_sources(
                                         "source": "ddg",
                                     }
                                     _add_result_dedup(results, seen_links, item)
-                                logger.info("search_sources: ddg fallback keyword=%s got results", keyword)
+                                logger.debug("search_sources: ddg fallback keyword=%s got results", keyword)
                             except (RatelimitException, Exception) as e:
                                 logger.warning("search_sources: ddg fallback keyword=%s failed: %s", keyword, e)
                                 continue
                 except (RatelimitException, Exception) as e:
                     logger.warning("search_sources: ddg fallback failed: %s", e)
+                logger.info("search_sources: ddg fallback total=%d across %d keywords", len(results), len(keywords))
             else:
                 # Google API: OAuth 优先于 API Key；batch requests with delay
                 auth_kw = {"oauth_token": google_oauth_token} if google_oauth_token else {"api_key": google_api_key}
@@ -507,60 +760,53 @@ def search_sources(
                         time.sleep(1.0)  # delay between keywords
                     try:
                         remaining = max_results - len(results)
-                        items = _google_search(keyword, google_cse_id, remaining, start_offset, **auth_kw)
+                        items = _google_search(keyword, google_cse_id, remaining, start_offset, days_back=recency_days, **auth_kw)
                         for it in items:
                             it["keyword"] = keyword
                             _add_result_dedup(results, seen_links, it)
-                        logger.info("search_sources: google keyword=%s got %d (total=%d)", keyword, len(items), len(results))
+                        logger.debug("search_sources: google keyword=%s got %d (total=%d)", keyword, len(items), len(results))
                     except Exception as e:
                         logger.warning("search_sources: google keyword=%s failed: %s", keyword, e, exc_info=True)
                         continue
+                logger.info("search_sources: google total=%d across %d keywords", len(results), len(keywords))
         
         elif provider == "serpapi":
-            serp_key = os.getenv("SERPAPI_KEY") or os.getenv("SERPAPI_API_KEY") or _settings.serpapi_key
+            serp_key = keys["serpapi"]
             if not serp_key:
                 logger.error("search_sources: serpapi key not configured")
                 return results
-            per_kw = max(1, max_results // max(1, len(keywords)))
-            for keyword in keywords:
-                try:
-                    items = _serpapi_search(keyword, serp_key, per_kw)
-                    for it in items:
-                        it["keyword"] = keyword
-                        _add_result_dedup(results, seen_links, it)
-                    logger.info("search_sources: serpapi keyword=%s got %d", keyword, len(items))
-                except Exception as e:
-                    logger.warning("search_sources: serpapi keyword=%s failed: %s", keyword, e, exc_info=True)
-                    continue
+            _search_keywords_concurrently(
+                keywords,
+                lambda kw, limit: _serpapi_search(kw, serp_key, limit, days_back=recency_days),
+                results,
+                seen_links,
+                per_kw=per_kw,
+                label="serpapi",
+            )
         
         logger.info("search_sources: provider=%s total=%d", provider, len(results))
         return results
     
     # 自动模式：优先使用 Google Custom Search（支持分页，每天100次免费）
-    from ...settings.config import settings as _settings
-    
     # 1. 优先尝试 Serper.dev（稳定、接入简单）
-    serper_key = os.getenv("SERPER_API_KEY") or getattr(_settings, "serper_api_key", None)
+    serper_key = keys["serper"]
     if serper_key:
         logger.info("search_sources: auto mode - using serper.dev")
-        per_kw = max(1, max_results // max(1, len(keywords)))
-        for keyword in keywords:
-            if len(results) >= max_results:
-                break
-            try:
-                remaining = max_results - len(results)
-                items = _serper_search(keyword, serper_key, min(per_kw, remaining), language=language)
-                for it in items:
-                    it["keyword"] = keyword
-                    _add_result_dedup(results, seen_links, it)
-            except Exception as e:
-                logger.warning("search_sources: serper keyword=%s failed: %s", keyword, e, exc_info=True)
-                continue
+        _search_keywords_concurrently(
+            keywords,
+            lambda kw, limit: _serper_search(kw, serper_key, limit, language=language, days_back=recency_days),
+            results,
+            seen_links,
+            per_kw=per_kw,
+            label="serper",
+            max_results=max_results,
+        )
 
     # 2. 尝试 Google Custom Search（若可用，支持分页）
-    google_api_key = os.getenv("GOOGLE_SEARCH_API_KEY") or _settings.google_search_api_key
-    google_cse_id = os.getenv("GOOGLE_SEARCH_CSE_ID") or _settings.google_search_cse_id
-    google_oauth_token = _get_google_oauth_token()
+    google_api_key = keys["google_api"]
+    google_cse_id = keys["google_cse_id"]
+    # 仅在确实要走 Google 时才取 OAuth token
+    google_oauth_token = _get_google_oauth_token() if len(results) == 0 and google_cse_id else None
     if len(results) == 0 and google_cse_id and (google_api_key or google_oauth_token):
         auth_kw = {"oauth_token": google_oauth_token} if google_oauth_token else {"api_key": google_api_key}
         logger.info("search_sources: auto mode - using google custom search (OAuth=%s)", bool(google_oauth_token))
@@ -571,23 +817,23 @@ def search_sources(
                 time.sleep(1.0)  # delay between keywords
             try:
                 remaining = max_results - len(results)
-                items = _google_search(keyword, google_cse_id, remaining, start_offset, **auth_kw)
+                items = _google_search(keyword, google_cse_id, remaining, start_offset, days_back=recency_days, **auth_kw)
                 for it in items:
                     it["keyword"] = keyword
                     _add_result_dedup(results, seen_links, it)
                 if items:
-                    logger.info("search_sources: google keyword=%s got %d (total=%d)", keyword, len(items), len(results))
+                    logger.debug("search_sources: google keyword=%s got %d (total=%d)", keyword, len(items), len(results))
             except Exception as e:
                 logger.warning("search_sources: google keyword=%s failed: %s", keyword, e)
                 continue
+        logger.info("search_sources: google total=%d across %d keywords", len(results), len(keywords))
     
     # Fallback: 如果前面失败，尝试其他搜索服务
     if len(results) == 0:
         # 3. 尝试 Serpstack（每月100次免费）
-        serpstack_key = os.getenv("SERPSTACK_KEY") or _settings.serpstack_key
+        serpstack_key = keys["serpstack"]
         if serpstack_key:
             logger.info("search_sources: trying serpstack (free tier: 100/month)")
-            per_kw = max(1, max_results // max(1, len(keywords)))
             for keyword in keywords:
                 try:
                     items = _serpstack_search(keyword, serpstack_key, per_kw)
@@ -603,51 +849,41 @@ def search_sources(
         
         # 4. 最后尝试 SerpAPI（如果配置了）
         if len(results) == 0:
-            serp_key = os.getenv("SERPAPI_KEY") or os.getenv("SERPAPI_API_KEY") or _settings.serpapi_key
+            serp_key = keys["serpapi"]
             if serp_key:
                 logger.info("search_sources: fallback serpapi")
-                per_kw = max(1, max_results // max(1, len(keywords)))
-                for keyword in keywords:
-                    try:
-                        items = _serpapi_search(keyword, serp_key, per_kw)
-                        for it in items:
-                            it["keyword"] = keyword
-                            _add_result_dedup(results, seen_links, it)
-                        logger.info("search_sources: serpapi keyword=%s got %d", keyword, len(items))
-                    except Exception:
-                        logger.warning("search_sources: serpapi keyword=%s failed", keyword, exc_info=True)
-                        continue
+                _search_keywords_concurrently(
+                    keywords,
+                    lambda kw, limit: _serpapi_search(kw, serp_key, limit, days_back=recency_days),
+                    results,
+                    seen_links,
+                    per_kw=per_kw,
+                    label="serpapi",
+                )
 
     # SerpAPI 新闻通道（增加媒体多样性）
     if len(results) < max_results:
-        from ...settings.config import settings as _settings
-        serp_key = os.getenv("SERPAPI_KEY") or os.getenv("SERPAPI_API_KEY") or _settings.serpapi_key
+        serp_key = keys["serpapi"]
         if serp_key:
             logger.info("search_sources: serpapi news enrichment")
-            per_kw = max(1, max_results // max(1, len(keywords)))
-            for keyword in keywords[:3]:  # 控制请求量
-                try:
-                    items = _serpapi_search_news(keyword, serp_key, per_kw)
-                    for it in items:
-                        it["keyword"] = keyword
-                        _add_result_dedup(results, seen_links, it)
-                except Exception:
-                    continue
+            _search_keywords_concurrently(
+                keywords[:3],  # 控制请求量
+                lambda kw, limit: _serpapi_search_news(kw, serp_key, limit, days_back=recency_days),
+                results,
+                seen_links,
+                per_kw=per_kw,
+                label="serpapi_news",
+            )
 
     # Fallback: generic market research sources on DDG
     if len(results) == 0:
-        site_kw = [
-            f"site:reuters.com {k}" for k in keywords
-        ] + [
-            f"site:bloomberg.com {k}" for k in keywords
-        ] + [
-            f"site:wsj.com {k}" for k in keywords
-        ]
+        # 三个站点合并为一条 OR 查询，请求数减为原来的 1/3
+        site_kw = [f"({_FALLBACK_SITE_FILTER}) {k}" for k in keywords]
         try:
             with DDGS() as ddgs:
                 for keyword in site_kw:
                     try:
-                        for result in ddgs.text(keyword, safesearch="off", max_results=2):
+                        for result in ddgs.text(keyword, safesearch="off", timelimit=_ddg_timelimit(recency_days), max_results=2 * len(_FALLBACK_SITES)):
                             item = {
                                 "keyword": keyword,
                                 "title": result.get("title"),
@@ -666,17 +902,22 @@ def search_sources(
         except Exception:
             logger.warning("search_sources: site search fallback failed", exc_info=True)
 
-    # 过滤已存在的文档
-    if exclude_existing:
-        results = filter_existing(results)
-        
-    # 结果重排：以数字相关性、可信来源与主题匹配优先
+    # 过滤已存在的文档并打分，单次遍历完成
+    existing_urls = _existing_uris(results) if exclude_existing else set()
+    kept: List[dict] = []
     for item in results:
+        if existing_urls and _result_uri(item) in existing_urls:
+            continue
+        # 结果重排：以数字相关性、可信来源与主题匹配优先
         try:
             item["relevance_score"] = _score_search_result(item, topic=topic, keywords=keywords)
         except Exception as e:
             logger.warning("search_sources: scoring failed for %s: %s", item.get("link"), e)
             item.setdefault("relevance_score", 0.0)
+        kept.append(item)
+    if exclude_existing:
+        logger.info("search_sources: existing filtered input=%d existing=%d kept=%d", len(results), len(existing_urls), len(kept))
+    results = kept
     results.sort(key=lambda item: item.get("relevance_score", 0.0), reverse=True)
     if len(results) > max_results:
         results = results[:max_results]
@@ -685,13 +926,16 @@ def search_sources(
     return results
 
 
-def _serpapi_search(keyword: str, api_key: str, limit: int) -> List[dict]:
+def _serpapi_search(keyword: str, api_key: str, limit: int, *, days_back: Optional[int] = None) -> List[dict]:
     params = {
         "q": keyword,
         "engine": "google",
         "api_key": api_key,
         "num": str(max(1, limit)),
     }
+    tbs = _google_tbs(days_back)
+    if tbs:
+        params["tbs"] = tbs
     data = default_http_client.get_json("https://serpapi.com/search.json", params=params)
     items: List[dict] = []
     for r in data.get("organic_results", [])[:limit]:
@@ -706,7 +950,7 @@ def _serpapi_search(keyword: str, api_key: str, limit: int) -> List[dict]:
     return items
 
 
-def _serpapi_search_news(keyword: str, api_key: str, limit: int) -> List[dict]:
+def _serpapi_search_news(keyword: str, api_key: str, limit: int, *, days_back: Optional[int] = None) -> List[dict]:
     params = {
         "q": keyword,
         "engine": "google",
@@ -714,6 +958,9 @@ def _serpapi_search_news(keyword: str, api_key: str, limit: int) -> List[dict]:
         "tbm": "nws",
         "num": str(max(1, limit)),
     }
+    tbs = _google_tbs(days_back)
+    if tbs:
+        params["tbs"] = tbs
     data = default_http_client.get_json("https://serpapi.com/search.json", params=params)
     items: List[dict] = []
     for r in data.get("news_results", [])[:limit]:
@@ -751,7 +998,14 @@ def _serpstack_search(keyword: str, api_key: str, limit: int) -> List[dict]:
     return items
 
 
-def _serper_search(keyword: str, api_key: str, limit: int, *, language: str = "en") -> List[dict]:
+def _serper_search(
+    keyword: str,
+    api_key: str,
+    limit: int,
+    *,
+    language: str = "en",
+    days_back: Optional[int] = None,
+) -> List[dict]:
     """Serper.dev Google Search API (POST JSON).
 
     Docs: https://serper.dev/
@@ -766,6 +1020,9 @@ def _serper_search(keyword: str, api_key: str, limit: int, *, language: str = "e
         "num": int(max(1, limit)),
         "hl": hl,
     }
+    tbs = _google_tbs(days_back)
+    if tbs:
+        payload["tbs"] = tbs
     data = default_http_client.post_json(
         "https://google.serper.dev/search",
         json=payload,
@@ -790,26 +1047,55 @@ def _serper_search(keyword: str, api_key: str, limit: int, *, language: str = "e
 
 
 _CSE_OAUTH_SCOPE = "https://www.googleapis.com/auth/cse"
+# Access tokens live ~1h; refresh only when the cached one is within this margin of expiry.
+_GOOGLE_TOKEN_REFRESH_MARGIN = timedelta(seconds=300)
+_google_credentials: Optional[tuple[str, Any]] = None  # (creds_path, service_account.Credentials)
+_google_credentials_lock = threading.Lock()
 
 
 def _get_google_oauth_token() -> Optional[str]:
     """Get OAuth 2.0 access token from service account (GOOGLE_APPLICATION_CREDENTIALS)."""
+    global _google_credentials
     creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
     if not creds_path or not os.path.isfile(creds_path):
         return None
     try:
         import google.auth.transport.requests
         from google.oauth2 import service_account
-        credentials = service_account.Credentials.from_service_account_file(
-            creds_path, scopes=[_CSE_OAUTH_SCOPE]
-        )
-        credentials.refresh(google.auth.transport.requests.Request())
-        return credentials.token
+        with _google_credentials_lock:
+            if _google_credentials is None or _google_credentials[0] != creds_path:
+                _google_credentials = (
+                    creds_path,
+                    service_account.Credentials.from_service_account_file(creds_path, scopes=[_CSE_OAUTH_SCOPE]),
+                )
+            credentials = _google_credentials[1]
+            # google-auth keeps expiry as naive UTC
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            if not credentials.token or credentials.expiry is None or credentials.expiry - now < _GOOGLE_TOKEN_REFRESH_MARGIN:
+                credentials.refresh(google.auth.transport.requests.Request())
+            return credentials.token
     except Exception as e:
         logger.warning("_get_google_oauth_token failed: %s", e, exc_info=True)
         return None
 
 
+def _google_api_keys(api_key: Optional[str]) -> List[str]:
+    return _dedup_keywords((api_key or "").split(","))
+
+
+def _google_keys_in_order(keys: List[str]) -> List[str]:
+    """未在冷却中的 key 优先（保持配置顺序）；全部冷却时仍按原顺序尝试"""
+    now_ts = time.monotonic()
+    with _google_key_lock:
+        ready = [k for k in keys if _google_key_cooldown.get(k, 0.0) <= now_ts]
+    return ready + [k for k in keys if k not in ready]
+
+
+def _is_google_quota_error(exc: Exception) -> bool:
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status in (403, 429) or "quota" in str(exc).lower() or "429" in str(exc)
+
+
 def _google_search(
     keyword: str,
     cse_id: str,
@@ -818,6 +1104,7 @@ def _google_search(
     *,
     api_key: Optional[str] = None,
     oauth_token: Optional[str] = None,
+    days_back: Optional[int] = None,
 ) -> List[dict]:
     """Google Custom Search API: 每天100次免费请求
     支持 API Key 或 OAuth 2.0（Service Account）认证。
@@ -825,7 +1112,7 @@ def _google_search(
     注册地址: https://developers.google.com/custom-search/v1/overview
 
     认证方式（二选一）:
-    1. API Key: GOOGLE_SEARCH_API_KEY
+    1. API Key: GOOGLE_SEARCH_API_KEY（可逗号分隔多个，配额用尽时自动轮换）
     2. OAuth: GOOGLE_APPLICATION_CREDENTIALS 指向 Service Account JSON 路径
     """
     items: List[dict] = []
@@ -835,38 +1122,70 @@ def _google_search(
     initial_start = start_offset if start_offset is not None else 1
     max_pages = (limit + max_results_per_page - 1) // max_results_per_page
 
-    for page in range(max_pages):
-        if len(items) >= limit:
-            break
+    base_params: Dict[str, Any] = {"q": keyword, "cx": cse_id, "alt": "json"}
+    if days_back and days_back > 0:
+        base_params["dateRestrict"] = f"d{days_back}"
+    headers: Dict[str, str] = {"Accept": "application/json"}
+    api_keys: List[str] = []
+    if oauth_token:
+        headers["Authorization"] = f"Bearer {oauth_token}"
+    else:
+        api_keys = _google_api_keys(api_key)
+        if not api_keys:
+            logger.error("_google_search: neither api_key nor oauth_token provided")
+            return []
 
-        start_index = initial_start + page * max_results_per_page
-        remaining = limit - len(items)
-        num_results = min(max_results_per_page, remaining)
+    def _get_page(params: Dict[str, Any]) -> List[dict]:
+        data = default_http_client.get_json(
+            "https://www.googleapis.com/customsearch/v1",
+            params=params,
+            headers=headers,
+        )
+        return data.get("items", [])
 
+    def _fetch_page(page: int) -> List[dict]:
         params = {
-            "q": keyword,
-            "cx": cse_id,
-            "num": num_results,
-            "start": start_index,
-            "alt": "json",
+            **base_params,
+            "num": min(max_results_per_page, limit - page * max_results_per_page),
+            "start": initial_start + page * max_results_per_page,
         }
-        headers: Dict[str, str] = {"Accept": "application/json"}
-
-        if oauth_token:
-            headers["Authorization"] = f"Bearer {oauth_token}"
-        elif api_key:
-            params["key"] = api_key
-        else:
-            logger.error("_google_search: neither api_key nor oauth_token provided")
-            return []
-
-        try:
-            data = default_http_client.get_json(
-                "https://www.googleapis.com/customsearch/v1",
-                params=params,
-                headers=headers,
-            )
-            page_items = data.get("items", [])
+        if not api_keys:
+            return _get_page(params)
+        last_exc: Optional[Exception] = None
+        for key in _google_keys_in_order(api_keys):
+            try:
+                return _get_page({**params, "key": key})
+            except Exception as e:
+                if not _is_google_quota_error(e):
+                    raise
+                last_exc = e
+                with _google_key_lock:
+                    _google_key_cooldown[key] = time.monotonic() + _GOOGLE_KEY_COOLDOWN_S
+                if len(api_keys) > 1:
+                    logger.warning("google_search: key ...%s quota/rate limited, rotating", key[-4:])
+        raise last_exc  # type: ignore[misc]
+
+    # 先单独取第 1 页：结果不足一页的主题不再为后续页消耗每日配额；第 1 页满页后其余各页 start 偏移已知，
+    # 再并发请求。按页序合并，遇到空页/短页/出错即截断（与逐页请求结果一致）
+    futures: list = []
+    try:
+        for page in range(max_pages):
+            start_index = initial_start + page * max_results_per_page
+            num_results = min(max_results_per_page, limit - page * max_results_per_page)
+            try:
+                if page == 0:
+                    page_items = _fetch_page(0)
+                else:
+                    if not futures:
+                        futures = [_google_page_executor.submit(_fetch_page, p) for p in range(1, max_pages)]
+                    page_items = futures[page - 1].result()
+            except Exception as e:
+                logger.warning("google_search: API error at page %d (start=%d): %s", page + 1, start_index, e)
+                if "quota" in str(e).lower() or "429" in str(e):
+                    logger.error("google_search: quota exceeded")
+                if page == 0:
+                    return []
+                break
 
             if not page_items:
                 logger.info("google_search: no more results at page %d (start=%d)", page + 1, start_index)
@@ -885,15 +1204,10 @@ def _google_search(
                        page + 1, start_index, len(page_items), len(items))
             if len(page_items) < num_results:
                 break
+    finally:
+        for future in futures:
+            future.cancel()
 
-        except Exception as e:
-            logger.warning("google_search: API error at page %d (start=%d): %s", page + 1, start_index, e)
-            if "quota" in str(e).lower() or "429" in str(e):
-                logger.error("google_search: quota exceeded")
-            if page == 0:
-                return []
-            break
-    
     return items[:limit]  # 确保不超过请求的限制
 
 
@@ -903,9 +1217,10 @@ def _add_result_dedup(results: List[dict], seen_links: Set[str], item: Dict[str,
         return False
 
     canonical_link = _canonicalize_url(link)
-    if canonical_link in seen_links:
+    key = _dedup_key(canonical_link)
+    if key in seen_links:
         return False
-    seen_links.add(canonical_link)
+    seen_links.add(key)
     item["link"] = canonical_link
     item["canonical_link"] = canonical_link
 
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import os
+import threading
 
-from dotenv import dotenv_values, set_key
+from dotenv import dotenv_values
+from dotenv.main import parse_stream, rewrite
 
 from ..settings.config import settings, reload_settings
 
@@ -41,36 +44,95 @@ ENV_KEY_MAPPING = {
 }
 
 
+# (env key, getter on settings or None); reload_settings() keeps the settings object's identity,
+# so the getters stay valid across reloads.
+_SETTINGS_GETTERS: List[Tuple[str, Optional[Callable[[Any], Any]]]] = [
+    (key, attrgetter(attr) if attr in type(settings).model_fields else None)
+    for key, attr in ENV_KEY_MAPPING.items()
+]
+
+# Parsed .env keyed by (mtime_ns, size); the settings UI polls far more often than the file changes.
+_env_cache: Optional[Tuple[Tuple[int, int], Dict[str, str | None]]] = None
+
+
+def _read_env_file() -> Dict[str, str | None]:
+    global _env_cache
+    try:
+        stat = ENV_FILE.stat()
+    except FileNotFoundError:
+        return {}
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _env_cache
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    env_data = dotenv_values(str(ENV_FILE))
+    _env_cache = (stamp, env_data)
+    return env_data
+
+
+_env_write_lock = threading.Lock()
+
+
+def _env_line(key: str, value: str) -> str:
+    # Same single-quoted form as dotenv.set_key(quote_mode="always").
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"{key}='{escaped}'\n"
+
+
+def _write_env_values(values: Dict[str, str]) -> None:
+    """Set all keys in one atomic rewrite of .env, keeping other lines and comments untouched."""
+    replaced: set[str] = set()
+    with _env_write_lock, rewrite(str(ENV_FILE), encoding="utf-8") as (source, dest):
+        missing_newline = False
+        for binding in parse_stream(source):
+            if binding.key in values:
+                dest.write(_env_line(binding.key, values[binding.key]))
+                replaced.add(binding.key)
+                missing_newline = False
+            else:
+                dest.write(binding.original.string)
+                missing_newline = not binding.original.string.endswith("\n")
+        appended = [key for key in values if key not in replaced]
+        if appended and missing_newline:
+            dest.write("\n")
+        for key in appended:
+            dest.write(_env_line(key, values[key]))
+
+
 def load_env_settings() -> Dict[str, str | None]:
-    env_data = dotenv_values(str(ENV_FILE)) if ENV_FILE.exists() else {}
+    env_data = _read_env_file()
     results: Dict[str, str | None] = {}
 
-    for key, attr in ENV_KEY_MAPPING.items():
+    for key, getter in _SETTINGS_GETTERS:
         value = env_data.get(key)
         if value is None:
-            value = os.getenv(key)
-        if value is None and hasattr(settings, attr):
-            attr_value = getattr(settings, attr)
-            value = attr_value if attr_value is not None else None
+            value = os.environ.get(key)
+        if value is None and getter is not None:
+            value = getter(settings)
         results[key] = value
 
     return results
 
 
 def update_env_settings(updates: Dict[str, str | None]) -> Dict[str, str | None]:
+    global _env_cache
     ENV_FILE.parent.mkdir(parents=True, exist_ok=True)
     if not ENV_FILE.exists():
         ENV_FILE.touch()
 
+    values = {key: value or "" for key, value in updates.items() if key in ENV_KEY_MAPPING}
+    if values:
+        _write_env_values(values)
     for key, value in updates.items():
         if key not in ENV_KEY_MAPPING:
             continue
-        set_key(str(ENV_FILE), key, value or "")
         if value is None or value == "":
             os.environ.pop(key, None)
         else:
             os.environ[key] = value
 
+    # Writes within the filesystem's mtime granularity could keep the same stamp.
+    _env_cache = None
     reload_settings()
     return load_env_settings()
 
@@ -1,4 +1,6 @@
 from .resolver import (
+    bump_source_library_revision,
+    get_effective_item,
     list_channels_grouped_by_provider,
     list_effective_channels,
     list_effective_items,
@@ -9,6 +11,8 @@ from .resolver import (
 from .sync import sync_shared_library_from_files
 
 __all__ = [
+    "bump_source_library_revision",
+    "get_effective_item",
     "list_channels_grouped_by_provider",
     "list_effective_channels",
     "list_effective_items",
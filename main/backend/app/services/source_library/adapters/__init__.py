@@ -1,34 +1,57 @@
-"""Channel adapters: wrap ingest modules and register with handler_registry."""
+"""Channel adapters: wrap ingest modules and register with handler_registry.
+
+Handler modules pull in heavy ingest clients (selectolax, reddit, market sources), so they are
+registered by dotted path and imported only when a channel of that (provider, kind) first runs.
+"""
 
 from __future__ import annotations
 
+from typing import Any
+
 from .base import ChannelHandlerProtocol
-from .google_news import handle_google_news
-from .generic_web import (
-    handle_generic_web_rss,
-    handle_generic_web_search_template,
-    handle_generic_web_sitemap,
+from ..handler_registry import load_handler, register_lazy
+
+# handler name -> "module:attr"
+_HANDLER_TARGETS: dict[str, str] = {
+    "handle_reddit": f"{__name__}.reddit:handle_reddit",
+    "handle_google_news": f"{__name__}.google_news:handle_google_news",
+    "handle_policy": f"{__name__}.policy:handle_policy",
+    "handle_market": f"{__name__}.market:handle_market",
+    "handle_url_pool": f"{__name__}.url_pool:handle_url_pool",
+    "handle_generic_web_rss": f"{__name__}.generic_web:handle_generic_web_rss",
+    "handle_generic_web_sitemap": f"{__name__}.generic_web:handle_generic_web_sitemap",
+    "handle_generic_web_search_template": f"{__name__}.generic_web:handle_generic_web_search_template",
+    "handle_official_access_api": f"{__name__}.official_access:handle_official_access_api",
+}
+
+_BUILTIN_CHANNELS: tuple[tuple[str, str, str], ...] = (
+    ("reddit", "social", "handle_reddit"),
+    ("google_news", "news", "handle_google_news"),
+    ("policy", "policy", "handle_policy"),
+    ("market", "market", "handle_market"),
+    ("url_pool", "urls", "handle_url_pool"),
+    # Tool-type channels (Phase 4 compatibility layer)
+    ("generic_web", "rss", "handle_generic_web_rss"),
+    ("generic_web", "sitemap", "handle_generic_web_sitemap"),
+    ("generic_web", "search_template", "handle_generic_web_search_template"),
+    ("official_access", "api", "handle_official_access_api"),
 )
-from .market import handle_market
-from .official_access import handle_official_access_api
-from .policy import handle_policy
-from .reddit import handle_reddit
-from .url_pool import handle_url_pool
-from ..handler_registry import register
 
 
 def _register_all() -> None:
-    """Register all builtin handlers. Called on first import."""
-    register("reddit", "social", handle_reddit)
-    register("google_news", "news", handle_google_news)
-    register("policy", "policy", handle_policy)
-    register("market", "market", handle_market)
-    register("url_pool", "urls", handle_url_pool)
-    # Tool-type channels (Phase 4 compatibility layer)
-    register("generic_web", "rss", handle_generic_web_rss)
-    register("generic_web", "sitemap", handle_generic_web_sitemap)
-    register("generic_web", "search_template", handle_generic_web_search_template)
-    register("official_access", "api", handle_official_access_api)
+    """Register all builtin handlers (lazily). Called on first import."""
+    for provider, kind, name in _BUILTIN_CHANNELS:
+        register_lazy(provider, kind, _HANDLER_TARGETS[name])
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: `from .adapters import handle_x` keeps working but imports only that module.
+    target = _HANDLER_TARGETS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    handler = load_handler(target)
+    globals()[name] = handler
+    return handler
 
 
 _register_all()
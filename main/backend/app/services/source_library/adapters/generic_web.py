@@ -2,16 +2,41 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import IO, Any, Dict, Iterable
 from urllib.parse import quote_plus, urljoin
 import gzip
+import io
+import re
+import threading
+import time
 import xml.etree.ElementTree as ET
+import zlib
 
-from ...ingest.adapters.http_utils import fetch_html, make_html_parser
-from ...resource_pool.extract import append_url
+import requests
+
+from ...ingest.adapters.http_utils import fetch_bytes, fetch_html, make_html_parser, make_pooled_session
+from ...resource_pool.extract import append_urls
 from ...resource_pool.url_utils import normalize_url
 
 
+_GZIP_MAGIC = b"\x1f\x8b"
+_SITEMAP_READ_CHUNK = 64 * 1024
+# Child sitemaps of one index level are fetched concurrently, at most this many at a time.
+_SITEMAP_FETCH_WORKERS = 8
+# Feed/sitemap bodies shared across concurrent pipelines: short TTL-LRU plus one in-flight fetch per URL.
+_FEED_CACHE_TTL_S = 300.0
+_FEED_CACHE_MAX = 256
+_FEED_CACHE_MAX_BODY = 5 * 1024 * 1024  # larger sitemaps are still single-flighted, just not kept
+_feed_cache: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+_feed_inflight: dict[str, Future] = {}
+_feed_lock = threading.Lock()
+# Quoted href of an <a> tag, up to any fragment; enough for search-result pages without a DOM parse.
+_HREF_RE = re.compile(r"""<a\b[^>]*?\shref\s*=\s*["']([^"'>#\s]+)""", re.I)
+
+
 def _as_terms(raw: Any) -> list[str]:
     if raw is None:
         return []
@@ -31,117 +56,229 @@ def _as_terms(raw: Any) -> list[str]:
 def _filter_by_terms(urls: list[str], terms: list[str]) -> list[str]:
     if not terms:
         return urls
-    low_terms = [x.lower() for x in terms]
-    return [u for u in urls if any(t in u.lower() for t in low_terms)]
+    low_terms = list(dict.fromkeys(x.lower() for x in terms))
+    kept: list[str] = []
+    for u in urls:
+        low = u.lower()  # once per URL, not once per term
+        for t in low_terms:
+            if t in low:
+                kept.append(u)
+                break
+    return kept
 
 
-def _extract_rss_urls(xml_text: str) -> list[str]:
-    urls: list[str] = []
+def _iter_xml_events(source: str | bytes | IO[bytes], events: tuple[str, ...]) -> Iterable[tuple[str, ET.Element]]:
+    """Pull-parse `source` in chunks; a truncated or corrupt document just ends the stream."""
+    parser = ET.XMLPullParser(events=events)
+    if isinstance(source, (str, bytes)):
+        chunks: Iterable[str | bytes] = [source]
+    else:
+        chunks = iter(partial(source.read, _SITEMAP_READ_CHUNK), b"")
     try:
-        root = ET.fromstring(xml_text)
-    except Exception:
-        return urls
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from parser.read_events()
+        parser.close()
+    except (ET.ParseError, OSError, EOFError, zlib.error):
+        return
 
-    for item in root.findall(".//{*}item"):
-        link = item.find("{*}link")
-        if link is not None and link.text:
-            u = normalize_url(link.text.strip())
-            if u and u not in urls:
-                urls.append(u)
-    for entry in root.findall(".//{*}entry"):
-        for link in entry.findall("{*}link"):
-            href = (link.attrib.get("href") or "").strip()
-            if not href:
-                continue
-            u = normalize_url(href)
-            if u and u not in urls:
+
+def _extract_rss_urls(source: str | bytes | IO[bytes]) -> list[str]:
+    """RSS <item><link> and Atom <entry><link href> URLs in document order, from one streaming pass."""
+    urls: list[str] = []
+    seen: set[str] = set()
+    for _, elem in _iter_xml_events(source, ("end",)):
+        local = elem.tag.rpartition("}")[2]
+        if local == "item":
+            link = elem.find("{*}link")
+            raw = [link.text] if link is not None and link.text else []
+        elif local == "entry":
+            raw = [link.attrib.get("href") or "" for link in elem.findall("{*}link")]
+        else:
+            continue
+        for href in raw:
+            u = normalize_url(href.strip())
+            if u and u not in seen:
+                seen.add(u)
                 urls.append(u)
+        elem.clear()
     return urls
 
 
-def _extract_sitemap_locs(xml_text: str) -> tuple[str, list[str]]:
-    try:
-        root = ET.fromstring(xml_text)
-    except Exception:
-        return "unknown", []
-    tag = root.tag.split("}", 1)[-1].lower()
+def _extract_sitemap_locs(source: str | IO[bytes]) -> tuple[str, list[str]]:
+    """Stream <loc> values out of a urlset/sitemapindex document; returns (root tag, locs).
+
+    Finished entries are detached from the root as soon as they are read, so a large sitemap
+    never holds more than one entry in memory. A truncated or corrupt document keeps the locs
+    read before the error.
+    """
+    root: ET.Element | None = None
+    tag = "unknown"
+    depth = 0
     locs: list[str] = []
-    for loc in root.findall(".//{*}loc"):
-        if loc.text:
-            u = normalize_url(loc.text.strip())
-            if u and u not in locs:
+    seen: set[str] = set()
+    for event, elem in _iter_xml_events(source, ("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+                tag = elem.tag.rpartition("}")[2].lower()
+            depth += 1
+            continue
+        depth -= 1
+        if elem.tag.rpartition("}")[2] == "loc" and elem.text:
+            u = normalize_url(elem.text.strip())
+            if u and u not in seen:
+                seen.add(u)
                 locs.append(u)
+        if depth == 1 and root is not None:
+            del root[:]
     return tag, locs
 
 
-def _fetch_text_maybe_gzip(url: str, timeout: float) -> str:
-    text, resp = fetch_html(url, timeout=timeout, retries=1)
-    if url.lower().endswith(".gz"):
-        try:
-            return gzip.decompress(resp.content).decode("utf-8", errors="ignore")
-        except Exception:
-            return text
-    return text
+def _fetch_feed_body(url: str, timeout: float, session: requests.Session | None = None) -> bytes:
+    """Raw feed/sitemap body, reused for _FEED_CACHE_TTL_S; concurrent callers share one request."""
+    key = url.strip()
+    with _feed_lock:
+        hit = _feed_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < _FEED_CACHE_TTL_S:
+            _feed_cache.move_to_end(key)
+            return hit[1]
+        pending = _feed_inflight.get(key)
+        leader = pending is None
+        if leader:
+            pending = _feed_inflight[key] = Future()
+    if not leader:
+        return pending.result()
+
+    try:
+        body = fetch_bytes(url, timeout=timeout, retries=1, session=session)
+    except BaseException as exc:
+        with _feed_lock:
+            _feed_inflight.pop(key, None)
+        pending.set_exception(exc)
+        raise
+    with _feed_lock:
+        _feed_inflight.pop(key, None)
+        if len(body) <= _FEED_CACHE_MAX_BODY:
+            _feed_cache[key] = (time.monotonic(), body)
+            _feed_cache.move_to_end(key)
+            while len(_feed_cache) > _FEED_CACHE_MAX:
+                _feed_cache.popitem(last=False)
+    pending.set_result(body)
+    return body
+
+
+def _open_feed(url: str, timeout: float, session: requests.Session | None = None) -> IO[bytes]:
+    body = _fetch_feed_body(url, timeout=timeout, session=session)
+    # Sniff the magic bytes: .gz sitemaps are often served already decoded (Content-Encoding).
+    if body[:2] == _GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=io.BytesIO(body))
+    return io.BytesIO(body)
 
 
 def _collect_sitemap_urls(url: str, timeout: float, max_depth: int = 2, max_sitemaps: int = 30) -> list[str]:
     seen: set[str] = set()
-    queue: list[tuple[str, int]] = [(url, 0)]
+    level: list[str] = [url]
     urls: list[str] = []
+    urls_seen: set[str] = set()
     fetched = 0
-    while queue and fetched < max_sitemaps:
-        current, depth = queue.pop(0)
-        if current in seen:
-            continue
-        seen.add(current)
-        fetched += 1
-        xml_text = _fetch_text_maybe_gzip(current, timeout=timeout)
-        kind, locs = _extract_sitemap_locs(xml_text)
-        if kind.endswith("sitemapindex") and depth < max_depth:
-            for loc in locs:
-                if loc not in seen:
-                    queue.append((loc, depth + 1))
-            continue
-        for loc in locs:
-            if loc not in urls:
-                urls.append(loc)
+    depth = 0
+    session = make_pooled_session(_SITEMAP_FETCH_WORKERS)
+
+    def _read(sitemap_url: str) -> tuple[str, list[str]]:
+        return _extract_sitemap_locs(_open_feed(sitemap_url, timeout=timeout, session=session))
+
+    try:
+        # Breadth-first, one index level per round: same visit order and budget as a FIFO queue.
+        while level and fetched < max_sitemaps:
+            batch = [u for u in dict.fromkeys(level) if u not in seen][: max_sitemaps - fetched]
+            seen.update(batch)
+            fetched += len(batch)
+            if len(batch) <= 1:
+                parsed = [_read(u) for u in batch]
+            else:
+                with ThreadPoolExecutor(max_workers=min(_SITEMAP_FETCH_WORKERS, len(batch))) as executor:
+                    parsed = list(executor.map(_read, batch))
+            level = []
+            for kind, locs in parsed:
+                if kind.endswith("sitemapindex") and depth < max_depth:
+                    level.extend(loc for loc in locs if loc not in seen)
+                    continue
+                for loc in locs:
+                    if loc not in urls_seen:
+                        urls_seen.add(loc)
+                        urls.append(loc)
+            depth += 1
+    finally:
+        session.close()
     return urls
 
 
-def _extract_html_links(html: str, *, base_url: str) -> list[str]:
+def _iter_hrefs(html: str, *, use_parser: bool) -> Iterable[str]:
+    if not use_parser:
+        return (m.group(1) for m in _HREF_RE.finditer(html))
+    return ((node.attributes.get("href") or "").strip() for node in make_html_parser(html).css("a"))
+
+
+def _extract_html_links(
+    html: str,
+    *,
+    base_url: str,
+    use_parser: bool = False,
+    terms: list[str] | None = None,
+) -> list[str]:
+    """Collect normalized <a href> links in page order.
+
+    The default regex scan covers quoted hrefs and falls back to walking the DOM when it finds
+    none; use_parser=True always walks the DOM (unquoted or entity-escaped hrefs). With `terms`,
+    links whose absolute URL contains none of them are dropped before normalization; callers
+    still apply _filter_by_terms to the normalized result.
+    """
+    low_terms = list(dict.fromkeys(t.lower() for t in terms or ()))
     urls: list[str] = []
-    parser = make_html_parser(html)
-    for node in parser.css("a"):
-        href = (node.attributes.get("href") or "").strip()
+    seen: set[str] = set()
+    found_href = False
+    for href in _iter_hrefs(html, use_parser=use_parser):
         if not href:
             continue
-        u = normalize_url(urljoin(base_url, href))
-        if u and u not in urls:
+        found_href = True
+        joined = urljoin(base_url, href)
+        if low_terms:
+            low = joined.lower()
+            if not any(t in low for t in low_terms):
+                continue
+        u = normalize_url(joined)
+        if u and u not in seen:
+            seen.add(u)
             urls.append(u)
+    if not found_href and not use_parser:
+        return _extract_html_links(html, base_url=base_url, use_parser=True, terms=terms)
     return urls
 
 
-def _maybe_write_to_pool(urls: Iterable[str], *, params: Dict[str, Any], project_key: str | None, source: str) -> dict[str, int] | None:
+def _maybe_write_to_pool(
+    urls: Iterable[str],
+    *,
+    params: Dict[str, Any],
+    terms: list[str],
+    project_key: str | None,
+    source: str,
+) -> dict[str, int] | None:
     if not params.get("write_to_pool"):
         return None
     scope = str(params.get("pool_scope") or "project")
     if scope not in {"project", "shared"}:
         scope = "project"
-    new_count = 0
-    skipped = 0
-    for u in urls:
-        ok = append_url(
-            url=u,
-            source=source,
-            source_ref={"tool": source, "query_terms": _as_terms(params.get("query_terms"))},
-            scope=scope,
-            project_key=(project_key or ""),
-        )
-        if ok:
-            new_count += 1
-        else:
-            skipped += 1
-    return {"urls_new": new_count, "urls_skipped": skipped}
+    url_list = list(urls)
+    source_ref = {"tool": source, "query_terms": terms}
+    flags = append_urls(
+        [(u, source_ref) for u in url_list],
+        source,
+        scope=scope,
+        project_key=(project_key or ""),
+    )
+    new_count = sum(1 for ok in flags.values() if ok)
+    return {"urls_new": new_count, "urls_skipped": len(url_list) - new_count}
 
 
 def handle_generic_web_rss(params: Dict[str, Any], project_key: str | None) -> Dict[str, Any]:
@@ -150,9 +287,8 @@ def handle_generic_web_rss(params: Dict[str, Any], project_key: str | None) -> D
         raise ValueError("generic_web.rss requires params.feed_url or params.site_url")
     timeout = float(params.get("probe_timeout") or 10)
     terms = _as_terms(params.get("query_terms"))
-    xml_text = _fetch_text_maybe_gzip(feed_url, timeout=timeout)
-    candidates = _filter_by_terms(_extract_rss_urls(xml_text), terms)
-    written = _maybe_write_to_pool(candidates, params=params, project_key=project_key, source="generic_web_rss")
+    candidates = _filter_by_terms(_extract_rss_urls(_open_feed(feed_url, timeout=timeout)), terms)
+    written = _maybe_write_to_pool(candidates, params=params, terms=terms, project_key=project_key, source="generic_web_rss")
     return {"inserted": len(candidates), "skipped": 0, "candidates": candidates, "written": written}
 
 
@@ -171,7 +307,7 @@ def handle_generic_web_sitemap(params: Dict[str, Any], project_key: str | None)
         ),
         terms,
     )
-    written = _maybe_write_to_pool(candidates, params=params, project_key=project_key, source="generic_web_sitemap")
+    written = _maybe_write_to_pool(candidates, params=params, terms=terms, project_key=project_key, source="generic_web_sitemap")
     return {"inserted": len(candidates), "skipped": 0, "candidates": candidates, "written": written}
 
 
@@ -185,7 +321,10 @@ def handle_generic_web_search_template(params: Dict[str, Any], project_key: str
     page = str(params.get("page") or 1)
     search_url = template.replace("{{q}}", joined).replace("{{page}}", page)
     html, _ = fetch_html(search_url, timeout=timeout, retries=1)
-    candidates = _filter_by_terms(_extract_html_links(html, base_url=search_url), terms)
-    written = _maybe_write_to_pool(candidates, params=params, project_key=project_key, source="generic_web_search_template")
+    candidates = _filter_by_terms(
+        _extract_html_links(html, base_url=search_url, use_parser=bool(params.get("use_html_parser")), terms=terms),
+        terms,
+    )
+    written = _maybe_write_to_pool(candidates, params=params, terms=terms, project_key=project_key, source="generic_web_search_template")
     return {"inserted": len(candidates), "skipped": 0, "candidates": candidates, "written": written}
 
@@ -2,21 +2,42 @@
 
 from __future__ import annotations
 
+import importlib
 from typing import Any, Callable, Dict
 
 ChannelHandler = Callable[[Dict[str, Any], str | None], Dict[str, Any]]
 ChannelKey = tuple[str, str]
 
 _HANDLERS: dict[ChannelKey, ChannelHandler] = {}
+# (provider, kind) -> "package.module:attr", imported on first get()
+_LAZY_HANDLERS: dict[ChannelKey, str] = {}
+
+
+def _key(provider: str, kind: str) -> ChannelKey:
+    return (provider.strip().lower(), kind.strip().lower())
 
 
 def register(provider: str, kind: str, handler: ChannelHandler) -> None:
     """Register a builtin handler for (provider, kind)."""
-    key = (provider.strip().lower(), kind.strip().lower())
-    _HANDLERS[key] = handler
+    _HANDLERS[_key(provider, kind)] = handler
+
+
+def register_lazy(provider: str, kind: str, target: str) -> None:
+    """Register a handler by "module:attr" path; the module is imported when the handler is first requested."""
+    key = _key(provider, kind)
+    if key not in _HANDLERS:
+        _LAZY_HANDLERS[key] = target
+
+
+def load_handler(target: str) -> ChannelHandler:
+    module_name, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
 
 
 def get(provider: str, kind: str) -> ChannelHandler | None:
     """Return builtin handler for (provider, kind), or None if not registered."""
-    key = (provider.strip().lower(), kind.strip().lower())
-    return _HANDLERS.get(key)
+    key = _key(provider, kind)
+    handler = _HANDLERS.get(key)
+    if handler is None and key in _LAZY_HANDLERS:
+        handler = _HANDLERS[key] = load_handler(_LAZY_HANDLERS[key])
+    return handler
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import copy
+import threading
+import time
 from contextlib import nullcontext
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
 
 from sqlalchemy import select
 
@@ -49,33 +53,49 @@ def _as_bool(value: Any, default: bool) -> bool:
 
 
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursive dict merge (override wins); only the nested dicts present on both sides are copied."""
+    if not override:
+        return dict(base)
+    if not base:
+        return dict(override)
     merged = dict(base)
-    for key, value in override.items():
-        if isinstance(value, dict) and isinstance(merged.get(key), dict):
-            merged[key] = _deep_merge(merged[key], value)
-        else:
-            merged[key] = value
+    stack = [(merged, override)]
+    while stack:
+        out, over = stack.pop()
+        for key, value in over.items():
+            current = out.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                out[key] = child = dict(current)
+                stack.append((child, value))
+            else:
+                out[key] = value
     return merged
 
 
+def _channel_route_info(channel: Dict[str, Any]) -> tuple[str, str, bool]:
+    """(provider, kind, is_crawler) of a channel, normalized once per routed channel."""
+    provider = str(channel.get("provider") or "").strip().lower()
+    kind = str(channel.get("kind") or "").strip().lower()
+    return provider, kind, _is_crawler_channel(channel)
+
+
 def _inject_url_params_for_channel(
     *,
-    channel: Dict[str, Any],
     per_url_params: Dict[str, Any],
     url_str: str,
+    provider: str,
+    kind: str,
+    is_crawler: bool,
 ) -> Dict[str, Any]:
-    """Map a routed URL into channel-specific params for tool channels."""
-    provider = str(channel.get("provider") or "").strip().lower()
-    kind = str(channel.get("kind") or "").strip().lower()
-
+    """Map a routed URL into channel-specific params for tool channels (see _channel_route_info)."""
     # Preserve raw URL for adapters that directly consume url/urls.
     per_url_params.setdefault("url", url_str)
     per_url_params["urls"] = [url_str]
 
     # Crawler providers consume runtime payload from params.arguments.
-    provider_type = str(channel.get("provider_type") or "").strip().lower()
-    if provider_type in {"scrapy", "crawlee", "meltano"}:
-        arguments = _as_dict(per_url_params.get("arguments"))
+    if is_crawler:
+        # Copy: the arguments dict is shared by every URL routed to this channel.
+        arguments = dict(_as_dict(per_url_params.get("arguments")))
         arguments.setdefault("url", url_str)
         arguments.setdefault("urls", [url_str])
         per_url_params["arguments"] = arguments
@@ -165,6 +185,44 @@ def _item_row_to_dict(row: Any, scope: str) -> Dict[str, Any]:
     }
 
 
+# Bumped by every in-process writer of source-library items; the TTL bucket bounds staleness for
+# writes made by other processes and for edits to the library files.
+_ITEMS_REVISION = 0
+_ITEMS_REVISION_LOCK = threading.Lock()
+
+
+def bump_source_library_revision() -> None:
+    global _ITEMS_REVISION
+    with _ITEMS_REVISION_LOCK:
+        _ITEMS_REVISION += 1
+
+
+# Raw shared/project rows behind list_effective_*; hot read paths reuse them for a few seconds
+# instead of re-running both schema-bound SELECTs and re-reading the library files.
+_LIBRARY_ROWS_TTL_S = 5.0
+
+
+def _library_cache_key() -> tuple[int, int]:
+    """(revision, TTL bucket) shared by every source-library cache, so they expire together."""
+    return _ITEMS_REVISION, int(time.monotonic() // _LIBRARY_ROWS_TTL_S)
+
+
+@lru_cache(maxsize=128)
+def _cached_library_rows(
+    loader: Callable[..., List[Dict[str, Any]]],
+    args: tuple,
+    revision: int,
+    ttl_bucket: int,
+) -> List[Dict[str, Any]]:
+    return loader(*args)
+
+
+def _library_rows(loader: Callable[..., List[Dict[str, Any]]], *args: Any) -> List[Dict[str, Any]]:
+    rows = _cached_library_rows(loader, args, *_library_cache_key())
+    # Callers merge into and mutate the returned dicts; never hand out the cached ones.
+    return copy.deepcopy(rows)
+
+
 def _load_shared_channels() -> List[Dict[str, Any]]:
     with bind_schema("public"):
         with SessionLocal() as session:
@@ -422,8 +480,8 @@ _BUILTIN_TOOL_CHANNELS: list[dict[str, Any]] = [
 
 
 def list_effective_channels(scope: str = "effective", project_key: str | None = None) -> List[Dict[str, Any]]:
-    shared_channels = _load_shared_channels()
-    project_channels = _load_project_channels(project_key)
+    shared_channels = _library_rows(_load_shared_channels)
+    project_channels = _library_rows(_load_project_channels, project_key)
 
     # Inject built-in tool channels if not present (unified channels list)
     shared_keys = {x["channel_key"] for x in shared_channels}
@@ -462,19 +520,12 @@ def list_items_by_symbol(scope: str = "effective", project_key: str | None = Non
     for it in items:
         tags = it.get("tags") or []
         if not tags:
-            key = "_untagged"
-        else:
-            for t in tags:
-                key = str(t).strip()
-                if not key:
-                    continue
-                if key not in grouped:
-                    grouped[key] = []
-                grouped[key].append(it)
-        if not tags:
-            if "_untagged" not in grouped:
-                grouped["_untagged"] = []
-            grouped["_untagged"].append(it)
+            grouped.setdefault("_untagged", []).append(it)
+            continue
+        for t in tags:
+            key = str(t).strip()
+            if key:
+                grouped.setdefault(key, []).append(it)
     return grouped
 
 
@@ -483,37 +534,46 @@ def list_channels_grouped_by_provider(scope: str = "effective", project_key: str
     channels = list_effective_channels(scope=scope, project_key=project_key)
     grouped: Dict[str, List[Dict[str, Any]]] = {}
     for ch in channels:
-        prov = str(ch.get("provider") or "unknown").strip()
-        if prov not in grouped:
-            grouped[prov] = []
-        grouped[prov].append(ch)
+        grouped.setdefault(str(ch.get("provider") or "unknown").strip(), []).append(ch)
     return grouped
 
 
-def list_items_grouped_by_channel(scope: str = "effective", project_key: str | None = None) -> Dict[str, List[Dict[str, Any]]]:
-    """Group items by handler key (provider/kind), fallback channel_key."""
-    items = list_effective_items(scope=scope, project_key=project_key)
-    channels = list_effective_channels(scope=scope, project_key=project_key)
-    channel_map = {str(ch.get("channel_key") or "").strip(): ch for ch in channels}
-    grouped: Dict[str, List[Dict[str, Any]]] = {}
-    for it in items:
-        channel_key = str(it.get("channel_key") or "").strip()
-        ch = channel_map.get(channel_key) or {}
+def list_items_grouped_by_channel(
+    scope: str = "effective",
+    project_key: str | None = None,
+    *,
+    items: List[Dict[str, Any]] | None = None,
+    channels: List[Dict[str, Any]] | None = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Group items by handler key (provider/kind), fallback channel_key.
+
+    Callers that already resolved the effective items/channels can pass them in to skip the lookups.
+    """
+    if items is None:
+        items = list_effective_items(scope=scope, project_key=project_key)
+    if channels is None:
+        channels = list_effective_channels(scope=scope, project_key=project_key)
+    # One pass over channels: channel_key -> handler key, only for channels with provider and kind.
+    handler_keys: Dict[str, str] = {}
+    for ch in channels:
         provider = str(ch.get("provider") or "").strip().lower()
         kind = str(ch.get("kind") or "").strip().lower()
+        channel_key = str(ch.get("channel_key") or "").strip()
         if provider and kind:
-            handler_key = f"{provider}/{kind}"
+            handler_keys[channel_key] = f"{provider}/{kind}"
         else:
-            handler_key = str(channel_key or "unknown").strip() or "unknown"
-        if handler_key not in grouped:
-            grouped[handler_key] = []
-        grouped[handler_key].append(it)
+            handler_keys.pop(channel_key, None)  # a later duplicate row wins, as in a dict build
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for it in items:
+        channel_key = str(it.get("channel_key") or "").strip()
+        handler_key = handler_keys.get(channel_key) or channel_key or "unknown"
+        grouped.setdefault(handler_key, []).append(it)
     return grouped
 
 
 def list_effective_items(scope: str = "effective", project_key: str | None = None) -> List[Dict[str, Any]]:
-    shared_items = _load_shared_items()
-    project_items = _load_project_items(project_key)
+    shared_items = _library_rows(_load_shared_items)
+    project_items = _library_rows(_load_project_items, project_key)
 
     # Inject built-in url_pool.default item if channel exists and no url_pool item present
     shared_keys = {x["item_key"] for x in shared_items}
@@ -529,6 +589,20 @@ def list_effective_items(scope: str = "effective", project_key: str | None = Non
     return _merge_items(shared_items, project_items)
 
 
+@lru_cache(maxsize=64)
+def _effective_item_map(project_key: str | None, revision: int, ttl_bucket: int) -> Dict[str, Dict[str, Any]]:
+    items = list_effective_items(scope="effective", project_key=project_key)
+    return {x.get("item_key"): x for x in items if isinstance(x, dict)}
+
+
+def get_effective_item(item_key: str, project_key: str | None = None) -> Dict[str, Any] | None:
+    """Look up one effective item by key from a per-project cached index."""
+    # Same key as the row cache beneath it: the item index never outlives the rows it was built from.
+    item_map = _effective_item_map(project_key, *_library_cache_key())
+    item = item_map.get(item_key)
+    return copy.deepcopy(item) if item is not None else None
+
+
 def run_item_with_url_routing(
     *,
     item: Dict[str, Any],
@@ -567,6 +641,11 @@ def run_item_with_url_routing(
                 project_key=project_key,
             )
 
+    params_no_urls = {k: v for k, v in params.items() if k != "urls"}
+    # channel_key -> (default_params merged with params minus urls, provider, kind, is_crawler);
+    # computed once per channel, each URL then only overlays its own url fields.
+    channel_routes: Dict[str, tuple[Dict[str, Any], str, str, bool]] = {}
+
     for url in urls:
         url_str = str(url).strip() if url else ""
         if not url_str or not url_str.startswith(("http://", "https://")):
@@ -593,12 +672,18 @@ def run_item_with_url_routing(
             by_url.append({"url": url_str, "channel_key": channel_key, "error": "channel disabled", "result": None})
             continue
 
-        per_url_params = _deep_merge(channel.get("default_params") or {}, params)
-        per_url_params = {k: v for k, v in per_url_params.items() if k != "urls"}
+        route = channel_routes.get(channel_key)
+        if route is None:
+            base_params = _deep_merge(channel.get("default_params") or {}, params_no_urls)
+            base_params.pop("urls", None)
+            route = channel_routes[channel_key] = (base_params, *_channel_route_info(channel))
+        base_params, provider, kind, is_crawler = route
         per_url_params = _inject_url_params_for_channel(
-            channel=channel,
-            per_url_params=per_url_params,
+            per_url_params=dict(base_params),
             url_str=url_str,
+            provider=provider,
+            kind=kind,
+            is_crawler=is_crawler,
         )
 
         try:
@@ -633,10 +718,7 @@ def run_item_by_key(
     channels = list_effective_channels(scope="effective", project_key=project_key)
     items = list_effective_items(scope="effective", project_key=project_key)
 
-    item_map = {x["item_key"]: x for x in items}
-    channel_map = {x["channel_key"]: x for x in channels}
-
-    item = item_map.get(item_key)
+    item = next((x for x in items if x["item_key"] == item_key), None)
     if item is None:
         raise ValueError(f"source item not found: {item_key}")
     return run_item_payload(item=item, channels=channels, project_key=project_key, override_params=override_params)
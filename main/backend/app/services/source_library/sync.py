@@ -8,6 +8,7 @@ from ...models.base import SessionLocal
 from ...models.entities import SharedIngestChannel, SharedSourceLibraryItem
 from ..projects import bind_schema
 from .loader import load_global_library_files
+from .resolver import bump_source_library_revision
 
 
 def _as_list(value: Any) -> list:
@@ -87,6 +88,7 @@ def sync_shared_library_from_files() -> Dict[str, Any]:
                 upserted_items += 1
 
             session.commit()
+    bump_source_library_revision()
 
     return {
         "upserted_channels": upserted_channels,
@@ -18,7 +18,7 @@ def _domain_from_url(url: str) -> str:
         netloc = parsed.netloc or ""
         if not netloc:
             return ""
-        return netloc.lower().lstrip("www.")
+        return netloc.lower().removeprefix("www.")
     except Exception:
         return ""
 
@@ -304,6 +304,7 @@ def task_discover_site_entries_batched(
     use_llm: bool = False,
     write: bool = True,
     batch_size: int = 20,
+    total_deadline_s: float | None = None,
     simplify_pool_first: bool = True,
 ) -> dict:
     from .resource_pool import (
@@ -368,6 +369,7 @@ def task_discover_site_entries_batched(
                 deny_domains=deny_domains,
                 run_auto_classify=run_auto_classify,
                 use_llm=use_llm,
+                total_deadline_s=total_deadline_s,
             )
             totals["domains_scanned"] += int(result.domains_scanned or 0)
             totals["candidates_count"] += len(result.candidates or [])
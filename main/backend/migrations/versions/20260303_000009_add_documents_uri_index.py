@@ -0,0 +1,44 @@
+"""add documents uri index
+
+Revision ID: 20260303_000009
+Revises: 20260303_000008
+Create Date: 2026-03-03 20:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260303_000009"
+down_revision = "20260303_000008"
+branch_labels = None
+depends_on = None
+
+
+def _target_schemas(conn) -> list[str]:
+    rows = conn.execute(
+        sa.text(
+            "SELECT DISTINCT table_schema FROM information_schema.tables "
+            "WHERE table_name = 'documents'"
+        )
+    ).fetchall()
+    schemas = [str(r[0]) for r in rows if r and r[0]]
+    return schemas or ["public"]
+
+
+def upgrade() -> None:
+    # search_sources(exclude_existing=True) looks candidate links up with uri IN (...).
+    # Hash, not btree: only equality is needed and long URLs cannot hit the btree row size limit.
+    for schema in _target_schemas(op.get_bind()):
+        op.execute(
+            sa.text(
+                f'CREATE INDEX IF NOT EXISTS ix_documents_uri '
+                f'ON "{schema}"."documents" USING hash (uri)'
+            )
+        )
+
+
+def downgrade() -> None:
+    for schema in _target_schemas(op.get_bind()):
+        op.execute(sa.text(f'DROP INDEX IF EXISTS "{schema}"."ix_documents_uri"'))
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.search import es_client
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class EsClientUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"es client unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def setUp(self):
+        patcher = patch.object(es_client, "_client", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_client_is_shared_until_es_url_changes(self):
+        with patch.object(es_client.settings, "es_url", "http://es-a:9200"):
+            first = es_client.get_es_client()
+            second = es_client.get_es_client()
+        with patch.object(es_client.settings, "es_url", "http://es-b:9200"):
+            third = es_client.get_es_client()
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+
+
+if __name__ == "__main__":
+    unittest.main()
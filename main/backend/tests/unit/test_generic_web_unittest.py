@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import gzip
+import io
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.source_library.adapters import generic_web
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class GenericWebUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"generic_web unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def setUp(self):
+        generic_web._feed_cache.clear()
+
+    def test_extractors_dedup_in_first_seen_order(self):
+        rss = (
+            "<rss><channel>"
+            "<item><link>https://a.example/1</link></item>"
+            "<item><link>https://a.example/2</link></item>"
+            "<item><link>https://a.example/1#dup</link></item>"
+            "</channel></rss>"
+        )
+        sitemap = (
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            "<url><loc>https://a.example/b</loc></url>"
+            "<url><loc>https://a.example/a</loc></url>"
+            "<url><loc>https://a.example/b</loc></url>"
+            "</urlset>"
+        )
+        html = (
+            '<a href="/x">x</a><A class="r" HREF = \'https://a.example/y\'>y</A>'
+            '<a href="/x#top">x</a><a href="#">top</a><abbr href="/no">n</abbr>'
+        )
+
+        atom = (
+            '<feed xmlns="http://www.w3.org/2005/Atom">'
+            '<entry><link href="https://a.example/3"/><link rel="alternate" href="https://a.example/4"/></entry>'
+            '<entry><link href="https://a.example/3"/></entry><entry><link href="https://a.ex'
+        )
+        self.assertEqual(generic_web._extract_rss_urls(rss), ["https://a.example/1", "https://a.example/2"])
+        self.assertEqual(
+            generic_web._extract_rss_urls(io.BytesIO(atom.encode())), ["https://a.example/3", "https://a.example/4"]
+        )
+        self.assertEqual(generic_web._extract_sitemap_locs(sitemap), ("urlset", ["https://a.example/b", "https://a.example/a"]))
+        self.assertEqual(
+            generic_web._extract_html_links(html, base_url="https://a.example/search"),
+            ["https://a.example/x", "https://a.example/y"],
+        )
+        self.assertEqual(
+            generic_web._extract_html_links(html, base_url="https://a.example/search", use_parser=True),
+            ["https://a.example/x", "https://a.example/y", "https://a.example/search"],
+        )
+        self.assertEqual(
+            generic_web._extract_html_links(html, base_url="https://a.example/search", terms=["Y"]),
+            ["https://a.example/y"],
+        )
+        self.assertEqual(
+            generic_web._extract_html_links("<a href=/z>z</a>", base_url="https://a.example/search"),
+            ["https://a.example/z"],
+        )
+
+    def test_sitemap_index_is_streamed_from_plain_and_gzipped_bodies(self):
+        ns = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+        bodies = {
+            "https://a.example/sitemap.xml": (
+                f"<sitemapindex {ns}><sitemap><loc>https://a.example/s1.xml.gz</loc></sitemap></sitemapindex>"
+            ).encode(),
+            "https://a.example/s1.xml.gz": gzip.compress(
+                f"<urlset {ns}><url><loc>https://a.example/p1</loc></url><url><loc>https://a.example/p2</loc></url></urlset>".encode()
+            ),
+        }
+
+        def _fetch(url, **kwargs):  # noqa: ANN001
+            return bodies[url]
+
+        with patch.object(generic_web, "fetch_bytes", side_effect=_fetch):
+            urls = generic_web._collect_sitemap_urls("https://a.example/sitemap.xml", timeout=5)
+
+        self.assertEqual(urls, ["https://a.example/p1", "https://a.example/p2"])
+        truncated = f"<urlset {ns}><url><loc>https://a.example/p1</loc></url><url><loc>https://a.ex"
+        self.assertEqual(generic_web._extract_sitemap_locs(truncated), ("urlset", ["https://a.example/p1"]))
+        self.assertEqual(generic_web._extract_sitemap_locs("not xml"), ("unknown", []))
+
+    def test_sitemap_index_children_fetched_per_level_within_budget(self):
+        ns = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+        children = [f"https://a.example/s{i}.xml" for i in range(3)]
+        bodies = {
+            "https://a.example/sitemap.xml": (
+                f"<sitemapindex {ns}>" + "".join(f"<sitemap><loc>{c}</loc></sitemap>" for c in children) + "</sitemapindex>"
+            ).encode(),
+        }
+        for i, child in enumerate(children):
+            bodies[child] = f"<urlset {ns}><url><loc>https://a.example/p{i}</loc></url></urlset>".encode()
+
+        def _fetch(url, **kwargs):  # noqa: ANN001
+            self.assertIsNotNone(kwargs.get("session"))
+            return bodies[url]
+
+        with patch.object(generic_web, "fetch_bytes", side_effect=_fetch) as fetch:
+            urls = generic_web._collect_sitemap_urls("https://a.example/sitemap.xml", timeout=5, max_sitemaps=3)
+
+        self.assertEqual(urls, ["https://a.example/p0", "https://a.example/p1"])
+        self.assertEqual(fetch.call_count, 3)
+
+    def test_write_to_pool_uses_one_bulk_append(self):
+        urls = ["https://a.example/1", "https://a.example/2", "https://a.example/3"]
+        flags = {"https://a.example/1": True, "https://a.example/2": False, "https://a.example/3": True}
+        params = {"write_to_pool": True, "pool_scope": "shared", "query_terms": ["lottery"]}
+
+        with patch.object(generic_web, "append_urls", return_value=flags) as append:
+            written = generic_web._maybe_write_to_pool(
+                iter(urls), params=params, terms=["lottery"], project_key=None, source="generic_web_rss"
+            )
+
+        self.assertEqual(written, {"urls_new": 2, "urls_skipped": 1})
+        append.assert_called_once()
+        url_refs = append.call_args.args[0]
+        self.assertEqual([u for u, _ in url_refs], urls)
+        self.assertEqual(url_refs[0][1], {"tool": "generic_web_rss", "query_terms": ["lottery"]})
+        self.assertEqual(append.call_args.kwargs, {"scope": "shared", "project_key": ""})
+
+    def test_filter_by_terms_matches_case_insensitively_in_order(self):
+        urls = ["https://a.example/Lottery/1", "https://a.example/news", "https://a.example/POWERBALL"]
+
+        self.assertEqual(generic_web._filter_by_terms(urls, []), urls)
+        self.assertEqual(
+            generic_web._filter_by_terms(urls, ["powerball", "LOTTERY", "lottery"]),
+            ["https://a.example/Lottery/1", "https://a.example/POWERBALL"],
+        )
+
+    def test_concurrent_feed_fetches_share_one_request(self):
+        release = threading.Event()
+        body = b"<rss><channel><item><link>https://a.example/1</link></item></channel></rss>"
+
+        def _fetch(url, **kwargs):  # noqa: ANN001
+            release.wait(5)
+            return body
+
+        results: list[bytes] = []
+        with patch.object(generic_web, "fetch_bytes", side_effect=_fetch) as fetch:
+            threads = [
+                threading.Thread(target=lambda: results.append(generic_web._fetch_feed_body("https://a.example/feed", 5)))
+                for _ in range(3)
+            ]
+            for t in threads:
+                t.start()
+            release.set()
+            for t in threads:
+                t.join(5)
+            cached = generic_web.handle_generic_web_rss({"feed_url": " https://a.example/feed "}, None)
+            with patch.object(generic_web, "_FEED_CACHE_TTL_S", 0.0):
+                generic_web._fetch_feed_body("https://a.example/feed", 5)
+
+        self.assertEqual(results, [body] * 3)
+        self.assertEqual(cached["candidates"], ["https://a.example/1"])
+        self.assertEqual(fetch.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
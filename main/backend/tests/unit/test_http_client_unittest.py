@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.http import client as http_client
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class HttpClientUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"http client unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def test_no_backoff_sleep_after_the_last_attempt(self):
+        client = http_client.HttpClient(max_retries=2)
+        client._client = MagicMock()
+        client._client.get.side_effect = RuntimeError("down")
+
+        with patch.object(http_client.time, "sleep") as sleep:
+            with self.assertRaises(RuntimeError):
+                client.get_json("https://api.example/search")
+
+        self.assertEqual(client._client.get.call_count, 3)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.ingest.adapters import http_utils
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class _CookieHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802
+        body = (self.headers.get("Cookie") or "-").encode()
+        self.send_response(200)
+        self.send_header("Set-Cookie", "tracker=1; Path=/")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # noqa: ANN002
+        pass
+
+
+class HttpUtilsUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"http_utils unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _CookieHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_shared_session_does_not_carry_cookies_between_calls(self):
+        first, _ = http_utils.fetch_html(self.url, cookies={"sid": "a"}, retries=1)
+        second, _ = http_utils.fetch_html(self.url, retries=1)
+
+        self.assertEqual(first, "sid=a")
+        self.assertEqual(second, "-")
+        self.assertEqual(len(http_utils._SESSION.cookies), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
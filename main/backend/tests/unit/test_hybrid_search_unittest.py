@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.search import hybrid
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+def _session_returning(rows):
+    session = MagicMock()
+    session.execute.return_value.all.return_value = rows
+    factory = MagicMock()
+    factory.return_value.__enter__.return_value = session
+    return factory
+
+
+class HybridSearchUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"hybrid search unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def setUp(self):
+        hybrid._embed_query_cached.cache_clear()
+
+    def test_vector_search_scores_rows_in_result_order(self):
+        rows = [
+            (
+                SimpleNamespace(vector=[1.0, 0.0, 2.0]),
+                SimpleNamespace(id=7, title="a", summary=None, content="x", state="CA", publish_date=date(2024, 1, 2)),
+            ),
+            (
+                SimpleNamespace(vector=[0.5, 0.5, 0.0]),
+                SimpleNamespace(id=9, title="b", summary=None, content="y", state="CA", publish_date=None),
+            ),
+        ]
+        embeddings = MagicMock()
+        embeddings.embed_query.return_value = [2.0, 4.0, 1.0]
+
+        with (
+            patch.object(hybrid, "get_embeddings", return_value=embeddings),
+            patch.object(hybrid, "SessionLocal", _session_returning(rows)),
+        ):
+            hits = hybrid.vector_search("lottery", None, 2)
+
+        self.assertEqual([h["document_id"] for h in hits], [7, 9])
+        self.assertEqual([h["score"] for h in hits], [4.0, 3.0])
+        self.assertTrue(all(type(h["score"]) is float for h in hits))
+        self.assertEqual(hits[0]["publish_date"], "2024-01-02")
+        self.assertIsNone(hits[1]["publish_date"])
+
+    def test_vector_search_without_rows_returns_empty(self):
+        embeddings = MagicMock()
+        embeddings.embed_query.return_value = [1.0, 0.0]
+
+        with (
+            patch.object(hybrid, "get_embeddings", return_value=embeddings),
+            patch.object(hybrid, "SessionLocal", _session_returning([])),
+        ):
+            self.assertEqual(hybrid.vector_search("lottery", None, 5), [])
+
+    def test_rrf_search_sends_single_retriever_query_and_keeps_best_chunk(self):
+        es = MagicMock()
+        es.search.return_value = {
+            "hits": {
+                "hits": [
+                    {"_score": 0.032, "_source": {"document_id": 3, "chunk_index": 1, "title": "t"}},
+                    {"_score": 0.031, "_source": {"document_id": 3, "chunk_index": 0, "title": "t"}},
+                    {"_score": 0.016, "_source": {"document_id": 5, "chunk_index": 0, "title": "u"}},
+                ]
+            }
+        }
+        embeddings = MagicMock()
+        embeddings.embed_query.return_value = [0.1, 0.2]
+
+        with patch.object(hybrid, "get_embeddings", return_value=embeddings):
+            hits = hybrid.rrf_search(es, "lottery", "CA", 5)
+
+        body = es.search.call_args.kwargs["body"]
+        retrievers = body["retriever"]["rrf"]["retrievers"]
+        self.assertEqual(retrievers[0]["standard"]["query"], hybrid._bm25_query("lottery", "CA"))
+        self.assertEqual(retrievers[0]["standard"]["query"]["bool"]["filter"], [{"term": {"state": "CA"}}])
+        self.assertEqual(retrievers[1]["knn"]["query_vector"], [0.1, 0.2])
+        self.assertEqual(retrievers[1]["knn"]["num_candidates"], 20)
+        self.assertEqual(retrievers[1]["knn"]["filter"], {"term": {"state": "CA"}})
+        self.assertEqual([(h["document_id"], h["chunk_index"]) for h in hits], [(3, 1), (5, 0)])
+        self.assertEqual(hits[0]["fusion_score"], 0.032)
+
+    def test_hybrid_falls_back_to_client_side_fusion_when_rrf_unavailable(self):
+        bm25_hits = [{"document_id": 1, "mode": "bm25"}, {"document_id": 2, "mode": "bm25"}]
+        vector_hits = [{"document_id": 2, "mode": "vector"}]
+        es = MagicMock()
+        hybrid._set_rrf_ready(es, True)
+
+        with (
+            patch.object(hybrid, "get_es_client", return_value=es),
+            patch.object(hybrid, "_embed_query", return_value=[0.1, 0.2]) as embed,
+            patch.object(hybrid, "rrf_search", side_effect=RuntimeError("current license is non-compliant for [rrf]")) as rrf,
+            patch.object(hybrid, "bm25_search", return_value=bm25_hits),
+            patch.object(hybrid, "vector_search", return_value=vector_hits) as vector,
+        ):
+            hits = hybrid.hybrid_search("lottery", None, 5, "hybrid")
+            hybrid.hybrid_search("lottery", None, 5, "hybrid")
+
+        self.assertEqual([h["document_id"] for h in hits], [2, 1])
+        # The failure is remembered: the second query goes straight to client-side fusion.
+        rrf.assert_called_once()
+        self.assertEqual(embed.call_count, 2)
+        self.assertEqual(vector.call_args.kwargs["embedding"], [0.1, 0.2])
+
+    def test_rrf_is_used_only_when_every_chunk_has_an_embedding(self):
+        def _es(total, with_embedding):
+            es = MagicMock()
+            es.search.return_value = {
+                "hits": {"total": {"value": total}},
+                "aggregations": {"with_embedding": {"doc_count": with_embedding}},
+            }
+            return es
+
+        self.assertTrue(hybrid._rrf_ready(_es(10, 10)))
+        self.assertFalse(hybrid._rrf_ready(_es(10, 7)))
+        self.assertFalse(hybrid._rrf_ready(_es(0, 0)))
+        broken = MagicMock()
+        broken.search.side_effect = RuntimeError("index_not_found")
+        self.assertFalse(hybrid._rrf_ready(broken))
+
+        cached = _es(10, 10)
+        hybrid._rrf_ready(cached)
+        hybrid._rrf_ready(cached)
+        cached.search.assert_called_once()
+
+    def test_hybrid_falls_back_when_rrf_returns_no_hits(self):
+        es = MagicMock()
+        hybrid._set_rrf_ready(es, True)
+
+        with (
+            patch.object(hybrid, "get_es_client", return_value=es),
+            patch.object(hybrid, "_embed_query", return_value=[0.1]),
+            patch.object(hybrid, "rrf_search", return_value=[]),
+            patch.object(hybrid, "bm25_search", return_value=[{"document_id": 1}]),
+            patch.object(hybrid, "vector_search", return_value=[{"document_id": 4}]),
+        ):
+            hits = hybrid.hybrid_search("lottery", None, 5, "hybrid")
+
+        self.assertEqual(sorted(h["document_id"] for h in hits), [1, 4])
+
+    def test_query_embeddings_are_cached_per_query(self):
+        embeddings = MagicMock()
+        embeddings.embed_query.side_effect = lambda q: [float(len(q)), 1.0]
+
+        with patch.object(hybrid, "get_embeddings", return_value=embeddings):
+            first = hybrid._embed_query("lottery")
+            second = hybrid._embed_query("lottery")
+            other = hybrid._embed_query("jackpot odds")
+
+        self.assertEqual(first, [7.0, 1.0])
+        self.assertEqual(second, first)
+        self.assertEqual(other, [12.0, 1.0])
+        self.assertEqual(embeddings.embed_query.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
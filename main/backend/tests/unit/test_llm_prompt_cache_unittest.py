@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.llm import cache as llm_cache
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class PromptCacheUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"prompt cache unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        for patcher in (
+            patch.object(llm_cache, "_PROMPT_CACHE_FILE", Path(self._tmpdir.name) / "prompt-cache.db"),
+            patch.object(llm_cache, "_prompt_cache_conn", None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _keys(self) -> list[str]:
+        rows = llm_cache._prompt_cache_connection().execute("SELECT key FROM prompt_cache ORDER BY created_at").fetchall()
+        return [row[0] for row in rows]
+
+    def test_writes_prune_expired_rows_and_cap_row_count(self):
+        with patch.object(llm_cache.time, "time", return_value=1000.0):
+            llm_cache.store_prompt_output("old", "x")
+        with (
+            patch.object(llm_cache, "_PROMPT_CACHE_RETENTION_S", 100.0),
+            patch.object(llm_cache, "_PROMPT_CACHE_MAX_ROWS", 2),
+        ):
+            for i, key in enumerate(("a", "b", "c")):
+                with patch.object(llm_cache.time, "time", return_value=2000.0 + i):
+                    llm_cache.store_prompt_output(key, key)
+
+        self.assertEqual(self._keys(), ["b", "c"])
+        self.assertEqual(llm_cache.get_cached_prompt_output("c", 1e12), "c")
+
+    def test_unusable_cache_dir_is_a_miss_not_an_error(self):
+        blocker = Path(self._tmpdir.name) / "not-a-dir"
+        blocker.write_text("")
+        with patch.object(llm_cache, "_PROMPT_CACHE_FILE", blocker / "prompt-cache.db"):
+            self.assertIsNone(llm_cache.get_cached_prompt_output("k", 60.0))
+            llm_cache.store_prompt_output("k", "v")
+
+
+if __name__ == "__main__":
+    unittest.main()
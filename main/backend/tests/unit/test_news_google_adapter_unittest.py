@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.ingest.adapters.news_google import GoogleNewsAdapter, GoogleNewsItem
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class GoogleNewsAdapterUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"news_google unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def test_multiple_keywords_fetched_concurrently(self):
+        keywords = ["alpha", "beta", "gamma"]
+        barrier = threading.Barrier(len(keywords), timeout=5)
+
+        def _search(keyword, limit):  # noqa: ANN001
+            barrier.wait()
+            if keyword == "beta":
+                raise RuntimeError("blocked")
+            return iter([GoogleNewsItem(title=f"{keyword}-{i}", link=f"https://n.example/{keyword}/{i}", keyword=keyword) for i in range(limit)])
+
+        adapter = GoogleNewsAdapter()
+        with patch.object(adapter, "search", side_effect=_search):
+            items = list(adapter.search_multiple_keywords(keywords, limit_per_keyword=2))
+
+        self.assertEqual(sorted(item.title for item in items), ["alpha-0", "alpha-1", "gamma-0", "gamma-1"])
+
+    def test_multiple_keywords_yield_results_as_each_keyword_completes(self):
+        slow_release = threading.Event()
+
+        def _search(keyword, limit):  # noqa: ANN001
+            if keyword == "slow":
+                slow_release.wait(5)
+            return iter([GoogleNewsItem(title=keyword, link=f"https://n.example/{keyword}", keyword=keyword)])
+
+        adapter = GoogleNewsAdapter()
+        with patch.object(adapter, "search", side_effect=_search):
+            results = adapter.search_multiple_keywords(["slow", "fast"], limit_per_keyword=1)
+            first = next(results)
+            slow_release.set()
+            rest = list(results)
+
+        self.assertEqual(first.title, "fast")
+        self.assertEqual([item.title for item in rest], ["slow"])
+
+
+if __name__ == "__main__":
+    unittest.main()
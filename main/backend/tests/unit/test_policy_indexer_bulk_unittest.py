@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.indexer import policy
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class PolicyIndexerBulkUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"policy indexer bulk tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def test_bulk_index_uses_parallel_bulk_without_per_request_refresh(self):
+        es = MagicMock()
+        actions = [{"_index": "policy_docs_es", "_id": f"policy-1-{i}"} for i in range(3)]
+
+        with patch.object(policy, "parallel_bulk", return_value=iter([(True, {}), (True, {}), (False, {})])) as pb:
+            indexed = policy.bulk_index_policy_docs(es, actions)
+
+        self.assertEqual(indexed, 2)
+        self.assertIs(pb.call_args.args[1], actions)
+        self.assertFalse(pb.call_args.kwargs["refresh"])
+        self.assertEqual(pb.call_args.kwargs["chunk_size"], 500)
+        es.indices.refresh.assert_called_once_with(index="policy_docs_es")
+
+    def test_existing_docs_are_deleted_with_one_terms_query(self):
+        es = MagicMock()
+
+        policy._delete_existing_es_docs(es, {3, 5})
+        policy._delete_existing_es_docs(es, [])
+
+        es.delete_by_query.assert_called_once()
+        query = es.delete_by_query.call_args.kwargs["body"]["query"]
+        self.assertEqual(sorted(query["terms"]["document_id"]), [3, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
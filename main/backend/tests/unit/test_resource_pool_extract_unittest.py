@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from sqlalchemy.dialects import postgresql
+
+    from app.services.resource_pool import extract
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class ResourcePoolExtractUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"resource_pool extract unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def test_batch_insert_skips_existing_and_repeated_urls_in_one_statement(self):
+        session = MagicMock()
+        session.execute.return_value.scalars.return_value.all.return_value = ["https://example.com/a"]
+        url_refs = [
+            ("https://Example.com/a", {"document_id": 1}),
+            ("https://example.com/b", {"document_id": 2}),
+            ("https://example.com/a", {"document_id": 3}),
+            ("not a url", {"document_id": 4}),
+        ]
+
+        new, dup = extract._append_urls_batch(session, url_refs, "document", "project", "demo_proj")
+
+        self.assertEqual((new, dup), (1, 2))
+        session.execute.assert_called_once()
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn("ON CONFLICT (url) DO NOTHING", sql)
+        self.assertIn("RETURNING", sql)
+
+    def test_insert_flags_are_keyed_by_normalized_url(self):
+        session = MagicMock()
+        session.execute.return_value.scalars.return_value.all.return_value = ["https://example.com/b"]
+
+        flags, valid = extract._insert_new_urls(
+            session,
+            [("https://example.com/a", {}), ("https://example.com/b", {})],
+            "unified_search",
+            "shared",
+            None,
+        )
+
+        self.assertEqual(flags, {"https://example.com/a": False, "https://example.com/b": True})
+        self.assertEqual(valid, 2)
+
+    def test_append_url_goes_through_the_batch_write_path(self):
+        with patch.object(extract, "append_urls", side_effect=[{"https://example.com/a": True}, {"https://example.com/a": False}, {}]) as append:
+            results = [
+                extract.append_url("https://example.com/a", "news", {"k": 1}, scope="shared", project_key="")
+                for _ in range(3)
+            ]
+
+        self.assertEqual(results, [True, False, False])
+        self.assertEqual(
+            append.call_args_list[0],
+            call([("https://example.com/a", {"k": 1})], "news", scope="shared", project_key=""),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
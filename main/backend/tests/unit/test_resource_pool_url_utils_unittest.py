@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.resource_pool import url_utils
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class ResourcePoolUrlUtilsUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"resource_pool url_utils unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def test_domain_from_url_strips_only_literal_www_prefix(self):
+        self.assertEqual(url_utils.domain_from_url("https://WWW.Example.com/a"), "example.com")
+        self.assertEqual(url_utils.domain_from_url("https://wwwidget.io/x"), "wwwidget.io")
+        self.assertEqual(url_utils.domain_from_url("https://w.example.com"), "w.example.com")
+        self.assertIsNone(url_utils.domain_from_url("example.com/no-scheme"))
+        self.assertIsNone(url_utils.domain_from_url(""))
+        self.assertIsNone(url_utils.domain_from_url(None))  # type: ignore[arg-type]
+
+    def test_extract_urls_from_text_trims_trailing_punctuation(self):
+        text = "see https://a.example/x?y=1. and (HTTP://B.example/z) or mailto:a@b.example"
+        self.assertEqual(url_utils.extract_urls_from_text(text), ["https://a.example/x?y=1", "HTTP://B.example/z"])
+        self.assertEqual(url_utils.extract_urls_from_text(None), [])
+
+    def test_extract_urls_from_json_walks_nested_values_in_order(self):
+        payload = {"a": "https://x.example/1", "b": [{"c": "HTTPS://x.example/2#frag"}, "not a url"], "d": "https://x.example/1/"}
+        self.assertEqual(url_utils.extract_urls_from_json(payload), ["https://x.example/1", "https://x.example/2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
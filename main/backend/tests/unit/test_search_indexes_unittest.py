@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.search import indexes
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class SearchIndexesUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"search indexes unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def test_existence_is_checked_with_one_get_and_only_missing_indices_created(self):
+        es = MagicMock()
+        es.indices.get.return_value = {
+            "policy_docs_es": {"mappings": {"properties": {"title": {"type": "text"}}}},
+            "market_stats_es": {"mappings": {"properties": {}}},
+        }
+
+        results = indexes.ensure_indices(es)
+
+        es.indices.get.assert_called_once()
+        es.indices.exists.assert_not_called()
+        self.assertEqual(
+            results,
+            {
+                "policy_docs_es": "updated",
+                "market_stats_es": "exists",
+                "market_metric_points_es": "created",
+                "price_observations_es": "created",
+            },
+        )
+        created = [c.kwargs["index"] for c in es.indices.create.call_args_list]
+        self.assertEqual(sorted(created), ["market_metric_points_es", "price_observations_es"])
+        es.indices.put_mapping.assert_called_once()
+
+    def test_new_policy_index_gets_embedding_field(self):
+        es = MagicMock()
+        es.indices.get.return_value = {}
+
+        indexes.ensure_indices(es)
+
+        policy_call = next(c for c in es.indices.create.call_args_list if c.kwargs["index"] == "policy_docs_es")
+        self.assertEqual(policy_call.kwargs["mappings"]["properties"]["embedding"]["type"], "dense_vector")
+        self.assertNotIn("embedding", indexes._INDEX_MAPPINGS["policy_docs_es"]["properties"])
+
+    def test_new_indices_are_sorted_by_their_date_field(self):
+        es = MagicMock()
+        es.indices.get.return_value = {}
+
+        indexes.ensure_indices(es)
+
+        sort = {
+            c.kwargs["index"]: (c.kwargs["settings"]["index"]["sort.field"], c.kwargs["settings"]["index"]["sort.order"])
+            for c in es.indices.create.call_args_list
+        }
+        self.assertEqual(
+            sort,
+            {
+                "policy_docs_es": ("publish_date", "desc"),
+                "market_stats_es": ("date", "desc"),
+                "market_metric_points_es": ("date", "desc"),
+                "price_observations_es": ("captured_at", "desc"),
+            },
+        )
+        for index, field in sort.items():
+            self.assertIn(field[0], indexes._mappings_for(index)["properties"])
+        codecs = {c.kwargs["index"]: c.kwargs["settings"]["index"].get("codec") for c in es.indices.create.call_args_list}
+        self.assertEqual(codecs["policy_docs_es"], "best_compression")
+        self.assertIsNone(codecs["market_stats_es"])
+        refresh = {
+            c.kwargs["index"]: c.kwargs["settings"]["index"].get("refresh_interval")
+            for c in es.indices.create.call_args_list
+        }
+        self.assertEqual(
+            refresh,
+            {
+                "policy_docs_es": None,
+                "market_stats_es": None,
+                "market_metric_points_es": "30s",
+                "price_observations_es": "30s",
+            },
+        )
+
+    def test_only_missing_or_stale_templates_are_put(self):
+        es = MagicMock()
+        es.indices.get.return_value = {}
+        es.options.return_value.indices.get_index_template.return_value = {
+            "index_templates": [
+                {
+                    "name": "market_research_market_stats_es",
+                    "index_template": {"version": indexes._TEMPLATE_VERSION, "_meta": indexes._template_meta("market_stats_es")},
+                },
+                {
+                    "name": "market_research_market_metric_points_es",
+                    "index_template": {"version": 0, "_meta": indexes._template_meta("market_metric_points_es")},
+                },
+            ]
+        }
+
+        indexes.ensure_indices(es)
+
+        put = {c.kwargs["name"]: c.kwargs for c in es.indices.put_index_template.call_args_list}
+        self.assertEqual(
+            sorted(put),
+            [
+                "market_research_market_metric_points_es",
+                "market_research_policy_docs_es",
+                "market_research_price_observations_es",
+            ],
+        )
+        policy = put["market_research_policy_docs_es"]
+        self.assertEqual(policy["index_patterns"], ["policy_docs_es"])
+        self.assertEqual(policy["template"]["mappings"]["properties"]["embedding"]["type"], "dense_vector")
+
+    def test_failed_create_propagates_and_is_not_memoized(self):
+        es = MagicMock()
+        es.indices.get.return_value = {}
+        es.indices.create.side_effect = [None, RuntimeError("boom"), None, None]
+
+        with self.assertRaises(RuntimeError):
+            indexes.ensure_indices(es)
+        es.indices.create.side_effect = None
+        indexes.ensure_indices(es)
+
+        self.assertEqual(es.indices.get.call_count, 2)
+
+    def test_second_call_with_same_client_skips_cluster(self):
+        es = MagicMock()
+        es.indices.get.return_value = {}
+
+        first = indexes.ensure_indices(es)
+        second = indexes.ensure_indices(es)
+
+        es.indices.get.assert_called_once()
+        self.assertEqual(set(first.values()), {"created"})
+        self.assertEqual(set(second.values()), {"exists"})
+        self.assertEqual(list(second), list(first))
+
+    def test_force_rechecks_cluster_and_recreates_deleted_indices(self):
+        es = MagicMock()
+        es.indices.get.return_value = {}
+        indexes.ensure_indices(es)
+
+        forced = indexes.ensure_indices(es, force=True)
+
+        self.assertEqual(es.indices.get.call_count, 2)
+        self.assertEqual(set(forced.values()), {"created"})
+        self.assertEqual(set(indexes.ensure_indices(es).values()), {"exists"})
+        self.assertEqual(es.indices.get.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
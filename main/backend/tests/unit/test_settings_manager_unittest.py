@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services import settings_manager
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class SettingsManagerUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"settings manager unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def test_env_file_is_parsed_again_only_after_it_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            env_file = Path(tmp) / ".env"
+            env_file.write_text("ES_URL=http://es-a:9200\n")
+            with (
+                patch.dict(os.environ),
+                patch.object(settings_manager, "ENV_FILE", env_file),
+                patch.object(settings_manager, "_env_cache", None),
+                patch.object(settings_manager, "reload_settings"),
+                patch.object(settings_manager, "dotenv_values", wraps=settings_manager.dotenv_values) as parse,
+            ):
+                first = settings_manager.load_env_settings()
+                second = settings_manager.load_env_settings()
+                updated = settings_manager.update_env_settings({"ES_URL": "http://es-b:9200"})
+
+        self.assertEqual(first["ES_URL"], "http://es-a:9200")
+        self.assertEqual(second["ES_URL"], "http://es-a:9200")
+        self.assertEqual(updated["ES_URL"], "http://es-b:9200")
+        self.assertEqual(parse.call_count, 2)
+
+    def test_update_rewrites_env_once_and_keeps_other_lines(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            env_file = Path(tmp) / ".env"
+            env_file.write_text("# comment\nES_URL=old\nUNRELATED=1\nES_URL=older")
+            with (
+                patch.dict(os.environ),
+                patch.object(settings_manager, "ENV_FILE", env_file),
+                patch.object(settings_manager, "_env_cache", None),
+                patch.object(settings_manager, "reload_settings"),
+                patch.object(settings_manager, "rewrite", wraps=settings_manager.rewrite) as rewrite,
+            ):
+                settings_manager.update_env_settings({"ES_URL": "http://es:9200", "REDIS_URL": "it's", "NOT_MANAGED": "x"})
+            content = env_file.read_text()
+            values = settings_manager.dotenv_values(str(env_file))
+
+        rewrite.assert_called_once()
+        self.assertEqual(
+            content,
+            "# comment\nES_URL='http://es:9200'\nUNRELATED=1\nES_URL='http://es:9200'\nREDIS_URL='it\\'s'\n",
+        )
+        self.assertEqual(values["REDIS_URL"], "it's")
+        self.assertNotIn("NOT_MANAGED", values)
+
+    def test_missing_keys_fall_back_to_environment_then_settings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            env_file = Path(tmp) / ".env"
+            env_file.write_text("ES_URL=http://from-file:9200\n")
+            with (
+                patch.dict(os.environ, {"REDIS_URL": "redis://from-env"}),
+                patch.object(settings_manager, "ENV_FILE", env_file),
+                patch.object(settings_manager, "_env_cache", None),
+                patch.object(settings_manager.settings, "extraction_max_parallel", 7),
+            ):
+                os.environ.pop("EXTRACTION_MAX_PARALLEL", None)
+                values = settings_manager.load_env_settings()
+
+        self.assertEqual(values["ES_URL"], "http://from-file:9200")
+        self.assertEqual(values["REDIS_URL"], "redis://from-env")
+        self.assertEqual(values["EXTRACTION_MAX_PARALLEL"], 7)
+        self.assertEqual(set(values), set(settings_manager.ENV_KEY_MAPPING))
+
+
+if __name__ == "__main__":
+    unittest.main()
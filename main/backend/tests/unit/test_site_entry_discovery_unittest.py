@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.resource_pool import site_entry_discovery as discovery
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class SiteEntryDiscoveryUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"site_entry_discovery unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def _discover(self, *, ok_urls: set[str], include_link_alternate: bool = False):
+        probed: list[str] = []
+
+        def _fake_probe(url, *, timeout):  # noqa: ANN001
+            probed.append(url)
+            return (url in ok_urls), "application/xml"
+
+        with (
+            patch.object(discovery, "_probe_url_candidate", side_effect=_fake_probe),
+            patch.object(discovery, "_host_resolves", return_value=True),
+        ):
+            cands, stats, errors = discovery._discover_domain_candidates(
+                d="example.com",
+                target_scope="project",
+                probe_timeout=1.0,
+                include_link_alternate=include_link_alternate,
+                sitemap_paths=None,
+                rss_paths=None,
+            )
+        return cands, stats, errors, probed
+
+    def test_first_matching_path_wins_per_entry_type(self):
+        cands, stats, errors, probed = self._discover(
+            ok_urls={
+                "https://example.com/sitemap_index.xml",
+                "https://example.com/feed",
+                "https://example.com/search",
+            }
+        )
+
+        self.assertEqual(errors, [])
+        by_type = {c["entry_type"]: c for c in cands}
+        self.assertEqual(set(by_type), {"domain_root", "sitemap", "rss", "search_template"})
+        self.assertEqual(by_type["sitemap"]["site_url"], "https://example.com/sitemap_index.xml")
+        self.assertEqual(by_type["rss"]["site_url"], "https://example.com/feed")
+        self.assertEqual(by_type["search_template"]["template"], "https://example.com/search?q={{q}}")
+        self.assertEqual(stats["sitemap"], 1)
+        self.assertEqual(stats["rss"], 1)
+        self.assertEqual(stats["search_path"], 1)
+        # Everything was found over https, so the http base is never probed.
+        self.assertFalse(any(u.startswith("http://") for u in probed))
+
+    def test_missing_entry_types_fall_back_to_http_base(self):
+        cands, stats, _, probed = self._discover(ok_urls={"http://example.com/rss.xml"})
+
+        self.assertIn("http://example.com/rss.xml", [c["site_url"] for c in cands])
+        self.assertEqual(stats["rss"], 1)
+        self.assertEqual(stats["sitemap"], 0)
+        self.assertIn("http://example.com/sitemap.xml", probed)
+
+    def test_candidates_are_deduplicated_by_normalized_url(self):
+        html = (
+            '<link rel="alternate" type="application/rss+xml" href="/feed">'
+            '<link rel="alternate" type="application/rss+xml" href="https://example.com/feed/">'
+        )
+        with patch.object(discovery, "fetch_html", return_value=(html, None)):
+            cands, stats, _, _ = self._discover(ok_urls={"https://example.com/feed"}, include_link_alternate=True)
+
+        urls = [c["site_url"] for c in cands]
+        self.assertEqual(len(urls), len(set(urls)))
+        self.assertEqual(urls.count("https://example.com/feed"), 1)
+
+    def test_root_page_feeds_skip_rss_probes_and_dead_https_base_is_skipped(self):
+        html = '<link rel="alternate" type="application/atom+xml" href="/atom">'
+        with patch.object(discovery, "fetch_html", return_value=(html, None)):
+            cands, stats, _, probed = self._discover(ok_urls=set(), include_link_alternate=True)
+
+        self.assertIn("https://example.com/atom", [c["site_url"] for c in cands])
+        self.assertEqual(stats["link_alternate"], 1)
+        self.assertFalse(any(u.endswith(("/rss", "/feed", "/atom.xml")) for u in probed))
+
+        down = discovery.HttpFetchError("Failed to fetch https://example.com/")
+        down.__cause__ = discovery.requests.ConnectionError("refused")
+        with patch.object(discovery, "fetch_html", side_effect=down):
+            _, _, _, probed = self._discover(ok_urls=set(), include_link_alternate=True)
+
+        self.assertTrue(probed)
+        self.assertFalse(any(u.startswith("https://") for u in probed))
+
+    def test_unresolvable_domain_is_skipped_without_http_probes(self):
+        with (
+            patch.object(discovery, "_probe_url_candidate") as probe,
+            patch.object(discovery.socket, "getaddrinfo", side_effect=discovery.socket.gaierror("no such host")),
+        ):
+            discovery._DNS_CACHE.pop("dead.example", None)
+            cands, _, errors = discovery._discover_domain_candidates(
+                d="dead.example",
+                target_scope="project",
+                probe_timeout=1.0,
+                include_link_alternate=True,
+                sitemap_paths=None,
+                rss_paths=None,
+            )
+
+        self.assertEqual(cands, [])
+        self.assertEqual(errors, [{"domain": "dead.example", "error": "dns resolution failed"}])
+        probe.assert_not_called()
+        self.assertFalse(discovery._DNS_CACHE["dead.example"][0])
+
+    def test_dns_cache_is_bounded_and_timeouts_are_not_cached(self):
+        discovery._DNS_CACHE.clear()
+        with (
+            patch.object(discovery, "_DNS_CACHE_MAX", 2),
+            patch.object(discovery.socket, "getaddrinfo", return_value=[]),
+        ):
+            for host in ("a.example", "b.example", "c.example"):
+                self.assertTrue(discovery._host_resolves(host))
+        self.assertEqual(list(discovery._DNS_CACHE), ["b.example", "c.example"])
+
+        with (
+            patch.object(discovery, "_DNS_TIMEOUT", 0.01),
+            patch.object(discovery.socket, "getaddrinfo", side_effect=lambda *a, **k: time.sleep(0.2)),
+        ):
+            self.assertTrue(discovery._host_resolves("slow.example"))
+        self.assertNotIn("slow.example", discovery._DNS_CACHE)
+
+    def test_base_urls_strip_literal_www_prefix_only(self):
+        self.assertEqual(
+            discovery._best_effort_base_urls(" WWW.Example.com "),
+            ["https://example.com/", "http://example.com/"],
+        )
+        self.assertEqual(discovery._best_effort_base_urls("w.example.com")[0], "https://w.example.com/")
+        self.assertEqual(discovery._best_effort_base_urls("wwwidget.io")[0], "https://wwwidget.io/")
+        self.assertEqual(discovery._best_effort_base_urls("  "), [])
+
+    def test_auto_classify_only_domain_roots_without_feeds(self):
+        def _fake_domain(*, d, **kwargs):  # noqa: ANN001, ANN003
+            root = {"site_url": f"https://{d}", "domain": d, "entry_type": "domain_root", "template": None, "extra": {}}
+            cands = [root]
+            if d == "feeds.example":
+                cands.append({"site_url": f"https://{d}/rss", "domain": d, "entry_type": "rss", "template": None, "extra": {}})
+            return cands, {"domain_root": 1}, []
+
+        classified: list[list[str]] = []
+
+        def _fake_classify(rows, *, use_llm, llm_batch_size):  # noqa: ANN001
+            classified.append([r["site_url"] for r in rows])
+            return [
+                {
+                    "channel_key": "generic_web.search_template",
+                    "entry_type": "search_template",
+                    "template": f"{r['site_url']}/search?q={{{{q}}}}",
+                    "source": "rule",
+                    "capabilities": {"supports_query_terms": True},
+                }
+                for r in rows
+            ]
+
+        with (
+            patch.object(discovery, "list_discovery_domains", return_value=["feeds.example", "plain.example"]),
+            patch.object(discovery, "_discover_domain_candidates", side_effect=_fake_domain),
+            patch.object(discovery, "classify_site_entries_batch", side_effect=_fake_classify),
+        ):
+            result = discovery.discover_site_entries_from_urls(
+                project_key="demo_proj",
+                run_auto_classify=True,
+                domain_probe_concurrency=1,
+            )
+
+        self.assertEqual(classified, [["https://plain.example"]])
+        by_url = {c["site_url"]: c for c in result.candidates}
+        self.assertEqual(by_url["https://plain.example"]["extra"]["recommended_channel_key"], "generic_web.search_template")
+        self.assertNotIn("recommended_channel_key", by_url["https://feeds.example"]["extra"])
+        clone = result.candidates[-1]
+        self.assertEqual(clone["entry_type"], "search_template")
+        self.assertEqual(clone["extra"]["generated_from_domain_root"], "https://plain.example")
+
+    def test_total_deadline_reports_unfinished_domains(self):
+        release = threading.Event()
+
+        def _fake_domain(*, d, **kwargs):  # noqa: ANN001, ANN003
+            if d == "slow.example":
+                release.wait(5)
+            return [{"site_url": f"https://{d}", "domain": d, "entry_type": "domain_root"}], {"domain_root": 1}, []
+
+        try:
+            with (
+                patch.object(discovery, "list_discovery_domains", return_value=["fast.example", "slow.example"]),
+                patch.object(discovery, "_discover_domain_candidates", side_effect=_fake_domain),
+            ):
+                result = discovery.discover_site_entries_from_urls(
+                    project_key="demo_proj",
+                    domain_probe_concurrency=2,
+                    total_deadline_s=0.2,
+                )
+        finally:
+            release.set()
+
+        self.assertEqual([c["site_url"] for c in result.candidates], ["https://fast.example"])
+        self.assertEqual(result.errors, [{"domain": "slow.example", "error": "discovery deadline exceeded"}])
+        self.assertEqual(result.probe_stats["domain_root"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.search import smart
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class _InlineExecutor:
+    def submit(self, fn, *args, **kwargs):  # noqa: ANN001
+        fn(*args, **kwargs)
+
+
+class SmartSearchUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"smart search unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def setUp(self):
+        smart._last_time_cache.clear()
+        smart._today_cache = None
+        patcher = patch.object(smart, "_history_executor", _InlineExecutor())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_same_day_repeat_is_answered_from_cache(self):
+        with (
+            patch.object(smart, "get_last_search_time", return_value=None) as get_last,
+            patch.object(smart, "search_sources", return_value=[{"link": "https://a.example/1"}]) as search,
+            patch.object(smart, "update_search_time") as update,
+        ):
+            first = smart.smart_search("lottery")
+            second = smart.smart_search("lottery")
+
+        self.assertEqual(len(first), 1)
+        self.assertEqual(second, [])
+        get_last.assert_called_once_with("lottery")
+        search.assert_called_once()
+        update.assert_called_once_with("lottery")
+
+    def test_history_write_failure_does_not_fail_the_search(self):
+        with (
+            patch.object(smart, "get_last_search_time", return_value=None),
+            patch.object(smart, "search_sources", return_value=[{"link": "https://a.example/1"}]),
+            patch.object(smart, "update_search_time", side_effect=RuntimeError("db down")),
+        ):
+            results = smart.smart_search("lottery")
+
+        self.assertEqual(len(results), 1)
+        self.assertIn("lottery", smart._last_time_cache)
+
+    def test_history_is_keyed_by_normalized_topic(self):
+        with (
+            patch.object(smart, "get_last_search_time", return_value=None) as get_last,
+            patch.object(smart, "search_sources", return_value=[{"link": "https://a.example/1"}]) as search,
+            patch.object(smart, "update_search_time") as update,
+        ):
+            smart.smart_search("  Powerball Sales ")
+            repeat = smart.smart_search("powerball sales")
+
+        self.assertEqual(repeat, [])
+        get_last.assert_called_once_with("powerball sales")
+        update.assert_called_once_with("powerball sales")
+        self.assertEqual(search.call_args.kwargs["topic"], "  Powerball Sales ")
+
+    def test_incremental_window_counts_utc_calendar_days(self):
+        now = datetime.now(timezone.utc)
+        cases = {
+            "aware": now - timedelta(days=3),
+            "aware-offset": (now - timedelta(days=3)).astimezone(timezone(timedelta(hours=-8))),
+            "naive-utc": (now - timedelta(days=3)).replace(tzinfo=None),
+        }
+        for name, last in cases.items():
+            with self.subTest(last=name):
+                smart._last_time_cache.clear()
+                with (
+                    patch.object(smart, "get_last_search_time", return_value=last),
+                    patch.object(smart, "search_sources", return_value=[]) as search,
+                    patch.object(smart, "update_search_time") as update,
+                ):
+                    smart.smart_search("jackpot", days_back=30)
+
+                self.assertEqual(search.call_args.kwargs["days_back"], 3)
+                self.assertTrue(search.call_args.kwargs["use_filter_context"])
+                update.assert_not_called()
+
+    def test_cached_today_expires_at_utc_midnight(self):
+        clock = {"now": datetime(2026, 3, 1, 23, 59, 30, tzinfo=timezone.utc), "mono": 1000.0}
+
+        class _FakeDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):  # noqa: ANN001
+                return clock["now"]
+
+        with (
+            patch.object(smart, "datetime", _FakeDatetime),
+            patch.object(smart.time, "monotonic", side_effect=lambda: clock["mono"]),
+        ):
+            first = smart._today_utc()
+            clock["mono"] += 20
+            clock["now"] += timedelta(seconds=20)
+            cached = smart._today_utc()
+            clock["mono"] += 20
+            clock["now"] += timedelta(seconds=20)
+            rolled = smart._today_utc()
+
+        self.assertEqual(first, cached)
+        self.assertEqual(rolled - first, timedelta(days=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
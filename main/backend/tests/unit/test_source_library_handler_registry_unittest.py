@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.source_library import adapters, handler_registry
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class SourceLibraryHandlerRegistryUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"source_library handler registry unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def test_builtin_handlers_resolve_on_first_get(self):
+        from app.services.source_library.adapters.generic_web import handle_generic_web_sitemap
+
+        self.assertIs(handler_registry.get("Generic_Web", " sitemap "), handle_generic_web_sitemap)
+        self.assertIs(adapters.handle_generic_web_sitemap, handle_generic_web_sitemap)
+        self.assertIsNone(handler_registry.get("generic_web", "unknown"))
+        with self.assertRaises(AttributeError):
+            adapters.handle_unknown  # noqa: B018
+
+    def test_lazy_module_is_not_imported_until_requested(self):
+        with (
+            patch.dict(handler_registry._HANDLERS, clear=True),
+            patch.dict(handler_registry._LAZY_HANDLERS, clear=True),
+            patch.object(handler_registry, "load_handler", return_value=lambda params, project_key: {}) as load,
+        ):
+            handler_registry.register_lazy("demo", "urls", "demo.module:handle")
+            load.assert_not_called()
+            first = handler_registry.get("demo", "urls")
+            second = handler_registry.get("demo", "urls")
+
+        self.assertIs(first, second)
+        load.assert_called_once_with("demo.module:handle")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -142,6 +142,142 @@ class SourceLibraryResolverUnitTestCase(unittest.TestCase):
         run_single.assert_not_called()
         self.assertEqual(result.get("result"), fake_result)
 
+    def test_effective_item_lookup_is_cached_until_revision_bump(self):
+        fake_items = [{"item_key": "demo.item", "channel_key": "url_pool", "params": {"limit": 5}}]
+        resolver._effective_item_map.cache_clear()
+
+        with (
+            patch("app.services.source_library.resolver.list_effective_items", return_value=fake_items) as list_items,
+            patch.object(resolver, "_LIBRARY_ROWS_TTL_S", 1e9),
+        ):
+            first = resolver.get_effective_item("demo.item", project_key="demo_proj")
+            first["params"]["limit"] = 99
+            second = resolver.get_effective_item("demo.item", project_key="demo_proj")
+            self.assertIsNone(resolver.get_effective_item("missing.item", project_key="demo_proj"))
+            self.assertEqual(list_items.call_count, 1)
+
+            resolver.bump_source_library_revision()
+            resolver.get_effective_item("demo.item", project_key="demo_proj")
+            self.assertEqual(list_items.call_count, 2)
+
+        self.assertEqual(second["params"], {"limit": 5})
+
+    def test_effective_item_lookup_expires_with_the_row_cache_bucket(self):
+        fake_items = [{"item_key": "demo.item", "channel_key": "url_pool"}]
+        resolver._effective_item_map.cache_clear()
+
+        with (
+            patch("app.services.source_library.resolver.list_effective_items", return_value=fake_items) as list_items,
+            patch.object(resolver.time, "monotonic", side_effect=[100.0, 104.0, 106.0]),
+        ):
+            for _ in range(3):
+                resolver.get_effective_item("demo.item", project_key="demo_proj")
+
+        self.assertEqual(list_items.call_count, 2)
+
+    def test_library_rows_are_reused_until_revision_bump(self):
+        shared = [{"channel_key": "url_pool", "provider": "url_pool", "default_params": {"limit": 5}}]
+        resolver._cached_library_rows.cache_clear()
+
+        with (
+            patch.object(resolver, "_load_shared_channels", return_value=shared) as load_shared,
+            patch.object(resolver, "_load_project_channels", return_value=[]) as load_project,
+            patch.object(resolver, "_LIBRARY_ROWS_TTL_S", 1e9),
+        ):
+            first = resolver.list_effective_channels(project_key="demo_proj")
+            first[0]["default_params"]["limit"] = 99
+            second = resolver.list_effective_channels(project_key="demo_proj")
+            resolver.list_effective_channels(project_key="other_proj")
+            self.assertEqual(load_shared.call_count, 1)
+            self.assertEqual(load_project.call_count, 2)
+
+            resolver.bump_source_library_revision()
+            resolver.list_effective_channels(project_key="demo_proj")
+            self.assertEqual(load_shared.call_count, 2)
+
+        self.assertEqual(second[0]["default_params"], {"limit": 5})
+        self.assertEqual(shared[0]["default_params"], {"limit": 5})
+
+    def test_items_grouped_by_channel_uses_passed_rows(self):
+        channels = [
+            {"channel_key": "generic_web.rss", "provider": "Generic_Web", "kind": "rss"},
+            {"channel_key": "legacy", "provider": "", "kind": "api"},
+        ]
+        items = [
+            {"item_key": "a", "channel_key": "generic_web.rss"},
+            {"item_key": "b", "channel_key": " legacy "},
+            {"item_key": "c", "channel_key": None},
+            {"item_key": "d", "channel_key": "generic_web.rss"},
+        ]
+
+        with (
+            patch.object(resolver, "list_effective_items") as list_items,
+            patch.object(resolver, "list_effective_channels") as list_channels,
+        ):
+            grouped = resolver.list_items_grouped_by_channel(project_key="demo_proj", items=items, channels=channels)
+
+        list_items.assert_not_called()
+        list_channels.assert_not_called()
+        self.assertEqual(
+            {k: [it["item_key"] for it in v] for k, v in grouped.items()},
+            {"generic_web/rss": ["a", "d"], "legacy": ["b"], "unknown": ["c"]},
+        )
+
+    def test_deep_merge_copies_shared_branches_and_keeps_inputs(self):
+        base = {"a": 1, "nested": {"x": 1, "deep": {"k": "v"}}, "keep": {"y": 2}}
+        override = {"nested": {"deep": {"k2": "v2"}, "z": 3}, "a": {"now": "dict"}, "new": {"n": 1}}
+
+        merged = resolver._deep_merge(base, override)
+
+        self.assertEqual(
+            merged,
+            {
+                "a": {"now": "dict"},
+                "nested": {"x": 1, "deep": {"k": "v", "k2": "v2"}, "z": 3},
+                "keep": {"y": 2},
+                "new": {"n": 1},
+            },
+        )
+        self.assertEqual(base["nested"], {"x": 1, "deep": {"k": "v"}})
+        self.assertIsNot(merged["nested"], base["nested"])
+        self.assertEqual(resolver._deep_merge({}, {"a": 1}), {"a": 1})
+        self.assertEqual(resolver._deep_merge({"a": 1}, {}), {"a": 1})
+
+    def test_url_routing_merges_channel_defaults_once_per_channel(self):
+        item = {"item_key": "demo.item", "channel_key": "crawler.demo_proj"}
+        params = {"urls": ["https://example.com/a", "https://example.com/b"], "arguments": {"depth": 1}}
+        channel_map = {
+            "crawler.demo_proj": {
+                "channel_key": "crawler.demo_proj",
+                "enabled": True,
+                "provider_type": "scrapy",
+                "default_params": {"arguments": {"spider": "demo"}, "urls": ["https://stale.example"]},
+            },
+        }
+        captured: list[dict] = []
+
+        def _fake_run_channel(*, channel, params, project_key, item_key):  # noqa: ANN001
+            captured.append(params)
+            return {"inserted": 1, "skipped": 0}
+
+        with (
+            patch("app.services.source_library.resolver.run_channel", side_effect=_fake_run_channel),
+            patch("app.services.source_library.resolver.bind_project"),
+            patch.object(resolver, "_deep_merge", wraps=resolver._deep_merge) as deep_merge,
+        ):
+            resolver.run_item_with_url_routing(item=item, params=params, project_key="demo_proj", channel_map=channel_map)
+
+        self.assertEqual(deep_merge.call_count, 1)
+        self.assertEqual([p["urls"] for p in captured], [["https://example.com/a"], ["https://example.com/b"]])
+        self.assertEqual(
+            [p["arguments"] for p in captured],
+            [
+                {"spider": "demo", "depth": 1, "url": "https://example.com/a", "urls": ["https://example.com/a"]},
+                {"spider": "demo", "depth": 1, "url": "https://example.com/b", "urls": ["https://example.com/b"]},
+            ],
+        )
+        self.assertEqual(params["arguments"], {"depth": 1})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import gzip
+import io
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.resource_pool import unified_search
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+_RSS = (
+    '<?xml version="1.0" encoding="ISO-8859-1"?>'
+    "<rss><channel>"
+    "<item><link>https://a.example/x</link><guid isPermaLink=\"true\">https://a.example/y</guid></item>"
+    "<item><link>https://a.example/x#dup</link><guid>https://a.example/not-permalink</guid></item>"
+    "</channel></rss>"
+)
+_ATOM = (
+    '<feed xmlns="http://www.w3.org/2005/Atom"><entry>'
+    '<link rel="alternate" href="https://b.example/1"/><link rel="self" href="https://b.example/self"/>'
+    "</entry></feed>"
+)
+_URLSET = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+    "<url><loc>https://c.example/a</loc></url><url><loc>https://c.example/b</loc></url>"
+    "<url><loc>https://c.example/a</loc></url>"
+    "</urlset>"
+)
+_INDEX = (
+    '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+    "<sitemap><loc>https://c.example/s1.xml</loc></sitemap>"
+    "</sitemapindex>"
+)
+
+
+class UnifiedSearchExtractorsUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"unified_search tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def _both_parsers(self):
+        yield "default", unified_search._extract_urls_from_rss_xml, unified_search._parse_sitemap_xml
+        yield "etree", unified_search._extract_urls_from_rss_xml_etree, unified_search._parse_sitemap_xml_etree
+
+    def test_rss_and_atom_links(self):
+        for name, extract_rss, _ in self._both_parsers():
+            with self.subTest(parser=name):
+                self.assertEqual(extract_rss(_RSS), ["https://a.example/x", "https://a.example/y"])
+                self.assertEqual(extract_rss(_ATOM), ["https://b.example/1"])
+                self.assertEqual(extract_rss("not xml"), [])
+
+    def test_sitemap_kind_and_locs(self):
+        for name, _, parse_sitemap in self._both_parsers():
+            with self.subTest(parser=name):
+                self.assertEqual(parse_sitemap(_URLSET), ("urlset", ["https://c.example/a", "https://c.example/b"]))
+                self.assertEqual(parse_sitemap(_INDEX), ("sitemapindex", ["https://c.example/s1.xml"]))
+                self.assertEqual(parse_sitemap(_URLSET.encode("utf-8"))[1], ["https://c.example/a", "https://c.example/b"])
+                self.assertEqual(parse_sitemap(""), ("unknown", []))
+
+    def test_sitemap_parser_does_not_resolve_external_entities(self):
+        xml = (
+            '<?xml version="1.0"?><!DOCTYPE r [<!ENTITY x SYSTEM "file:///etc/passwd">]>'
+            "<urlset><url><loc>https://d.example/&x;</loc></url></urlset>"
+        )
+        _, locs = unified_search._parse_sitemap_xml(xml)
+        self.assertFalse(any("root:" in u for u in locs))
+
+    def test_html_links_resolve_like_urljoin(self):
+        hrefs = ["https://x.example/a", "/p/q?x=1", "//cdn.example/z", "rel/path", "/a/../b", "?page=2", "mailto:a@b.c"]
+        html = "".join(f'<a href="{h}">x</a>' for h in hrefs)
+
+        urls = unified_search._extract_urls_from_html(html, base_url="https://site.example/dir/page?q=1")
+
+        self.assertEqual(
+            urls,
+            [
+                "https://x.example/a",
+                "https://site.example/p/q",
+                "https://cdn.example/z",
+                "https://site.example/dir/rel/path",
+                "https://site.example/b",
+                "https://site.example/dir/page",
+            ],
+        )
+
+    def test_filter_urls_by_terms_is_case_insensitive_substring_match(self):
+        urls = ["https://a.example/AI-Policy", "https://a.example/sports", "https://a.example/c++/news"]
+
+        self.assertEqual(unified_search._filter_urls_by_terms(urls, ["policy", "C++"]), [urls[0], urls[2]])
+        self.assertEqual(unified_search._filter_urls_by_terms(urls, []), urls)
+        self.assertEqual(unified_search._filter_urls_by_terms(urls, [""]), [])
+
+    def test_collect_sitemap_urls_expands_index_levels_in_order(self):
+        def _sitemap(*locs: str, index: bool = False) -> str:
+            tag, child = ("sitemapindex", "sitemap") if index else ("urlset", "url")
+            body = "".join(f"<{child}><loc>{u}</loc></{child}>" for u in locs)
+            return f'<{tag} xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{body}</{tag}>'
+
+        docs = {
+            "https://c.example/index.xml": _sitemap("https://c.example/s1.xml", "https://c.example/s2.xml", index=True),
+            "https://c.example/s1.xml": _sitemap("https://c.example/a", "https://c.example/b"),
+            "https://c.example/s2.xml": _sitemap("https://c.example/b", "https://c.example/c"),
+        }
+        fetched: list[str] = []
+
+        def _fake_fetch(url, *, timeout, retries, session=None):  # noqa: ANN001
+            fetched.append(url)
+            return docs[url], None
+
+        with patch.object(unified_search, "fetch_html", side_effect=_fake_fetch):
+            urls = unified_search._collect_sitemap_urls(sitemap_url="https://c.example/index.xml", timeout=1.0)
+            limited = unified_search._collect_sitemap_urls(
+                sitemap_url="https://c.example/index.xml", timeout=1.0, max_sitemaps=2
+            )
+
+        self.assertEqual(urls, ["https://c.example/a", "https://c.example/b", "https://c.example/c"])
+        self.assertEqual(limited, ["https://c.example/a", "https://c.example/b"])
+        self.assertEqual(len(fetched), 5)
+
+    def test_gz_sitemap_is_parsed_from_decompressed_stream(self):
+        raw = gzip.compress(_URLSET.encode("utf-8"))
+        for name, body in (("gzip", raw), ("already-decoded", _URLSET.encode("utf-8"))):
+            with self.subTest(body=name):
+                resp = MagicMock(status_code=200, raw=io.BytesIO(body))
+                resp.__enter__.return_value = resp
+                with patch.object(unified_search.requests, "get", return_value=resp) as get:
+                    kind, locs = unified_search._fetch_sitemap("https://c.example/sitemap.xml.gz", timeout=1.0)
+
+                self.assertTrue(get.call_args.kwargs["stream"])
+                self.assertEqual((kind, locs), ("urlset", ["https://c.example/a", "https://c.example/b"]))
+
+    def test_stdlib_fallback_when_lxml_missing(self):
+        with patch.object(unified_search, "LET", None):
+            self.assertEqual(unified_search._parse_sitemap_xml(_INDEX), ("sitemapindex", ["https://c.example/s1.xml"]))
+            self.assertEqual(unified_search._extract_urls_from_rss_xml(_ATOM), ["https://b.example/1"])
+
+    def test_item_site_entries_accept_strings_dicts_and_dedup(self):
+        item = {
+            "params": {
+                "site_entries": [
+                    " https://a.example/feed ",
+                    {"site_url": "https://A.example/feed/"},
+                    {"url": "https://b.example/sitemap.xml"},
+                    {"site_url": None},
+                    None,
+                ]
+            }
+        }
+        self.assertEqual(
+            unified_search._resolve_item_site_entries(item),
+            ["https://a.example/feed", "https://b.example/sitemap.xml"],
+        )
+        self.assertEqual(
+            unified_search._resolve_item_site_entries({"params": {"site_entry_urls": "https://c.example"}}),
+            ["https://c.example"],
+        )
+        self.assertEqual(unified_search._resolve_item_site_entries({"params": {"site_entries": 3}}), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,546 @@
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytestmark = pytest.mark.unit
+
+try:
+    from app.services.llm import cache as llm_cache
+    from app.services.search import web
+
+    _IMPORT_ERROR = None
+except Exception as exc:  # noqa: BLE001
+    _IMPORT_ERROR = exc
+
+
+class WebSearchUnitTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if _IMPORT_ERROR is not None:
+            raise unittest.SkipTest(f"web search unit tests require backend dependencies: {_IMPORT_ERROR}")
+
+    def setUp(self):
+        web._llm_keyword_cache.clear()
+        web._topic_semantic_cache.clear()
+        web._google_key_cooldown.clear()
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        for patcher in (
+            patch.object(llm_cache, "_PROMPT_CACHE_FILE", Path(self._tmpdir.name) / "prompt-cache.db"),
+            patch.object(llm_cache, "_prompt_cache_conn", None),
+            patch.object(web, "_topic_embedding_disabled_until", 0.0),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_keyword_llm_output_is_reused_for_identical_prompts(self):
+        model = MagicMock()
+        model.invoke.return_value = MagicMock(content="lottery sales\nlottery market")
+
+        with (
+            patch.object(web.settings, "llm_provider", "ollama"),
+            patch.object(web, "get_llm_config", return_value=None),
+            patch.object(web, "get_chat_model", return_value=model) as get_model,
+        ):
+            first = web.generate_keywords("lottery", "en")
+            second = web.generate_keywords("lottery", "en")
+            other = web.generate_keywords("lottery", "zh")
+
+        self.assertEqual(first, ["lottery sales", "lottery market"])
+        self.assertEqual(second, first)
+        self.assertEqual(other, first)
+        self.assertEqual(model.invoke.call_count, 2)
+        self.assertEqual(get_model.call_count, 2)
+
+    def test_bilingual_keywords_use_one_llm_call(self):
+        cases = {
+            "json": ('```json\n{"zh": ["彩票 销量"], "en": ["lottery sales", "彩票 销量"]}\n```', ["彩票 销量", "lottery sales"]),
+            "lines": ("- 彩票 销量\n- lottery sales\n", ["彩票 销量", "lottery sales"]),
+            "json_string_values": ('{"zh": "彩票 市场", "en": ["lottery"]}', ['{"zh": "彩票 市场", "en": ["lottery"]}']),
+            "error": (RuntimeError("llm down"), None),
+        }
+        for name, (response, expected) in cases.items():
+            with self.subTest(response=name):
+                web._llm_keyword_cache.clear()
+                model = MagicMock()
+                if isinstance(response, Exception):
+                    model.invoke.side_effect = response
+                else:
+                    model.invoke.return_value = MagicMock(content=response)
+                with (
+                    patch.object(web.settings, "llm_provider", "ollama"),
+                    patch.object(web, "get_chat_model", return_value=model),
+                    patch.object(web, "get_cached_prompt_output", return_value=None),
+                ):
+                    keywords = web.generate_keywords("彩票", "bilingual")
+
+                model.invoke.assert_called_once()
+                if expected is None:
+                    self.assertIn("彩票 政策", keywords)
+                    self.assertIn("彩票 regulation", keywords)
+                else:
+                    self.assertEqual(keywords, expected)
+
+    def test_keyword_llm_output_survives_process_cache_loss(self):
+        model = MagicMock()
+        model.invoke.return_value = MagicMock(content="lottery sales")
+
+        with (
+            patch.object(web.settings, "llm_provider", "ollama"),
+            patch.object(web, "get_llm_config", return_value=None),
+            patch.object(web, "get_chat_model", return_value=model),
+        ):
+            first = web.generate_keywords("lottery", "en")
+            web._llm_keyword_cache.clear()
+            second = web.generate_keywords("lottery", "en")
+            with patch.object(web, "_LLM_KEYWORD_DISK_TTL_S", 0.0):
+                web._llm_keyword_cache.clear()
+                web.generate_keywords("lottery", "en")
+
+        self.assertEqual(first, second)
+        self.assertEqual(model.invoke.call_count, 2)
+
+    def test_topic_keywords_reuse_result_for_near_duplicate_topic(self):
+        vectors = {
+            "EV battery supply": [1.0, 0.0, 0.0],
+            "EV batteries supply chain": [0.98, 0.1, 0.0],
+            "lottery jackpot": [0.0, 0.0, 1.0],
+        }
+        embeddings = MagicMock()
+        embeddings.embed_query.side_effect = lambda text: vectors[text.split(" | ")[0]]
+        model = MagicMock()
+        model.invoke.return_value = MagicMock(content='{"search_keywords": ["ev battery maker"], "topic_hints": ["battery"]}')
+
+        with (
+            patch.object(web.settings, "llm_provider", "ollama"),
+            patch.object(web, "get_embeddings", return_value=embeddings),
+            patch.object(web, "get_chat_model", return_value=model),
+        ):
+            first = web.generate_topic_keywords("EV battery supply", topic_focus="company", language="en")
+            near = web.generate_topic_keywords("EV batteries supply chain", topic_focus="company", language="en")
+            other_focus = web.generate_topic_keywords("EV battery supply", topic_focus="product", language="en")
+            unrelated = web.generate_topic_keywords("lottery jackpot", topic_focus="company", language="en")
+
+        self.assertEqual(first["search_keywords"], ["ev battery maker"])
+        self.assertEqual(near, first)
+        self.assertEqual(other_focus, first)
+        self.assertEqual(unrelated, first)
+        self.assertEqual(model.invoke.call_count, 3)
+
+    def test_topic_keywords_exact_prompt_hit_skips_embedding(self):
+        embeddings = MagicMock()
+        embeddings.embed_query.return_value = [1.0, 0.0, 0.0]
+        model = MagicMock()
+        model.invoke.return_value = MagicMock(content='{"search_keywords": ["ev battery maker"], "topic_hints": []}')
+
+        with (
+            patch.object(web.settings, "llm_provider", "ollama"),
+            patch.object(web, "get_embeddings", return_value=embeddings),
+            patch.object(web, "get_chat_model", return_value=model),
+        ):
+            first = web.generate_topic_keywords("EV battery supply", topic_focus="company", language="en")
+            web._llm_keyword_cache.clear()
+            second = web.generate_topic_keywords("EV battery supply", topic_focus="company", language="en")
+
+        self.assertEqual(second, first)
+        embeddings.embed_query.assert_called_once()
+        model.invoke.assert_called_once()
+
+    def test_topic_keywords_semantic_cache_keeps_years_and_regions_apart(self):
+        embeddings = MagicMock()
+        embeddings.embed_query.return_value = [1.0, 0.0, 0.0]
+        model = MagicMock()
+        model.invoke.return_value = MagicMock(content='{"search_keywords": ["lottery sales"], "topic_hints": []}')
+
+        with (
+            patch.object(web.settings, "llm_provider", "ollama"),
+            patch.object(web, "get_embeddings", return_value=embeddings),
+            patch.object(web, "get_chat_model", return_value=model),
+        ):
+            for topic in ("lottery sales 2024", "lottery sales 2025", "US lottery sales 2025", "EU lottery sales 2025"):
+                web.generate_topic_keywords(topic, topic_focus="company", language="en")
+
+        self.assertEqual(model.invoke.call_count, 4)
+
+    def test_topic_keywords_pause_embedding_after_failure(self):
+        embeddings = MagicMock()
+        embeddings.embed_query.side_effect = RuntimeError("no embedding provider")
+        model = MagicMock()
+        model.invoke.return_value = MagicMock(content='{"search_keywords": ["kw"], "topic_hints": []}')
+
+        with (
+            patch.object(web.settings, "llm_provider", "ollama"),
+            patch.object(web, "get_embeddings", return_value=embeddings),
+            patch.object(web, "get_chat_model", return_value=model),
+        ):
+            first = web.generate_topic_keywords("alpha", topic_focus="company", language="en")
+            second = web.generate_topic_keywords("beta", topic_focus="company", language="en")
+
+        self.assertEqual(first["search_keywords"], ["kw"])
+        self.assertEqual(second["search_keywords"], ["kw"])
+        embeddings.embed_query.assert_called_once()
+
+    def test_static_fallback_keywords(self):
+        with patch.object(web.settings, "llm_provider", "openai"), patch.object(web.settings, "openai_api_key", None):
+            self.assertEqual(
+                web.generate_keywords("lottery", "en"),
+                ["lottery", "lottery regulation", "lottery market", "lottery sales report", "lottery supply chain"],
+            )
+            self.assertEqual(web.generate_keywords("彩票", "zh")[1:3], ["彩票 政策", "彩票 市场"])
+            topic = web.generate_topic_keywords("lottery", topic_focus="company", language="en", base_keywords=["a", "a", "b"])
+
+        self.assertEqual(topic["search_keywords"][:5], ["a company", "a brand", "a partnership", "a supply chain", "b company"])
+        self.assertEqual(topic["topic_hints"], ["company", "brand", "partnership", "supply chain", "channel"])
+        self.assertEqual(web._dedup_keywords([" a", "a", None, "", "b "]), ["a", "b"])
+        self.assertEqual(
+            web._KEYWORD_LINE_RE.findall("- a b \n\n  • c\n* d-e \r\n   \n-\nfoo"),
+            ["a b", "c", "d-e", "foo"],
+        )
+
+    def test_specific_topic_is_used_as_the_only_keyword(self):
+        with patch.object(web, "get_chat_model") as get_model:
+            self.assertEqual(
+                web.generate_keywords("  Nvidia H100 supply chain 2024 ", "bilingual"),
+                ["Nvidia H100 supply chain 2024"],
+            )
+            self.assertEqual(web.generate_keywords("site:gov.cn 彩票 销售 数据", "zh"), ["site:gov.cn 彩票 销售 数据"])
+        get_model.assert_not_called()
+        self.assertFalse(web._looks_specific("lottery sales 2024"))
+        self.assertFalse(web._looks_specific("lottery sales volume 120245"))
+
+    def test_days_back_time_words_do_not_make_topic_specific(self):
+        self.assertTrue(web._looks_specific("lottery 2026 recent latest"))
+        for topic, expected_expand in (("lottery", True), ("Nvidia H100 supply chain 2024", False)):
+            with self.subTest(topic=topic):
+                with (
+                    patch.dict(os.environ, {"SERPER_API_KEY": "test-key"}),
+                    patch.object(web, "_expand_keywords", return_value=["a", "b"]) as expand,
+                    patch.object(web, "_serper_search", return_value=[]) as serper,
+                ):
+                    web.search_sources(topic, language="en", provider="serper", days_back=7)
+
+                self.assertEqual(expand.called, expected_expand)
+                keywords = [c.args[0] for c in serper.call_args_list]
+                if expected_expand:
+                    self.assertIn("recent latest", expand.call_args.args[0])
+                    self.assertEqual(sorted(keywords), ["a", "b"])
+                else:
+                    self.assertEqual(len(keywords), 1)
+                    self.assertTrue(keywords[0].startswith(topic) and keywords[0].endswith("recent latest"))
+
+    def test_language_is_normalized_once(self):
+        self.assertEqual(web._normalize_lang(" Bilingual "), ("en", True))
+        self.assertEqual(web._normalize_lang("zh-CN"), ("zh", False))
+        self.assertEqual(web._normalize_lang(None), ("en", False))
+        self.assertIsInstance(web._BILINGUAL_LANG_MODES, frozenset)
+
+    def test_google_oauth_token_is_reused_until_near_expiry(self):
+        from google.oauth2 import service_account
+
+        credentials = MagicMock(token=None, expiry=None)
+
+        def _refresh(_request):  # noqa: ANN001
+            credentials.token = f"token-{credentials.refresh.call_count}"
+            credentials.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+
+        credentials.refresh.side_effect = _refresh
+
+        with tempfile.NamedTemporaryFile(suffix=".json") as fh:
+            with (
+                patch.dict(os.environ, {"GOOGLE_APPLICATION_CREDENTIALS": fh.name}),
+                patch.object(web, "_google_credentials", None),
+                patch.object(service_account.Credentials, "from_service_account_file", return_value=credentials) as load,
+            ):
+                first = web._get_google_oauth_token()
+                second = web._get_google_oauth_token()
+                credentials.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=60)
+                third = web._get_google_oauth_token()
+
+        self.assertEqual((first, second, third), ("token-1", "token-1", "token-2"))
+        load.assert_called_once()
+
+    def test_cached_year_expires_at_new_year(self):
+        clock = {"now": datetime(2025, 12, 31, 23, 59, 30), "mono": 1000.0}
+
+        class _FakeDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):  # noqa: ANN001
+                return clock["now"]
+
+        with (
+            patch.object(web, "_current_year_cache", None),
+            patch.object(web, "datetime", _FakeDatetime),
+            patch.object(web.time, "monotonic", side_effect=lambda: clock["mono"]),
+        ):
+            first = web._current_year()
+            clock["mono"] += 20
+            clock["now"] += timedelta(seconds=20)
+            cached = web._current_year()
+            clock["mono"] += 20
+            clock["now"] += timedelta(seconds=20)
+            rolled = web._current_year()
+
+        self.assertEqual((first, cached, rolled), (2025, 2025, 2026))
+
+    def test_google_later_pages_fetched_concurrently_after_full_first_page(self):
+        def _page(url, params, headers):  # noqa: ANN001
+            start = params["start"]
+            if start == 31:
+                raise RuntimeError("boom")
+            size = 4 if start == 21 else params["num"]
+            return {"items": [{"link": f"https://g.example/{start + i}"} for i in range(size)]}
+
+        with patch.object(web.default_http_client, "get_json", side_effect=_page) as get_json:
+            items = web._google_search("lottery", "cx", 45, api_key="k")
+            get_json.reset_mock()
+            full = web._google_search("lottery", "cx", 15, api_key="k")
+            self.assertEqual(
+                sorted((c.kwargs["params"]["start"], c.kwargs["params"]["num"]) for c in get_json.call_args_list),
+                [(1, 10), (11, 5)],
+            )
+
+            # A short first page ends the query without spending quota on later pages.
+            get_json.reset_mock()
+            get_json.side_effect = lambda url, params, headers: {"items": [{"link": "https://g.example/only"}]}
+            self.assertEqual(len(web._google_search("lottery", "cx", 50, api_key="k")), 1)
+            get_json.assert_called_once()
+
+            get_json.side_effect = RuntimeError("quota")
+            self.assertEqual(web._google_search("lottery", "cx", 20, api_key="k"), [])
+
+        self.assertEqual([it["link"] for it in items], [f"https://g.example/{i}" for i in range(1, 25)])
+        self.assertEqual(len(full), 15)
+
+    def test_google_rotates_to_backup_key_on_quota_errors(self):
+        calls: list[str] = []
+
+        def _page(url, params, headers):  # noqa: ANN001
+            calls.append(params["key"])
+            if params["key"] == "k1":
+                raise RuntimeError("429 Too Many Requests")
+            return {"items": [{"link": "https://g.example/1"}]}
+
+        with (
+            patch.object(web, "_google_key_cooldown", {}),
+            patch.object(web.default_http_client, "get_json", side_effect=_page),
+        ):
+            first = web._google_search("lottery", "cx", 5, api_key="k1, k2")
+            second = web._google_search("lottery", "cx", 5, api_key="k1,k2")
+            self.assertIn("k1", web._google_key_cooldown)
+
+        self.assertEqual(len(first), 1)
+        self.assertEqual(len(second), 1)
+        # 冷却中的 k1 在第二次搜索时不再先被尝试
+        self.assertEqual(calls, ["k1", "k2", "k2"])
+
+    def test_ddg_timelimit_covers_requested_days(self):
+        self.assertIsNone(web._ddg_timelimit(None))
+        self.assertEqual(
+            [web._ddg_timelimit(d) for d in (1, 3, 7, 8, 31, 90)],
+            ["d", "w", "w", "m", "m", "y"],
+        )
+
+    def test_filter_context_sends_date_restriction_instead_of_time_keywords(self):
+        for use_filter, expected_topic, expected_days in (
+            (True, "lottery", 5),
+            (False, None, None),
+        ):
+            with self.subTest(use_filter_context=use_filter):
+                with (
+                    patch.dict(os.environ, {"SERPER_API_KEY": "test-key"}),
+                    patch.object(web, "_expand_keywords", side_effect=lambda topic, lang: [topic]) as gen,
+                    patch.object(web, "_serper_search", return_value=[]) as serper,
+                ):
+                    web.search_sources(
+                        "lottery",
+                        provider="serper",
+                        days_back=5,
+                        use_filter_context=use_filter,
+                    )
+
+                topic = gen.call_args.args[0]
+                if expected_topic is not None:
+                    self.assertEqual(topic, expected_topic)
+                else:
+                    self.assertIn("recent latest", topic)
+                self.assertEqual(serper.call_args.kwargs["days_back"], expected_days)
+
+    def test_keyword_searches_merge_in_keyword_order(self):
+        release = threading.Event()
+
+        def _fake_serper(keyword, api_key, limit, *, language="en", days_back=None):  # noqa: ANN001
+            if keyword == "first":
+                # The first keyword finishes last; merge order must still follow keyword order.
+                release.wait(timeout=2)
+            else:
+                release.set()
+            if keyword == "broken":
+                raise RuntimeError("provider error")
+            return [{"title": keyword, "link": f"https://x.example/{keyword}"}, {"title": "dup", "link": "https://x.example/shared"}]
+
+        with (
+            patch.dict(os.environ, {"SERPER_API_KEY": "test-key"}),
+            patch.object(web, "_expand_keywords", return_value=["first", "second", "broken"]),
+            patch.object(web, "_serper_search", side_effect=_fake_serper),
+        ):
+            results = web.search_sources("lottery", provider="serper", max_results=9)
+
+        self.assertEqual(
+            [(r["keyword"], r["link"]) for r in results],
+            [
+                ("first", "https://x.example/first"),
+                ("first", "https://x.example/shared"),
+                ("second", "https://x.example/second"),
+            ],
+        )
+
+    def test_result_dedup_ignores_scheme_host_case_www_slash_and_query_order(self):
+        results: list[dict] = []
+        seen: set[str] = set()
+        links = [
+            "https://X.example/a/?utm_source=feed",
+            "http://x.example/a",
+            "https://x.example/a?page=2",
+            "https://x.example/b#frag",
+            "https://x.example/b/",
+            "https://x.example/c?id=1&utm_campaign_x=y&mc_cid=1&MC_EID=2",
+            "https://x.example/c?id=1&fbclid=abc",
+            "https://www.X.example/d?b=2&a=1",
+            "http://x.example/d/?a=1&b=2",
+        ]
+
+        added = [web._add_result_dedup(results, seen, {"link": link}) for link in links]
+
+        self.assertEqual(added, [True, False, True, True, False, True, False, True, False])
+        self.assertEqual(results[0]["link"], "https://x.example/a/")
+        self.assertEqual(results[-2]["link"], "https://x.example/c?id=1")
+        self.assertEqual(results[-1]["link"], "https://www.x.example/d?b=2&a=1")
+
+    def test_filter_existing_dedups_and_chunks_uri_lookup(self):
+        results = [{"link": f"https://x.example/{i}"} for i in range(5)]
+        results.append({"link": "https://x.example/0"})
+        session = MagicMock()
+        session.__enter__.return_value = session
+        session.scalars.side_effect = [["https://x.example/1"], ["https://x.example/3"], []]
+
+        with (
+            patch.object(web, "_FILTER_EXISTING_CHUNK_SIZE", 2),
+            patch.object(web, "SessionLocal", return_value=session),
+        ):
+            kept = web.filter_existing(results)
+
+        self.assertEqual(session.scalars.call_count, 3)
+        self.assertEqual(
+            [r["link"] for r in kept],
+            ["https://x.example/0", "https://x.example/2", "https://x.example/4", "https://x.example/0"],
+        )
+
+    def test_auto_mode_drops_existing_and_scores_in_one_pass(self):
+        items = [
+            {"title": "lottery sales report", "link": "https://reuters.com/a"},
+            {"title": "old", "link": "https://x.example/stored"},
+            {"title": "other", "link": "https://x.example/b"},
+        ]
+        session = MagicMock()
+        session.__enter__.return_value = session
+        session.scalars.return_value = ["https://x.example/stored"]
+
+        with (
+            patch.dict(os.environ, {"SERPER_API_KEY": "test-key"}),
+            patch.object(web, "_expand_keywords", return_value=["lottery"]),
+            patch.object(web, "_serper_search", return_value=items),
+            patch.object(web, "_get_google_oauth_token", return_value=None),
+            patch.object(web, "SessionLocal", return_value=session),
+        ):
+            results = web.search_sources("lottery", max_results=5)
+
+        self.assertEqual({r["link"] for r in results}, {"https://reuters.com/a", "https://x.example/b"})
+        self.assertEqual(results[0]["link"], "https://reuters.com/a")
+        self.assertGreater(results[0]["relevance_score"], results[1]["relevance_score"])
+        session.scalars.assert_called_once()
+
+    def test_serper_requests_stay_within_max_results(self):
+        for provider in ("serper", "auto"):
+            with self.subTest(provider=provider):
+                with (
+                    patch.dict(os.environ, {"SERPER_API_KEY": "test-key"}),
+                    patch.object(web, "_expand_keywords", return_value=["a", "b", "c", "d", "e"]),
+                    patch.object(web, "_serper_search", side_effect=lambda kw, key, limit, **_: [{"link": f"https://{kw}.example/"}]) as serper,
+                    patch.object(web, "_get_google_oauth_token", return_value=None),
+                    patch.object(web, "_existing_uris", return_value=set()),
+                ):
+                    web.search_sources("lottery", provider=provider, max_results=3)
+
+                self.assertEqual(sorted((c.args[0], c.args[2]) for c in serper.call_args_list), [("a", 1), ("b", 1), ("c", 1)])
+
+    def test_keyword_search_quota_caps_the_last_request(self):
+        limits = {}
+
+        def _fetch(kw, limit):  # noqa: ANN001
+            limits[kw] = limit
+            return []
+
+        web._search_keywords_concurrently(["a", "b", "c"], _fetch, [], set(), per_kw=4, label="serper", max_results=6)
+
+        self.assertEqual(limits, {"a": 4, "b": 2})
+
+    def test_keyword_searches_log_one_summary_line(self):
+        results, seen = [], set()
+        with self.assertLogs(web.logger, level="INFO") as logs:
+            web._search_keywords_concurrently(
+                ["a", "b", "c"],
+                lambda kw, limit: [{"link": f"https://{kw}.example/"}],
+                results,
+                seen,
+                per_kw=1,
+                label="serper",
+            )
+
+        self.assertEqual(logs.output, ["INFO:app.services.search.web:search_sources: serper got 3 across 3 keywords (total=3)"])
+
+    def test_ddg_site_fallback_sends_one_or_query_per_keyword(self):
+        ddgs = MagicMock()
+        ddgs.__enter__.return_value = ddgs
+        ddgs.text.return_value = []
+
+        with (
+            patch.dict(os.environ, {}, clear=False),
+            patch.object(web, "_expand_keywords", return_value=["lottery", "jackpot"]),
+            patch.object(web, "_get_google_oauth_token", return_value=None),
+            patch.object(web, "DDGS", return_value=ddgs),
+            patch.multiple(
+                web.settings,
+                serper_api_key=None,
+                google_search_cse_id=None,
+                serpstack_key=None,
+                serpapi_key=None,
+            ),
+        ):
+            for name in ("SERPER_API_KEY", "SERPSTACK_KEY", "SERPAPI_KEY", "SERPAPI_API_KEY", "GOOGLE_SEARCH_CSE_ID"):
+                os.environ.pop(name, None)
+            web.search_sources("lottery", exclude_existing=False)
+
+        queries = [c.args[0] for c in ddgs.text.call_args_list]
+        self.assertEqual(
+            queries,
+            [
+                "(site:reuters.com OR site:bloomberg.com OR site:wsj.com) lottery",
+                "(site:reuters.com OR site:bloomberg.com OR site:wsj.com) jackpot",
+            ],
+        )
+        self.assertEqual(ddgs.text.call_args.kwargs["max_results"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()